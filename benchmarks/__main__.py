@@ -0,0 +1,21 @@
+import sys
+from argparse import ArgumentParser
+
+from benchmarks.cases import make_benchmarks
+from benchmarks.runner import load_baselines, measure, save_baselines, write_report
+
+parser = ArgumentParser(prog='python -m benchmarks', description='Measure the performance of sigmatch and compare it with the stored baselines.')
+parser.add_argument('-k', '--filter', default='', help='run only benchmarks whose group or name contains this substring')
+parser.add_argument('--save', action='store_true', help='store the results as the new baselines')
+parser.add_argument('--threshold', type=float, default=1.5, help='the ratio to the baseline that is reported as a regression')
+arguments = parser.parse_args()
+
+benchmarks = [benchmark for benchmark in make_benchmarks() if arguments.filter in f'{benchmark.group}: {benchmark.name}']
+results = [measure(benchmark) for benchmark in benchmarks]
+regressions = write_report(results, load_baselines(), sys.stdout, arguments.threshold)
+
+if arguments.save:
+    save_baselines(results)
+    sys.stdout.write('\nThe baselines are saved.\n')
+
+sys.exit(1 if regressions and not arguments.save else 0)
@@ -0,0 +1,180 @@
+import subprocess
+import sys
+from functools import partial
+from typing import Any, Callable, Iterable, List, NamedTuple, cast
+
+from sigmatch import (
+    CallShape,
+    PossibleCallMatcher,
+    SeriesBuilder,
+    SignatureSeriesMatcher,
+)
+from sigmatch.static import extract_signatures
+
+MAXIMUM_NUMBER_OF_PARAMETERS = 10
+SERIES_SIZES = (10, 100, 1000)
+NUMBER_OF_FUNCTIONS_IN_MODULE = 20
+MODULE_SOURCE = ''.join(f'def function_{index}(a, b=None, *args, c, **kwargs): ...\nclass Class_{index}:\n    def method(self, a, b=None): ...\n' for index in range(NUMBER_OF_FUNCTIONS_IN_MODULE))
+
+
+class Benchmark(NamedTuple):
+    group: str
+    name: str
+    size: int
+    function: Callable[[], Any]
+
+
+def make_function(number_of_parameters: int, number_of_defaults: int) -> Callable[..., Any]:
+    parameters = [f'a{index}' for index in range(number_of_parameters - number_of_defaults)]
+    parameters.extend(f'd{index}=None' for index in range(number_of_defaults))
+    return cast(Callable[..., Any], eval(f'lambda {", ".join(parameters)}: None'))
+
+
+def make_series(size: int) -> SignatureSeriesMatcher:
+    return SignatureSeriesMatcher(*(PossibleCallMatcher.from_parts(index % 5, [f'name_{index // 5}']) for index in range(size)))
+
+
+def build_series(matchers: Iterable[PossibleCallMatcher]) -> SignatureSeriesMatcher:
+    builder = SeriesBuilder()
+    for matcher in matchers:
+        builder += matcher
+    return builder.build()
+
+
+def run_in_fresh_interpreter(code: str) -> None:
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def make_import_benchmarks() -> List[Benchmark]:
+    return [
+        Benchmark('import', 'empty interpreter', 1, partial(run_in_fresh_interpreter, 'pass')),
+        Benchmark('import', 'import sigmatch', 1, partial(run_in_fresh_interpreter, 'import sigmatch')),
+        Benchmark('import', 'import PossibleCallMatcher', 1, partial(run_in_fresh_interpreter, 'from sigmatch import PossibleCallMatcher')),
+        Benchmark('import', 'import everything', 1, partial(run_in_fresh_interpreter, 'from sigmatch import CallSet, CallableRegistry, PossibleCallMatcher, SignatureSeriesMatcher, is_equivalent')),
+    ]
+
+
+def make_parsing_benchmarks() -> List[Benchmark]:
+    return [
+        Benchmark('parsing', 'parse a short expression', 1, lambda: PossibleCallMatcher._convert_symbols(('.., c',))),
+        Benchmark('parsing', 'parse a long expression', 1, lambda: PossibleCallMatcher._convert_symbols(('...., first, second, third, fourth, *, **',))),
+        Benchmark('parsing', 'construct an interned matcher', 1, lambda: PossibleCallMatcher('...., first, second, third, fourth, *, **')),
+        Benchmark('parsing', 'construct from parts', 1, lambda: PossibleCallMatcher.from_parts(4, ['first', 'second', 'third', 'fourth'], is_args=True, is_kwargs=True)),
+    ]
+
+
+def make_match_benchmarks() -> List[Benchmark]:
+    class SomeClass:
+        def __init__(self, a: Any, b: Any = None) -> None: ...
+
+        def method(self, a: Any, b: Any = None) -> None: ...
+
+    def function(a: Any, b: Any = None) -> None: ...
+
+    matcher = PossibleCallMatcher('., b')
+    series = PossibleCallMatcher('...') + PossibleCallMatcher('.., c') + PossibleCallMatcher('., b')
+    function_partial = partial(function, 1)
+
+    return [
+        Benchmark('match', 'plain function', 1, lambda: matcher.match(function)),
+        Benchmark('match', 'bound method', 1, lambda: matcher.match(SomeClass(1).method)),
+        Benchmark('match', 'class', 1, lambda: matcher.match(SomeClass)),
+        Benchmark('match', 'partial', 1, lambda: matcher.match(function_partial)),
+        Benchmark('match', 'series and plain function', 1, lambda: series.match(function)),
+        Benchmark('match', 'check plain function', 1, lambda: matcher.check(function)),
+        Benchmark('match', 'check series and plain function', 1, lambda: series.check(function)),
+        Benchmark('match', 'builtin from the table', 1, lambda: matcher.match(next)),
+        Benchmark('match', 'builtin with text signature', 1, lambda: matcher.match([].append)),
+        Benchmark('match', 'builtin without signature', 1, lambda: matcher.match(__build_class__)),
+    ]
+
+
+def make_extraction_benchmarks() -> List[Benchmark]:
+    def function(a: Any, b: Any = None, *args: Any, c: Any, **kwargs: Any) -> None: ...
+
+    class SomeClass:
+        def method(self, a: Any, b: Any = None) -> None: ...
+
+    return [
+        Benchmark('extraction', 'plain function', 1, partial(PossibleCallMatcher._extract_baskets, function)),
+        Benchmark('extraction', 'bound method', 1, partial(PossibleCallMatcher._extract_baskets, SomeClass().method)),
+        Benchmark('extraction', 'partial', 1, partial(PossibleCallMatcher._extract_baskets, partial(function, 1))),
+        Benchmark('extraction', 'functions and methods from source', NUMBER_OF_FUNCTIONS_IN_MODULE * 2, partial(extract_signatures, MODULE_SOURCE)),
+    ]
+
+
+def make_from_callable_benchmarks() -> List[Benchmark]:
+    benchmarks = []
+
+    for number_of_parameters in range(1, MAXIMUM_NUMBER_OF_PARAMETERS + 1):
+        function = make_function(number_of_parameters, 0)
+        benchmarks.append(Benchmark('from_callable', 'parameters without defaults', number_of_parameters, partial(PossibleCallMatcher.from_callable, function)))
+
+    for number_of_defaults in range(1, MAXIMUM_NUMBER_OF_PARAMETERS + 1):
+        function = make_function(MAXIMUM_NUMBER_OF_PARAMETERS, number_of_defaults)
+        benchmarks.append(Benchmark('from_callable', f'{MAXIMUM_NUMBER_OF_PARAMETERS} parameters, some with defaults', number_of_defaults, partial(PossibleCallMatcher.from_callable, function)))
+
+    return benchmarks
+
+
+def make_series_benchmarks() -> List[Benchmark]:
+    benchmarks = []
+
+    for size in SERIES_SIZES:
+        first = make_series(size)
+        second = make_series(size // 2)
+        first_copy = make_series(size)
+        with_unpacking = SignatureSeriesMatcher(*(PossibleCallMatcher.from_parts(index % 5, [f'name_{index // 5}'], is_kwargs=True) for index in range(size)))
+
+        benchmarks.extend([
+            Benchmark('series', 'construction', size, partial(SignatureSeriesMatcher, *first)),
+            Benchmark('series', '+', size, partial(first.__add__, second)),
+            Benchmark('series', '&', size, partial(first.__and__, second)),
+            Benchmark('series', '==', size, partial(first.__eq__, first_copy)),
+            Benchmark('series', 'in', size, partial(first.__contains__, second)),
+            Benchmark('series', 'union', size, partial(SignatureSeriesMatcher.union, *first)),
+            Benchmark('series', 'builder', size, partial(build_series, first.matchers)),
+            Benchmark('series', 'fits_shape, hit', size, partial(with_unpacking.fits_shape, CallShape(0, frozenset({'name_0', 'other'})))),
+            Benchmark('series', 'fits_shape, miss', size, partial(with_unpacking.fits_shape, CallShape(MAXIMUM_NUMBER_OF_PARAMETERS, frozenset()))),
+        ])
+
+    names = [benchmark.name for benchmark in benchmarks]
+    return sorted(benchmarks, key=lambda benchmark: (names.index(benchmark.name), benchmark.size))
+
+
+def make_grouping_benchmarks() -> List[Benchmark]:
+    from sigmatch import group_by_call_set  # noqa: PLC0415
+
+    benchmarks = []
+
+    for size in SERIES_SIZES:
+        functions = [make_function(index % (MAXIMUM_NUMBER_OF_PARAMETERS + 1), index % 3) for index in range(size)]
+        benchmarks.append(Benchmark('grouping', 'group_by_call_set', size, partial(group_by_call_set, functions)))
+
+    return benchmarks
+
+
+def make_storage_benchmarks() -> List[Benchmark]:
+    from sigmatch.storage import dumps, loads  # noqa: PLC0415
+
+    series = {f'module:function_{index}': PossibleCallMatcher.from_callable(make_function(6, index % 6)) for index in range(100)}
+    text = dumps(series)
+
+    return [
+        Benchmark('storage', 'dumps', len(series), partial(dumps, series)),
+        Benchmark('storage', 'loads', len(series), partial(loads, text)),
+        Benchmark('storage', 'loads and decode all series', len(series), lambda: dict(loads(text))),
+    ]
+
+
+def make_benchmarks() -> List[Benchmark]:
+    return [
+        *make_import_benchmarks(),
+        *make_parsing_benchmarks(),
+        *make_match_benchmarks(),
+        *make_extraction_benchmarks(),
+        *make_from_callable_benchmarks(),
+        *make_series_benchmarks(),
+        *make_grouping_benchmarks(),
+        *make_storage_benchmarks(),
+    ]
@@ -0,0 +1,78 @@
+import json
+from pathlib import Path
+from timeit import Timer
+from typing import Dict, Iterable, List, NamedTuple, Optional, TextIO
+
+from benchmarks.cases import Benchmark
+
+BASELINES_PATH = Path(__file__).parent / 'baselines.json'
+BASELINES_VERSION = 1
+NUMBER_OF_REPEATS = 3
+
+
+class Result(NamedTuple):
+    benchmark: Benchmark
+    seconds: float
+
+    @property
+    def key(self) -> str:
+        return f'{self.benchmark.group}: {self.benchmark.name} [{self.benchmark.size}]'
+
+
+def measure(benchmark: Benchmark, repeat: int = NUMBER_OF_REPEATS) -> Result:
+    timer = Timer(benchmark.function)
+    number, _ = timer.autorange()
+    return Result(benchmark, min(timer.repeat(repeat=repeat, number=number)) / number)
+
+
+def load_baselines(path: Path = BASELINES_PATH) -> Dict[str, float]:
+    if not path.exists():
+        return {}
+
+    data = json.loads(path.read_text())
+    if data.get('version') != BASELINES_VERSION:
+        raise ValueError(f'The baselines file has version {data.get("version")}, but version {BASELINES_VERSION} is expected.')
+
+    return {key: float(value) for key, value in data['results'].items()}
+
+
+def save_baselines(results: Iterable[Result], path: Path = BASELINES_PATH) -> None:
+    baselines = load_baselines(path)
+    baselines.update((result.key, result.seconds) for result in results)
+    data = {'version': BASELINES_VERSION, 'results': baselines}
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + '\n')
+
+
+def format_time(seconds: float) -> str:
+    for unit, factor in (('s', 1.0), ('ms', 1e-3), ('µs', 1e-6)):
+        if seconds >= factor:
+            return f'{seconds / factor:.2f} {unit}'
+    return f'{seconds / 1e-9:.0f} ns'
+
+
+def write_report(results: List[Result], baselines: Dict[str, float], output: TextIO, threshold: float) -> List[Result]:
+    regressions = []
+    previous: Optional[Result] = None
+
+    for result in results:
+        if previous is None or (previous.benchmark.group, previous.benchmark.name) != (result.benchmark.group, result.benchmark.name):
+            output.write(f'\n{result.benchmark.group}: {result.benchmark.name}\n')
+            previous = None
+
+        line = f'  [{result.benchmark.size:>5}] {format_time(result.seconds):>12}'
+
+        if previous is not None and previous.seconds:
+            line += f'  x{result.seconds / previous.seconds:.2f} from the previous size'
+
+        baseline = baselines.get(result.key)
+        if baseline:
+            ratio = result.seconds / baseline
+            line += f'  {ratio:.2f} of the baseline'
+            if ratio > threshold:
+                line += '  <- REGRESSION'
+                regressions.append(result)
+
+        output.write(line + '\n')
+        previous = result
+
+    return regressions
@@ -1,3 +1,6 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
 from sigmatch.errors import (
     IncorrectArgumentsOrderError as IncorrectArgumentsOrderError,
 )
@@ -13,9 +16,99 @@ from sigmatch.errors import (
 from sigmatch.errors import (
     UnsupportedSignatureError as UnsupportedSignatureError,
 )
-from sigmatch.matchers.possible_call import (
-    PossibleCallMatcher as PossibleCallMatcher,
-)
-from sigmatch.matchers.series import (
-    SignatureSeriesMatcher as SignatureSeriesMatcher,
-)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sigmatch.call_set import (
+        CallSet as CallSet,
+    )
+    from sigmatch.instrumentation import (
+        stats as stats,
+    )
+    from sigmatch.matchers.possible_call import (
+        PossibleCallMatcher as PossibleCallMatcher,
+    )
+    from sigmatch.matchers.series import (
+        SeriesBuilder as SeriesBuilder,
+    )
+    from sigmatch.matchers.series import (
+        SignatureSeriesMatcher as SignatureSeriesMatcher,
+    )
+    from sigmatch.registry import (
+        CallableRegistry as CallableRegistry,
+    )
+    from sigmatch.relations import (
+        get_fingerprint as get_fingerprint,
+    )
+    from sigmatch.relations import (
+        group_by_call_set as group_by_call_set,
+    )
+    from sigmatch.relations import (
+        is_equivalent as is_equivalent,
+    )
+    from sigmatch.relations import (
+        is_substitutable as is_substitutable,
+    )
+    from sigmatch.relations import (
+        overlaps as overlaps,
+    )
+    from sigmatch.result import (
+        CheckResult as CheckResult,
+    )
+    from sigmatch.result import (
+        Reason as Reason,
+    )
+    from sigmatch.shape import (
+        CallShape as CallShape,
+    )
+
+_LAZY_NAMES: Dict[str, str] = {
+    'CallSet': 'sigmatch.call_set',
+    'stats': 'sigmatch.instrumentation',
+    'PossibleCallMatcher': 'sigmatch.matchers.possible_call',
+    'SeriesBuilder': 'sigmatch.matchers.series',
+    'SignatureSeriesMatcher': 'sigmatch.matchers.series',
+    'CallableRegistry': 'sigmatch.registry',
+    'get_fingerprint': 'sigmatch.relations',
+    'group_by_call_set': 'sigmatch.relations',
+    'is_equivalent': 'sigmatch.relations',
+    'is_substitutable': 'sigmatch.relations',
+    'overlaps': 'sigmatch.relations',
+    'CheckResult': 'sigmatch.result',
+    'Reason': 'sigmatch.result',
+    'CallShape': 'sigmatch.shape',
+}
+
+__all__ = [
+    'CallSet',
+    'CallShape',
+    'CallableRegistry',
+    'CheckResult',
+    'IncorrectArgumentsOrderError',
+    'PossibleCallMatcher',
+    'Reason',
+    'SeriesBuilder',
+    'SignatureError',
+    'SignatureMismatchError',
+    'SignatureNotFoundError',
+    'SignatureSeriesMatcher',
+    'UnsupportedSignatureError',
+    'get_fingerprint',
+    'group_by_call_set',
+    'is_equivalent',
+    'is_substitutable',
+    'overlaps',
+    'stats',
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_NAMES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(import_module(_LAZY_NAMES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_NAMES})
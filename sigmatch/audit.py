@@ -0,0 +1,161 @@
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from sigmatch.matchers.abstract import AbstractSignatureMatcher
+from sigmatch.matchers.possible_call import PossibleCallMatcher
+from sigmatch.matchers.series import SignatureSeriesMatcher
+from sigmatch.result import Reason
+from sigmatch.static import StaticSignature, extract_signatures_from_file
+
+if TYPE_CHECKING:  # pragma: no cover
+    import os
+    from concurrent.futures import Executor
+
+Expectation = Union[str, Sequence[str], AbstractSignatureMatcher]
+
+
+class AuditEntry(NamedTuple):
+    qualified_name: str
+    expected: AbstractSignatureMatcher
+    reason: Reason
+    explanation: Optional[str]
+    path: str
+    line: int
+    is_decorated: bool = False
+
+    @property
+    def matched(self) -> bool:
+        return self.reason is Reason.MATCHED
+
+
+class AuditTask(NamedTuple):
+    module: str
+    path: str
+    matchers: Dict[str, AbstractSignatureMatcher]
+
+
+class AuditReport:
+    __slots__ = ('entries', 'errors', 'missing')
+
+    def __init__(self, entries: Iterable[AuditEntry] = (), missing: Iterable[str] = (), errors: Iterable[Tuple[str, str]] = ()) -> None:
+        self.entries: List[AuditEntry] = sorted(entries, key=lambda entry: entry.qualified_name)
+        self.missing: List[str] = sorted(missing)
+        self.errors: List[Tuple[str, str]] = sorted(errors)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(checked={len(self.entries)}, failed={len(self.failed)}, missing={len(self.missing)}, errors={len(self.errors)})'
+
+    def __bool__(self) -> bool:
+        return not self.failed and not self.missing and not self.errors
+
+    @property
+    def failed(self) -> List[AuditEntry]:
+        return [entry for entry in self.entries if not entry.matched]
+
+
+def audit(spec: Mapping[str, Expectation], paths: Iterable[Union[str, 'os.PathLike[str]']], executor: Optional['Executor'] = None, chunksize: int = 16) -> AuditReport:
+    if chunksize < 1:
+        raise ValueError('The chunk size must be a positive number.')
+
+    files: Dict[str, Path] = {}
+    for path in paths:
+        files.update(find_modules(path))
+
+    matchers_by_modules: Dict[str, Dict[str, AbstractSignatureMatcher]] = {}
+    missing: List[str] = []
+
+    for qualified_name, expectation in spec.items():
+        module, separator, _ = qualified_name.partition(':')
+        if not separator:
+            raise ValueError(f'The qualified name must look like "module:Class.function". You used "{qualified_name}".')
+
+        matcher = make_matcher(expectation)
+        if module in files:
+            matchers_by_modules.setdefault(module, {})[qualified_name] = matcher
+        else:
+            missing.append(qualified_name)
+
+    tasks = [AuditTask(module, str(files[module]), matchers) for module, matchers in matchers_by_modules.items()]
+    entries: List[AuditEntry] = []
+    errors: List[Tuple[str, str]] = []
+
+    results: Iterable[Tuple[List[AuditEntry], List[str], Optional[str]]]
+    if executor is None:
+        results = map(audit_module, tasks)
+    else:
+        results = executor.map(audit_module, tasks, chunksize=chunksize)
+
+    for task, (module_entries, module_missing, error) in zip(tasks, results):
+        entries.extend(module_entries)
+        missing.extend(module_missing)
+        if error is not None:
+            errors.append((task.path, error))
+
+    return AuditReport(entries, missing, errors)
+
+
+def audit_module(task: AuditTask) -> Tuple[List[AuditEntry], List[str], Optional[str]]:
+    try:
+        signatures = extract_signatures_from_file(task.path, module=task.module)
+    except (OSError, SyntaxError, ValueError) as e:
+        return [], [], f'{type(e).__name__}: {e}'
+
+    entries: List[AuditEntry] = []
+    missing: List[str] = []
+
+    for qualified_name, matcher in task.matchers.items():
+        signature = signatures.get(qualified_name)
+        if signature is None:
+            missing.append(qualified_name)
+            continue
+
+        entries.append(check_signature(signature, matcher, task.path))
+
+    return entries, missing, None
+
+
+def check_signature(signature: StaticSignature, matcher: AbstractSignatureMatcher, path: str) -> AuditEntry:
+    if signature.is_method:
+        try:
+            bound = signature.bind()
+        except ValueError as e:
+            return AuditEntry(signature.qualified_name, matcher, Reason.SIGNATURE_NOT_FOUND, str(e), path, signature.line, signature.is_decorated)
+    else:
+        bound = signature
+
+    result = matcher.check(bound)
+    return AuditEntry(signature.qualified_name, matcher, result.reason, None if result else result.explanation, path, signature.line, signature.is_decorated)
+
+
+def find_modules(path: Union[str, 'os.PathLike[str]']) -> Dict[str, Path]:
+    path = Path(path)
+    if not path.is_dir():
+        return {path.stem: path}
+
+    modules: Dict[str, Path] = {}
+    for file in sorted(path.rglob('*.py')):
+        parts = [path.name, *file.relative_to(path).with_suffix('').parts]
+        if parts[-1] == '__init__':
+            parts.pop()
+        modules['.'.join(parts)] = file
+
+    return modules
+
+
+def make_matcher(expectation: Expectation) -> AbstractSignatureMatcher:
+    if isinstance(expectation, AbstractSignatureMatcher):
+        return expectation
+    if isinstance(expectation, str):
+        return PossibleCallMatcher(expectation)
+    return SignatureSeriesMatcher(*(PossibleCallMatcher(signature) for signature in expectation))
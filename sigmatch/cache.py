@@ -0,0 +1,133 @@
+from collections import OrderedDict
+from threading import Lock
+from types import FunctionType, MethodType
+from typing import Any, Callable, Generic, List, NamedTuple, Optional, Tuple, TypeVar
+from weakref import ref
+
+from sigmatch.instrumentation import stats
+
+ValueType = TypeVar('ValueType')
+
+MAX_WRAPPING_DEPTH = 32
+SIGNATURE_OVERRIDING_ATTRIBUTES = ('__wrapped__', '__signature__', '_partialmethod', '__partialmethod__')
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class SignatureCache(Generic[ValueType]):
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError('The maximum size of the cache must be a positive number.')
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+        self._data: 'OrderedDict[Tuple[ref[FunctionType], bool], Tuple[Tuple[Any, ...], ValueType]]' = OrderedDict()
+        self._pending_removals: List['ref[FunctionType]'] = []
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._remove_dead_entries()
+            return len(self._data)
+
+    def get(self, function: Callable[..., Any], factory: Callable[[Callable[..., Any]], ValueType]) -> ValueType:
+        target, is_bound = get_function_target(function)
+        if target is None:
+            return factory(function)
+
+        fingerprint = self._get_fingerprint(target)
+        if fingerprint is None:
+            return factory(function)
+
+        key = (ref(target), is_bound)
+
+        with self._lock:
+            self._remove_dead_entries()
+            entry = self._data.get(key)
+            if entry is not None and self._is_same_fingerprint(entry[0], fingerprint):
+                self._data.move_to_end(key)
+                self.hits += 1
+                if stats.enabled:
+                    stats.record_cache_hit()
+                return entry[1]
+            self.misses += 1
+
+        value = factory(function)
+
+        with self._lock:
+            self._remove_dead_entries()
+            self._data[(ref(target, self._pending_removals.append), is_bound)] = (fingerprint, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+        return value
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            self._remove_dead_entries()
+            return CacheInfo(hits=self.hits, misses=self.misses, maxsize=self.maxsize, currsize=len(self._data))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._pending_removals.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def resize(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError('The maximum size of the cache must be a positive number.')
+
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def _remove_dead_entries(self) -> None:
+        while self._pending_removals:
+            dead_reference = self._pending_removals.pop()
+            for is_bound in (False, True):
+                self._data.pop((dead_reference, is_bound), None)
+
+    @staticmethod
+    def _get_fingerprint(function: FunctionType) -> Optional[Tuple[Any, ...]]:
+        fingerprint: List[Any] = []
+
+        for _ in range(MAX_WRAPPING_DEPTH):
+            fingerprint.extend((function.__code__, function.__defaults__, function.__kwdefaults__, getattr(function, '__signature__', None)))
+
+            wrapped = getattr(function, '__wrapped__', None)
+            if wrapped is None:
+                return tuple(fingerprint)
+            if not isinstance(wrapped, FunctionType):
+                return None
+
+            fingerprint.append(wrapped)
+            function = wrapped
+
+        return None
+
+    @staticmethod
+    def _is_same_fingerprint(old: Tuple[Any, ...], new: Tuple[Any, ...]) -> bool:
+        return len(old) == len(new) and all(old_item is new_item for old_item, new_item in zip(old, new))
+
+
+def get_function_target(function: Callable[..., Any], only_plain: bool = False) -> Tuple[Optional[FunctionType], bool]:
+    is_bound = isinstance(function, MethodType)
+    target = function.__func__ if isinstance(function, MethodType) else function
+
+    if not isinstance(target, FunctionType) or (only_plain and any(hasattr(target, name) for name in SIGNATURE_OVERRIDING_ATTRIBUTES)):
+        return None, False
+
+    return target, is_bound
+
+
+signature_cache: 'SignatureCache[Any]' = SignatureCache()
@@ -0,0 +1,319 @@
+from itertools import chain, product
+from math import comb
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    NamedTuple,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from sigmatch.errors import SignatureNotFoundError
+from sigmatch.matchers.abstract import AbstractSignatureMatcher
+from sigmatch.matchers.possible_call import Baskets, PossibleCallMatcher
+from sigmatch.matchers.series import SignatureSeriesMatcher
+from sigmatch.static import StaticSignature
+
+
+class CallSetLayout(NamedTuple):
+    number_of_position_args: int
+    required_named_or_positional: FrozenSet[str]
+    optional_named_or_positional: FrozenSet[str]
+    required_only_named: FrozenSet[str]
+    optional_only_named: FrozenSet[str]
+    is_args: bool
+    is_kwargs: bool
+
+    @classmethod
+    def from_baskets(cls, baskets: Baskets) -> 'CallSetLayout':
+        return cls(
+            number_of_position_args=len(baskets.only_posititional),
+            required_named_or_positional=baskets.required_named_or_positional,
+            optional_named_or_positional=baskets.named_or_positional_set - baskets.required_named_or_positional,
+            required_only_named=baskets.required_only_named,
+            optional_only_named=frozenset(baskets.only_named) - baskets.required_only_named,
+            is_args=baskets.is_args,
+            is_kwargs=baskets.is_kwargs,
+        )
+
+    def __repr__(self) -> str:
+        from printo import describe_data_object  # noqa: PLC0415
+
+        return describe_data_object(type(self).__name__, (), {key: sorted(value) if isinstance(value, frozenset) else value for key, value in self._asdict().items()})
+
+    @property
+    def named_or_positional(self) -> FrozenSet[str]:
+        return self.required_named_or_positional | self.optional_named_or_positional
+
+    @property
+    def named(self) -> FrozenSet[str]:
+        return self.named_or_positional | self.required_only_named | self.optional_only_named
+
+    def get_number_of_calls(self) -> int:
+        number_of_optional = len(self.optional_named_or_positional)
+        return (1 << len(self.required_named_or_positional)) * ((number_of_optional + 2) << number_of_optional >> 1) * (1 << len(self.optional_only_named)) * (1 + self.is_args) * (1 + self.is_kwargs)
+
+    def get_fingerprint(self) -> str:
+        groups = (self.required_named_or_positional, self.optional_named_or_positional, self.required_only_named, self.optional_only_named)
+        return ';'.join((str(self.number_of_position_args), *(','.join(sorted(names)) for names in groups), '*' * self.is_args + '**' * self.is_kwargs))
+
+    def get_minimum_positional(self, names: FrozenSet[str]) -> int:
+        return self.number_of_position_args + len(self.required_named_or_positional - names)
+
+    def get_maximum_positional(self, names: FrozenSet[str]) -> int:
+        return self.number_of_position_args + len(self.named_or_positional - names)
+
+    def accepts(self, matcher: PossibleCallMatcher) -> bool:
+        names = matcher.names_of_named_args_set
+
+        return (
+            (not matcher.is_args or self.is_args)
+            and (not matcher.is_kwargs or self.is_kwargs)
+            and names <= self.named
+            and self.required_only_named <= names
+            and self.get_minimum_positional(names) <= matcher.number_of_position_args <= self.get_maximum_positional(names)
+        )
+
+    def is_subset_of(self, other: 'CallSetLayout') -> bool:
+        return (
+            (not self.is_args or other.is_args)
+            and (not self.is_kwargs or other.is_kwargs)
+            and self.named <= other.named
+            and other.required_only_named <= self.required_only_named
+            and len(other.required_named_or_positional - self.required_only_named - self.required_named_or_positional) <= self.number_of_position_args - other.number_of_position_args
+            and self.number_of_position_args + len(self.named_or_positional) + len((self.required_only_named | self.optional_only_named) & other.named_or_positional) <= other.number_of_position_args + len(other.named_or_positional)
+        )
+
+    def overlaps(self, other: 'CallSetLayout') -> bool:
+        forced = self.required_only_named | other.required_only_named
+        allowed = self.named & other.named
+        if not forced <= allowed:
+            return False
+
+        first_margin = other.number_of_position_args + len(other.named_or_positional - forced) - self.number_of_position_args - len(self.required_named_or_positional - forced)
+        second_margin = self.number_of_position_args + len(self.named_or_positional - forced) - other.number_of_position_args - len(other.required_named_or_positional - forced)
+        first_only = 0
+        second_only = 0
+
+        for name in allowed - forced:
+            first_delta = (name in self.required_named_or_positional) - (name in other.named_or_positional)
+            second_delta = (name in other.required_named_or_positional) - (name in self.named_or_positional)
+            if first_delta > 0 and second_delta < 0:
+                first_only += 1
+            elif first_delta < 0 and second_delta > 0:
+                second_only += 1
+            elif first_delta >= 0 and second_delta >= 0:
+                first_margin += first_delta
+                second_margin += second_delta
+
+        return max(-first_margin, -second_only) <= min(second_margin, first_only)
+
+    def iterate(self, canonical: bool = False) -> Iterator[PossibleCallMatcher]:
+        minimum = self.number_of_position_args
+        maximum = self.number_of_position_args + len(self.named_or_positional)
+
+        if not canonical or minimum:
+            for number_of_position_args in range(minimum, maximum + 1):
+                yield from self._iterate_names(number_of_position_args, skip_empty=False)
+            return
+
+        if not self.required_only_named and not self.required_named_or_positional:
+            yield from self._iterate_unpackings(0, ())
+        for number_of_position_args in range(1, maximum + 1):
+            yield from self._iterate_names(number_of_position_args, skip_empty=False)
+        yield from self._iterate_names(0, skip_empty=True)
+
+    def _iterate_names(self, number_of_position_args: int, skip_empty: bool) -> Iterator[PossibleCallMatcher]:
+        number_of_dotted = number_of_position_args - self.number_of_position_args
+        maximum_of_named_or_positional = len(self.named_or_positional) - number_of_dotted
+        names = sorted(self.named)
+        prefix: List[str] = []
+
+        def search(start: int, number_of_omitted_required: int, number_of_required_only_named: int, number_of_named_or_positional: int) -> Iterator[PossibleCallMatcher]:
+            if prefix or not skip_empty:
+                remaining_required = sum(1 for name in names[start:] if name in self.required_named_or_positional)
+                if number_of_required_only_named == len(self.required_only_named) and number_of_omitted_required + remaining_required <= number_of_dotted:
+                    yield from self._iterate_unpackings(number_of_position_args, prefix)
+
+            for index in range(start, len(names)):
+                name = names[index]
+                if index > start:
+                    skipped = names[index - 1]
+                    if skipped in self.required_only_named:
+                        break
+                    if skipped in self.required_named_or_positional:
+                        number_of_omitted_required += 1
+                        if number_of_omitted_required > number_of_dotted:
+                            break
+
+                is_named_or_positional = name in self.named_or_positional
+                if is_named_or_positional and number_of_named_or_positional == maximum_of_named_or_positional:
+                    continue
+
+                prefix.append(name)
+                yield from search(index + 1, number_of_omitted_required, number_of_required_only_named + (name in self.required_only_named), number_of_named_or_positional + is_named_or_positional)
+                prefix.pop()
+
+        yield from search(0, 0, 0, 0)
+
+    def _iterate_unpackings(self, number_of_position_args: int, names: Sequence[str]) -> Iterator[PossibleCallMatcher]:
+        symbols = ('.',) * number_of_position_args + tuple(names)
+
+        yield PossibleCallMatcher._from_symbols(symbols)
+        if self.is_args:
+            yield PossibleCallMatcher._from_symbols((*symbols, '*'))
+        if self.is_kwargs:
+            yield PossibleCallMatcher._from_symbols((*symbols, '**'))
+        if self.is_args and self.is_kwargs:
+            yield PossibleCallMatcher._from_symbols((*symbols, '*', '**'))
+
+
+class CallSet:
+    def __init__(self, *layouts: CallSetLayout) -> None:
+        self.layouts: FrozenSet[CallSetLayout] = frozenset(layouts)
+
+    @classmethod
+    def from_callable(cls, function: Union[Callable[..., Any], StaticSignature], raise_exception: bool = False) -> 'CallSet':
+        try:
+            baskets = PossibleCallMatcher._get_baskets(function)
+        except SignatureNotFoundError:
+            if not raise_exception:
+                return cls()
+            raise
+
+        return cls(CallSetLayout.from_baskets(baskets))
+
+    def __repr__(self) -> str:
+        from printo import describe_data_object  # noqa: PLC0415
+
+        return describe_data_object(type(self).__name__, sorted(self.layouts, key=repr), {})
+
+    def __bool__(self) -> bool:
+        if len(self.layouts) <= 1:
+            return bool(self.layouts)
+        if len(self.layouts) == 2:
+            first, second = self.layouts
+            return first.overlaps(second)
+
+        for names, _ in self._iterate_name_sets():
+            minimum, maximum = self._get_positional_range(names)
+            if minimum <= maximum:
+                return True
+
+        return False
+
+    def __len__(self) -> int:
+        if len(self.layouts) <= 1:
+            return sum(layout.get_number_of_calls() for layout in self.layouts)
+
+        result = 0
+
+        for names, ways in self._iterate_name_sets():
+            minimum, maximum = self._get_positional_range(names)
+            result += max(0, maximum - minimum + 1) * ways
+
+        return result * self._get_number_of_unpacking_variants()
+
+    def __hash__(self) -> int:
+        return hash(len(self))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, CallSet):
+            if len(self.layouts) == 1 and len(other.layouts) == 1:
+                return self.layouts == other.layouts
+            return self in other and other in self
+
+        if isinstance(other, AbstractSignatureMatcher):
+            members = list(other) if isinstance(other, SignatureSeriesMatcher) else [other]
+            return len(self) == len(members) and all(member in self for member in members)
+
+        return False
+
+    def __contains__(self, item: Any) -> bool:
+        if isinstance(item, PossibleCallMatcher):
+            return bool(self.layouts) and all(layout.accepts(item) for layout in self.layouts)
+
+        if isinstance(item, SignatureSeriesMatcher):
+            return all(member in self for member in item)
+
+        if isinstance(item, CallSet):
+            return item._is_subset_of(self)
+
+        return False
+
+    def __and__(self, other: Any) -> Union['CallSet', SignatureSeriesMatcher]:
+        if isinstance(other, CallSet):
+            if not self.layouts or not other.layouts:
+                return type(self)()
+            return type(self)(*self.layouts, *other.layouts)
+
+        if isinstance(other, AbstractSignatureMatcher):
+            return SignatureSeriesMatcher(*(member for member in (other if isinstance(other, SignatureSeriesMatcher) else [other]) if member in self))
+
+        return NotImplemented
+
+    def __rand__(self, other: Any) -> Union['CallSet', SignatureSeriesMatcher]:
+        return self.__and__(other)
+
+    def __iter__(self) -> Iterator[PossibleCallMatcher]:
+        if not self.layouts:
+            return
+
+        smallest, *others = sorted(self.layouts, key=lambda x: x.get_number_of_calls())
+
+        for matcher in smallest.iterate(canonical=True):
+            if all(layout.accepts(matcher) for layout in others):
+                yield matcher
+
+    def to_series(self) -> SignatureSeriesMatcher:
+        return SignatureSeriesMatcher(*self)
+
+    def _is_subset_of(self, other: 'CallSet') -> bool:
+        if len(self.layouts) == len(other.layouts) == 1:
+            return next(iter(self.layouts)).is_subset_of(next(iter(other.layouts)))
+        if not self:
+            return True
+        if not other.layouts:
+            return False
+
+        if (all(layout.is_args for layout in self.layouts) and not all(layout.is_args for layout in other.layouts)) or (all(layout.is_kwargs for layout in self.layouts) and not all(layout.is_kwargs for layout in other.layouts)):
+            return False
+
+        for names, _ in self._iterate_name_sets(*other.layouts):
+            minimum, maximum = self._get_positional_range(names)
+            if minimum <= maximum:
+                for layout in other.layouts:
+                    if not (names <= layout.named and layout.required_only_named <= names and layout.get_minimum_positional(names) <= minimum and maximum <= layout.get_maximum_positional(names)):
+                        return False
+
+        return True
+
+    def _get_positional_range(self, names: FrozenSet[str]) -> Tuple[int, int]:
+        return max(layout.get_minimum_positional(names) for layout in self.layouts), min(layout.get_maximum_positional(names) for layout in self.layouts)
+
+    def _get_number_of_unpacking_variants(self) -> int:
+        return (1 + all(layout.is_args for layout in self.layouts)) * (1 + all(layout.is_kwargs for layout in self.layouts))
+
+    def _iterate_name_sets(self, *foreign_layouts: CallSetLayout) -> Iterator[Tuple[FrozenSet[str], int]]:
+        forced = frozenset(chain.from_iterable(layout.required_only_named for layout in self.layouts))
+        allowed = frozenset.intersection(*(layout.named for layout in self.layouts))
+        if not forced <= allowed:
+            return
+
+        distinguishing_sets = list(chain.from_iterable((layout.required_named_or_positional, layout.named_or_positional, layout.named, layout.required_only_named) for layout in (*self.layouts, *foreign_layouts)))
+        groups: Dict[Tuple[bool, ...], List[str]] = {}
+        for name in sorted(allowed - forced):
+            groups.setdefault(tuple(name in names for names in distinguishing_sets), []).append(name)
+
+        for counts in product(*(range(len(group) + 1) for group in groups.values())):
+            names = forced.union(*(group[:count] for group, count in zip(groups.values(), counts)))
+            ways = 1
+            for group, count in zip(groups.values(), counts):
+                ways *= comb(len(group), count)
+            yield names, ways
+
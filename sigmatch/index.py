@@ -0,0 +1,228 @@
+import json
+import sqlite3
+from hashlib import sha256
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from sigmatch.audit import (
+    AuditEntry,
+    AuditReport,
+    Expectation,
+    check_signature,
+    find_modules,
+    make_matcher,
+)
+from sigmatch.matchers.possible_call import Baskets, PossibleCallMatcher
+from sigmatch.static import StaticSignature, extract_signatures
+
+if TYPE_CHECKING:  # pragma: no cover
+    import os
+    from concurrent.futures import Executor
+
+SCHEMA_VERSION = 1
+MAXIMUM_QUERY_PARAMETERS = 500
+
+SignatureRow = Tuple[str, int, bool, bool, str, Optional[int], bool, bool]
+
+
+class IndexUpdate(NamedTuple):
+    parsed: int
+    skipped: int
+    removed: int
+
+
+class ParsingTask(NamedTuple):
+    module: str
+    path: str
+
+
+class ParsingResult(NamedTuple):
+    digest: str
+    rows: List[SignatureRow]
+    error: Optional[str]
+
+
+class SignatureIndex:
+    def __init__(self, path: Union[str, 'os.PathLike[str]'] = ':memory:') -> None:
+        self.connection = sqlite3.connect(str(path))
+        self._baskets: Dict[str, Baskets] = {}
+
+        with self.connection:
+            if self.connection.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+                self.connection.execute('DROP TABLE IF EXISTS signatures')
+                self.connection.execute('DROP TABLE IF EXISTS files')
+                self.connection.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+            self.connection.execute('CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, root TEXT NOT NULL, module TEXT NOT NULL, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, hash TEXT NOT NULL, error TEXT)')
+            self.connection.execute('CREATE TABLE IF NOT EXISTS signatures (qualified_name TEXT PRIMARY KEY, path TEXT NOT NULL, line INTEGER NOT NULL, is_method INTEGER NOT NULL, is_decorated INTEGER NOT NULL, baskets TEXT NOT NULL, number_of_positional INTEGER, is_args INTEGER NOT NULL, is_kwargs INTEGER NOT NULL)')
+            self.connection.execute('CREATE INDEX IF NOT EXISTS signatures_by_path ON signatures (path)')
+            self.connection.execute('CREATE INDEX IF NOT EXISTS signatures_by_shape ON signatures (is_args, is_kwargs, number_of_positional)')
+
+    def __enter__(self) -> 'SignatureIndex':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return int(self.connection.execute('SELECT COUNT(*) FROM signatures').fetchone()[0])
+
+    def __contains__(self, qualified_name: object) -> bool:
+        return self.connection.execute('SELECT 1 FROM signatures WHERE qualified_name = ?', (qualified_name,)).fetchone() is not None
+
+    def __getitem__(self, qualified_name: str) -> StaticSignature:
+        row = self.connection.execute('SELECT qualified_name, line, is_method, is_decorated, baskets FROM signatures WHERE qualified_name = ?', (qualified_name,)).fetchone()
+        if row is None:
+            raise KeyError(qualified_name)
+        return self._decode(row)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    @property
+    def errors(self) -> List[Tuple[str, str]]:
+        return [(path, error) for path, error in self.connection.execute('SELECT path, error FROM files WHERE error IS NOT NULL ORDER BY path')]
+
+    def update(self, paths: Iterable[Union[str, 'os.PathLike[str]']], executor: Optional['Executor'] = None, chunksize: int = 16) -> IndexUpdate:
+        if chunksize < 1:
+            raise ValueError('The chunk size must be a positive number.')
+
+        known = {path: (mtime_ns, size, digest) for path, mtime_ns, size, digest in self.connection.execute('SELECT path, mtime_ns, size, hash FROM files')}
+        tasks: List[ParsingTask] = []
+        stats: Dict[str, Tuple[str, int, int]] = {}
+        seen: Set[str] = set()
+        skipped = removed = 0
+
+        for root in paths:
+            root_name = str(Path(root))
+            for module, file in find_modules(root).items():
+                if not file.is_file():
+                    continue
+
+                path = str(file)
+                stat = file.stat()
+                seen.add(path)
+                stats[path] = (root_name, stat.st_mtime_ns, stat.st_size)
+                if path in known and known[path][:2] == (stat.st_mtime_ns, stat.st_size):
+                    skipped += 1
+                else:
+                    tasks.append(ParsingTask(module, path))
+
+            for (path,) in self.connection.execute('SELECT path FROM files WHERE root = ?', (root_name,)).fetchall():
+                if path not in seen:
+                    with self.connection:
+                        self.connection.execute('DELETE FROM signatures WHERE path = ?', (path,))
+                        self.connection.execute('DELETE FROM files WHERE path = ?', (path,))
+                    removed += 1
+
+        results: Iterable[ParsingResult]
+        if executor is None:
+            results = map(parse_module, tasks)
+        else:
+            results = executor.map(parse_module, tasks, chunksize=chunksize)
+
+        parsed = 0
+        for task, result in zip(tasks, results):
+            root_name, mtime_ns, size = stats[task.path]
+            with self.connection:
+                if task.path in known and known[task.path][2] == result.digest:
+                    skipped += 1
+                else:
+                    parsed += 1
+                    self.connection.execute('DELETE FROM signatures WHERE path = ?', (task.path,))
+                    self.connection.executemany('INSERT OR REPLACE INTO signatures VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', ((row[0], task.path, *row[1:]) for row in result.rows))
+                self.connection.execute('INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)', (task.path, root_name, task.module, mtime_ns, size, result.digest, result.error))
+
+        return IndexUpdate(parsed=parsed, skipped=skipped, removed=removed)
+
+    def find(self, matcher: PossibleCallMatcher) -> List[StaticSignature]:
+        query = 'SELECT qualified_name, line, is_method, is_decorated, baskets FROM signatures WHERE number_of_positional IS NOT NULL AND is_args >= ? AND is_kwargs >= ? AND (is_args OR number_of_positional >= ?) ORDER BY qualified_name'
+        result = []
+
+        for row in self.connection.execute(query, (matcher.is_args, matcher.is_kwargs, matcher.number_of_position_args)):
+            signature = self._decode(row)
+            if matcher._match_baskets((signature.bind() if signature.is_method else signature).baskets):
+                result.append(signature)
+
+        return result
+
+    def audit(self, spec: Mapping[str, Expectation]) -> AuditReport:
+        entries: List[AuditEntry] = []
+        missing: List[str] = []
+        broken_modules = {module: (path, error) for path, module, error in self.connection.execute('SELECT path, module, error FROM files WHERE error IS NOT NULL')}
+        errors = set()
+        names = list(spec)
+        rows: Dict[str, Tuple[str, int, int, int, str, str]] = {}
+
+        for start in range(0, len(names), MAXIMUM_QUERY_PARAMETERS):
+            chunk = names[start:start + MAXIMUM_QUERY_PARAMETERS]
+            query = f'SELECT qualified_name, line, is_method, is_decorated, baskets, path FROM signatures WHERE qualified_name IN ({", ".join("?" * len(chunk))})'
+            rows.update((row[0], row) for row in self.connection.execute(query, chunk))
+
+        for qualified_name, expectation in spec.items():
+            matcher = make_matcher(expectation)
+            row = rows.get(qualified_name)
+
+            if row is not None:
+                entries.append(check_signature(self._decode(row[:5]), matcher, row[5]))
+            elif qualified_name.partition(':')[0] in broken_modules:
+                errors.add(broken_modules[qualified_name.partition(':')[0]])
+            else:
+                missing.append(qualified_name)
+
+        return AuditReport(entries, missing, errors)
+
+    def _decode(self, row: Tuple[str, int, int, int, str]) -> StaticSignature:
+        qualified_name, line, is_method, is_decorated, encoded_baskets = row
+
+        baskets = self._baskets.get(encoded_baskets)
+        if baskets is None:
+            baskets = self._baskets[encoded_baskets] = Baskets._from_key(json.loads(encoded_baskets))
+
+        return StaticSignature(qualified_name, baskets, line, bool(is_method), bool(is_decorated))
+
+
+def parse_module(task: ParsingTask) -> ParsingResult:
+    try:
+        content = Path(task.path).read_bytes()
+    except OSError as e:
+        return ParsingResult('', [], f'{type(e).__name__}: {e}')
+
+    digest = sha256(content).hexdigest()
+
+    try:
+        signatures = extract_signatures(content, module=task.module, filename=task.path)
+    except (SyntaxError, ValueError) as e:
+        return ParsingResult(digest, [], f'{type(e).__name__}: {e}')
+
+    rows: List[SignatureRow] = []
+    for signature in signatures.values():
+        try:
+            callable_baskets: Optional[Baskets] = (signature.bind() if signature.is_method else signature).baskets
+        except ValueError:
+            callable_baskets = None
+
+        rows.append((
+            signature.qualified_name,
+            signature.line,
+            signature.is_method,
+            signature.is_decorated,
+            json.dumps(signature.baskets._get_key()),
+            None if callable_baskets is None else callable_baskets.number_of_positional,
+            signature.baskets.is_args,
+            signature.baskets.is_kwargs,
+        ))
+
+    return ParsingResult(digest, rows, None)
@@ -0,0 +1,113 @@
+from contextlib import contextmanager
+from threading import Lock
+from typing import Any, Dict, Iterator, List
+
+
+class Stats:
+    def __init__(self) -> None:
+        self.enabled = False
+        self._is_enabled = False
+        self._lock = Lock()
+        self._counters: Dict[str, Any] = {}
+        self._collectors: List[Stats] = []
+        self._targets: List[Dict[str, Any]] = []
+        self.reset()
+
+    def enable(self) -> None:
+        with self._lock:
+            self._is_enabled = True
+            self._update_targets()
+
+    def disable(self) -> None:
+        with self._lock:
+            self._is_enabled = False
+            self._update_targets()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._counters.update({
+                'signature_lookups': 0,
+                'cache_hits': 0,
+                'signature_extractions': 0,
+                'signature_not_found': 0,
+                'inspect_seconds': 0.0,
+                'baskets_seconds': 0.0,
+                'matches': {},
+                'from_callable': {'count': 0, 'total_size': 0, 'max_size': 0},
+            })
+
+    @contextmanager
+    def collect(self) -> Iterator['Stats']:
+        collector = type(self)()
+        collector._lock = self._lock
+
+        with self._lock:
+            self._collectors.append(collector)
+            self._update_targets()
+
+        try:
+            yield collector
+        finally:
+            with self._lock:
+                self._collectors.remove(collector)
+                self._update_targets()
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            result = {
+                **self._counters,
+                'matches': {name: dict(counters) for name, counters in self._counters['matches'].items()},
+                'from_callable': dict(self._counters['from_callable']),
+            }
+
+        attempts = result['cache_hits'] + result['signature_extractions']
+        result['cache_hit_rate'] = result['cache_hits'] / attempts if attempts else None
+
+        return result
+
+    def record_lookup(self) -> None:
+        with self._lock:
+            for counters in self._targets:
+                counters['signature_lookups'] += 1
+
+    def record_cache_hit(self) -> None:
+        with self._lock:
+            for counters in self._targets:
+                counters['cache_hits'] += 1
+
+    def record_extraction(self, inspect_seconds: float, baskets_seconds: float) -> None:
+        with self._lock:
+            for counters in self._targets:
+                counters['signature_extractions'] += 1
+                counters['inspect_seconds'] += inspect_seconds
+                counters['baskets_seconds'] += baskets_seconds
+
+    def record_not_found(self, inspect_seconds: float) -> None:
+        with self._lock:
+            for counters in self._targets:
+                counters['signature_extractions'] += 1
+                counters['signature_not_found'] += 1
+                counters['inspect_seconds'] += inspect_seconds
+
+    def record_match(self, matcher_type: str, seconds: float) -> None:
+        with self._lock:
+            for counters in self._targets:
+                matches = counters['matches'].setdefault(matcher_type, {'count': 0, 'seconds': 0.0})
+                matches['count'] += 1
+                matches['seconds'] += seconds
+
+    def record_from_callable(self, size: int) -> None:
+        with self._lock:
+            for counters in self._targets:
+                from_callable = counters['from_callable']
+                from_callable['count'] += 1
+                from_callable['total_size'] += size
+                from_callable['max_size'] = max(from_callable['max_size'], size)
+
+    def _update_targets(self) -> None:
+        self._targets = [self._counters] * self._is_enabled + [collector._counters for collector in self._collectors]
+        self.enabled = bool(self._targets)
+
+
+stats = Stats()
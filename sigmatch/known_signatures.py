@@ -0,0 +1,159 @@
+import builtins
+import sys
+from collections import OrderedDict
+from threading import Lock
+from types import (
+    BuiltinFunctionType,
+    ClassMethodDescriptorType,
+    MethodDescriptorType,
+    MethodWrapperType,
+    WrapperDescriptorType,
+)
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Optional, Union
+
+from sigmatch.errors import SignatureNotFoundError
+from sigmatch.instrumentation import stats
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sigmatch.matchers.possible_call import Baskets
+
+C_CALLABLE_TYPES = (BuiltinFunctionType, ClassMethodDescriptorType, MethodDescriptorType, MethodWrapperType, WrapperDescriptorType)
+HEAP_TYPE_FLAG = 1 << 9
+
+BUILTIN_SIGNATURES = {
+    'anext': '(aiterator, default=None, /)',
+    'bool': '(x=False, /)',
+    'breakpoint': '(*args, **kws)',
+    'bytearray': '(source=None, encoding=None, errors=None)',
+    'bytes': '(source=None, encoding=None, errors=None)',
+    'classmethod': '(function, /)',
+    'dict': '(mapping=None, /, **kwargs)',
+    'dir': '(object=None, /)',
+    'filter': '(function, iterable, /)',
+    'frozenset': '(iterable=None, /)',
+    'getattr': '(object, name, default=None, /)',
+    'int': '(x=0, /, base=10)',
+    'iter': '(object, sentinel=None, /)',
+    'map': '(function, iterable, /, *iterables)',
+    'max': '(iterable, /, *args, key=None, default=None)',
+    'min': '(iterable, /, *args, key=None, default=None)',
+    'next': '(iterator, default=None, /)',
+    'range': '(start_or_stop, stop=None, step=None, /)',
+    'set': '(iterable=None, /)',
+    'slice': '(start_or_stop, stop=None, step=None, /)',
+    'staticmethod': '(function, /)',
+    'str': "(object='', encoding='utf-8', errors='strict')",
+    'super': '(type=None, object_or_type=None, /)',
+    'type': '(object_or_name, bases=None, dict=None, /, **kwds)',
+    'vars': '(object=None, /)',
+    'zip': '(*iterables, strict=False)' if sys.version_info >= (3, 10) else '(*iterables)',
+}
+
+
+class KnownSignatures:
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError('The maximum size of the cache must be a positive number.')
+
+        self.maxsize = maxsize
+
+        self._registered: Dict[Hashable, Union[str, 'Baskets']] = {}
+        self._results: 'OrderedDict[Hashable, Optional[Baskets]]' = OrderedDict()
+        self._lock = Lock()
+        self._builtins_are_loaded = False
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._results)
+
+    def register(self, function: Callable[..., Any], signature: str) -> None:
+        key = self._get_key(function)
+        if key is None:
+            raise TypeError(f'Only built-in and C-extension callables can be registered, and {function!r} is not one of them.')
+
+        baskets = parse_signature(signature)
+
+        with self._lock:
+            self._load_builtins()
+            self._registered[key] = baskets
+
+    def unregister(self, function: Callable[..., Any]) -> None:
+        key = self._get_key(function)
+
+        with self._lock:
+            self._load_builtins()
+            self._registered.pop(key, None)
+
+    def get(self, function: Callable[..., Any], factory: Callable[[Callable[..., Any]], 'Baskets']) -> 'Baskets':
+        key = self._get_key(function)
+        if key is None:
+            return factory(function)
+
+        with self._lock:
+            self._load_builtins()
+
+            known = self._registered.get(key)
+            if isinstance(known, str):
+                known = self._registered[key] = parse_signature(known)
+            if known is not None:
+                return known
+
+            if key in self._results:
+                self._results.move_to_end(key)
+                if stats.enabled:
+                    stats.record_cache_hit()
+                result = self._results[key]
+                if result is None:
+                    raise SignatureNotFoundError('For some functions, it is not possible to extract the signature, and this is one of them.')
+                return result
+
+        try:
+            result = factory(function)
+        except SignatureNotFoundError:
+            self._save(key, None)
+            raise
+
+        self._save(key, result)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+    def _save(self, key: Hashable, result: Optional['Baskets']) -> None:
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+    def _load_builtins(self) -> None:
+        if not self._builtins_are_loaded:
+            self._registered.update({self._get_key(getattr(builtins, name)): signature for name, signature in BUILTIN_SIGNATURES.items() if hasattr(builtins, name)})
+            self._builtins_are_loaded = True
+
+    @staticmethod
+    def _get_key(function: Callable[..., Any]) -> Optional[Hashable]:
+        if isinstance(function, C_CALLABLE_TYPES) or (isinstance(function, type) and not function.__flags__ & HEAP_TYPE_FLAG):
+            return type(function), getattr(function, '__module__', None), function.__qualname__
+        return None
+
+
+def parse_signature(signature: str) -> 'Baskets':
+    from ast import FunctionDef, parse  # noqa: PLC0415
+
+    from sigmatch.matchers.possible_call import PossibleCallMatcher  # noqa: PLC0415
+
+    try:
+        statements = parse(f'def function{signature}: ...').body
+    except SyntaxError:
+        statements = []
+
+    definition = statements[0] if len(statements) == 1 else None
+    if not isinstance(definition, FunctionDef):
+        raise ValueError(f'The signature must be written as the parameters of a function definition, for example "(a, /, b=None, *args, c, **kwargs)". You used "{signature}".')
+
+    return PossibleCallMatcher._convert_arguments_to_baskets(definition.args)
+
+
+known_signatures = KnownSignatures()
@@ -1,23 +1,47 @@
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Tuple
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
+from sigmatch.cache import get_function_target
 from sigmatch.errors import (
     SignatureMismatchError,
     SignatureNotFoundError,
 )
+from sigmatch.instrumentation import stats
+from sigmatch.result import CheckResult, Reason
+from sigmatch.shape import CallShape
+from sigmatch.static import StaticSignature
+
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Executor
 
 
 class AbstractSignatureMatcher(ABC):
+    __slots__ = ()
+
     def __add__(self, other: 'AbstractSignatureMatcher') -> 'SignatureSeriesMatcher':  # type: ignore[name-defined] # noqa: F821
         from sigmatch.matchers.series import SignatureSeriesMatcher  # noqa: PLC0415
 
-        matchers = []
+        matchers: List[AbstractSignatureMatcher] = []
 
         for matcher in (self, other):
             if isinstance(matcher, SignatureSeriesMatcher):
                 matchers.extend(matcher.matchers)
             else:
-                matchers.append(matcher)  # type: ignore[arg-type]
+                matchers.append(matcher)
 
         return SignatureSeriesMatcher(*matchers)
 
@@ -33,17 +57,30 @@ class AbstractSignatureMatcher(ABC):
     def __repr__(self) -> str:
         ...  # pragma: no cover
 
-    def __and__(self, other: 'AbstractSignatureMatcher') -> 'SignatureSeriesMatcher':  # type: ignore[name-defined] # noqa: F821
+    def __and__(self, other: Any) -> 'SignatureSeriesMatcher':  # type: ignore[name-defined] # noqa: F821
         from sigmatch.matchers.series import SignatureSeriesMatcher  # noqa: PLC0415
 
+        if not isinstance(other, AbstractSignatureMatcher):
+            return NotImplemented
+
         both: Tuple[SignatureSeriesMatcher, SignatureSeriesMatcher] = tuple([x if isinstance(x, SignatureSeriesMatcher) else SignatureSeriesMatcher(x) for x in (self, other)])  # type: ignore[assignment]
 
         intersection = sorted(set(both[0].matchers) & set(both[1].matchers), key=lambda x: x._get_signature_string())
 
         return SignatureSeriesMatcher(*intersection)
 
-    def match(self, function: Callable[..., Any], raise_exception: bool = False) -> bool:
-        if not callable(function):
+    def match(self, function: Union[Callable[..., Any], StaticSignature], raise_exception: bool = False) -> bool:
+        if not stats.enabled:
+            return self._match_callable(function, raise_exception=raise_exception)
+
+        start = perf_counter()
+        try:
+            return self._match_callable(function, raise_exception=raise_exception)
+        finally:
+            stats.record_match(type(self).__name__, perf_counter() - start)
+
+    def _match_callable(self, function: Union[Callable[..., Any], StaticSignature], raise_exception: bool = False) -> bool:
+        if not callable(function) and not isinstance(function, StaticSignature):
             if raise_exception:
                 raise ValueError('It is impossible to determine the signature of an object that is not being callable.')
             return False
@@ -59,6 +96,64 @@ class AbstractSignatureMatcher(ABC):
             raise SignatureMismatchError('The signature of the callable object does not match the expected one.')
         return result
 
+    def check(self, function: Union[Callable[..., Any], StaticSignature]) -> CheckResult:
+        from sigmatch.matchers.possible_call import PossibleCallMatcher  # noqa: PLC0415
+
+        if not callable(function) and not isinstance(function, StaticSignature):
+            return CheckResult(Reason.NOT_CALLABLE, self)
+
+        try:
+            baskets = PossibleCallMatcher._get_baskets(function)
+        except SignatureNotFoundError:
+            return CheckResult(Reason.SIGNATURE_NOT_FOUND, self)
+
+        return self._check_baskets(baskets)
+
+    def fits(self, args: Sequence[Any], kwargs: Mapping[str, Any]) -> bool:
+        return self.fits_shape(CallShape.from_call(args, kwargs))
+
+    @abstractmethod
+    def fits_shape(self, shape: CallShape) -> bool:
+        ...  # pragma: no cover
+
+    def match_many(self, functions: Iterable[Callable[..., Any]], executor: Optional['Executor'] = None) -> List[bool]:
+        functions = list(functions)
+        keys = [self._get_deduplication_key(function) for function in functions]
+        unique_functions: Dict[Hashable, Callable[..., Any]] = {}
+
+        for key, function in zip(keys, functions):
+            unique_functions.setdefault(key, function)
+
+        results: Iterable[bool]
+        if executor is None:
+            results = map(self.match, unique_functions.values())
+        else:
+            results = executor.map(self.match, unique_functions.values())
+
+        results_by_keys = dict(zip(unique_functions, results))
+
+        return [results_by_keys[key] for key in keys]
+
+    @staticmethod
+    def _get_deduplication_key(function: Callable[..., Any]) -> Hashable:
+        target, is_bound = get_function_target(function, only_plain=True)
+        if target is None:
+            return id(function)
+
+        return target.__code__, len(target.__defaults__ or ()), frozenset(target.__kwdefaults__ or ()), is_bound
+
+    @abstractmethod
+    def _match(self, function: Union[Callable[..., Any], StaticSignature], raise_exception: bool = False) -> bool:
+        ...  # pragma: no cover
+
+    @abstractmethod
+    def _match_baskets(self, baskets: 'Baskets', raise_exception: bool = False) -> bool:  # type: ignore[name-defined] # noqa: F821
+        ...  # pragma: no cover
+
+    @abstractmethod
+    def _check_baskets(self, baskets: 'Baskets') -> CheckResult:  # type: ignore[name-defined] # noqa: F821
+        ...  # pragma: no cover
+
     @abstractmethod
-    def _match(self, function: Callable[..., Any], raise_exception: bool = False) -> bool:
+    def _explain(self, reason: Reason, baskets: 'Baskets') -> str:  # type: ignore[name-defined] # noqa: F821
         ...  # pragma: no cover
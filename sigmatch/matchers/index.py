@@ -0,0 +1,37 @@
+from typing import Dict, Iterable, List, Set, Tuple
+
+from sigmatch.matchers.possible_call import Baskets, PossibleCallMatcher
+
+
+class SeriesIndex:
+    def __init__(self, matchers: Iterable[PossibleCallMatcher]) -> None:
+        self.matchers: List[PossibleCallMatcher] = list(matchers)
+        self.buckets: Dict[Tuple[bool, bool], Dict[int, List[int]]] = {}
+        self.postings: Dict[str, Set[int]] = {}
+        self.maximum_position_args = max((matcher.number_of_position_args for matcher in self.matchers), default=0)
+
+        for index, matcher in enumerate(self.matchers):
+            self.buckets.setdefault((matcher.is_args, matcher.is_kwargs), {}).setdefault(matcher.number_of_position_args, []).append(index)
+            for name in matcher.names_of_named_args:
+                self.postings.setdefault(name, set()).add(index)
+
+    def search(self, baskets: Baskets) -> List[PossibleCallMatcher]:
+        minimum = baskets.number_of_required_only_positional
+        maximum = self.maximum_position_args if baskets.is_args else baskets.number_of_positional
+        candidates: List[int] = []
+
+        if baskets.required_only_named:
+            postings = sorted((self.postings.get(name, set()) for name in baskets.required_only_named), key=len)
+            for index in postings[0].intersection(*postings[1:]):
+                matcher = self.matchers[index]
+                if (baskets.is_args or not matcher.is_args) and (baskets.is_kwargs or not matcher.is_kwargs) and minimum <= matcher.number_of_position_args <= maximum:
+                    candidates.append(index)
+
+        else:
+            for (is_args, is_kwargs), bucket in self.buckets.items():
+                if (baskets.is_args or not is_args) and (baskets.is_kwargs or not is_kwargs):
+                    for number_of_position_args, indexes in bucket.items():
+                        if minimum <= number_of_position_args <= maximum:
+                            candidates.extend(indexes)
+
+        return [self.matchers[index] for index in sorted(candidates) if self.matchers[index]._match_baskets(baskets)]
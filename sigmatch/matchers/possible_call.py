@@ -1,52 +1,239 @@
-from dataclasses import dataclass
-from inspect import Parameter, Signature, signature
-from itertools import chain, combinations
-from typing import Any, Callable, Generator, List, Optional, Tuple, cast
-
-from printo import describe_data_object
+from functools import lru_cache
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
+from sigmatch.cache import get_function_target, signature_cache
 from sigmatch.errors import (
     IncorrectArgumentsOrderError,
     SignatureMismatchError,
     SignatureNotFoundError,
     UnsupportedSignatureError,
 )
+from sigmatch.instrumentation import stats
+from sigmatch.known_signatures import known_signatures
 from sigmatch.matchers.abstract import AbstractSignatureMatcher
+from sigmatch.result import CheckResult, Reason
+from sigmatch.shape import CallShape
+from sigmatch.static import StaticSignature
 
+if TYPE_CHECKING:  # pragma: no cover
+    import ast
+    from inspect import Parameter
 
-@dataclass
-class Argument:
-    name: str
+MAX_INTERNED_MATCHERS = 4096
+CO_VARARGS = 0x04
+CO_VARKEYWORDS = 0x08
+BASKETS_KEY_FIELDS = ('only_named', 'only_posititional', 'named_or_positional', 'with_defaults', 'is_args', 'is_kwargs')
+
+BasketsKey = Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...], Tuple[str, ...], bool, bool]
 
 
-@dataclass
 class Baskets:
-    only_named: List[str]
-    only_posititional: List[str]
-    named_or_positional: List[str]
-    with_defaults: List[str]
+    __slots__ = (
+        'is_args',
+        'is_kwargs',
+        'named',
+        'named_or_positional',
+        'named_or_positional_set',
+        'number_of_positional',
+        'number_of_required_only_positional',
+        'only_named',
+        'only_posititional',
+        'positional_indexes',
+        'required_named_or_positional',
+        'required_only_named',
+        'with_defaults',
+    )
+
+    only_named: Tuple[str, ...]
+    only_posititional: Tuple[str, ...]
+    named_or_positional: Tuple[str, ...]
+    with_defaults: Tuple[str, ...]
     is_args: bool
     is_kwargs: bool
 
+    named: FrozenSet[str]
+    named_or_positional_set: FrozenSet[str]
+    required_only_named: FrozenSet[str]
+    required_named_or_positional: FrozenSet[str]
+    number_of_positional: int
+    number_of_required_only_positional: int
+    positional_indexes: Mapping[str, int]
+
+    def __init__(self, *, only_named: Tuple[str, ...], only_posititional: Tuple[str, ...], named_or_positional: Tuple[str, ...], with_defaults: Tuple[str, ...], is_args: bool, is_kwargs: bool) -> None:  # noqa: PLR0913
+        defaults = frozenset(with_defaults)
+        positional = (*only_posititional, *named_or_positional)
+
+        for name, value in (
+            ('only_named', only_named),
+            ('only_posititional', only_posititional),
+            ('named_or_positional', named_or_positional),
+            ('with_defaults', with_defaults),
+            ('is_args', is_args),
+            ('is_kwargs', is_kwargs),
+            ('named', frozenset((*only_named, *named_or_positional))),
+            ('named_or_positional_set', frozenset(named_or_positional)),
+            ('required_only_named', frozenset(only_named) - defaults),
+            ('required_named_or_positional', frozenset(named_or_positional) - defaults),
+            ('number_of_positional', len(positional)),
+            ('number_of_required_only_positional', len([x for x in only_posititional if x not in defaults])),
+            ('positional_indexes', {name: index for index, name in enumerate(positional)}),
+        ):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{type(self).__name__} objects are immutable.')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{type(self).__name__} objects are immutable.')
+
+    def __repr__(self) -> str:
+        from printo import describe_data_object  # noqa: PLC0415
+
+        return describe_data_object(type(self).__name__, (), dict(zip(BASKETS_KEY_FIELDS, self._get_key())))
+
+    def __reduce__(self) -> Tuple[Callable[..., 'Baskets'], Tuple[BasketsKey]]:
+        return type(self)._from_key, (self._get_key(),)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Baskets):
+            return NotImplemented
+        return self._get_key() == other._get_key()
+
+    def __hash__(self) -> int:
+        return hash(self._get_key())
+
+    def _get_key(self) -> BasketsKey:
+        return (self.only_named, self.only_posititional, self.named_or_positional, self.with_defaults, self.is_args, self.is_kwargs)
+
+    @classmethod
+    def _from_key(cls, key: BasketsKey) -> 'Baskets':
+        only_named, only_posititional, named_or_positional, with_defaults, is_args, is_kwargs = key
+        return cls(
+            only_named=tuple(only_named),
+            only_posititional=tuple(only_posititional),
+            named_or_positional=tuple(named_or_positional),
+            with_defaults=tuple(with_defaults),
+            is_args=bool(is_args),
+            is_kwargs=bool(is_kwargs),
+        )
+
 
 class PossibleCallMatcher(AbstractSignatureMatcher):
-    def __init__(self, *args: str) -> None:
+    __slots__ = (
+        '_hash',
+        '_signature_string',
+        'expected_signature',
+        'is_args',
+        'is_kwargs',
+        'is_wrong',
+        'names_of_named_args',
+        'names_of_named_args_set',
+        'number_of_named_args',
+        'number_of_position_args',
+    )
+
+    expected_signature: Tuple[str, ...]
+    is_args: bool
+    is_kwargs: bool
+    number_of_position_args: int
+    number_of_named_args: int
+    names_of_named_args: Tuple[str, ...]
+    names_of_named_args_set: FrozenSet[str]
+    is_wrong: bool
+    _hash: int
+    _signature_string: str
+
+    def __new__(cls, *args: str) -> 'PossibleCallMatcher':
         for item in args:
             if not isinstance(item, str):
                 raise TypeError(f'Only strings can be used as symbolic representation of function parameters. You used "{item}" ({type(item).__name__}).')
 
-        symbols = self._convert_symbols(args)
+        return cls._from_symbols(cls._parse_symbols(args))
+
+    def __reduce__(self) -> Tuple[Callable[..., 'PossibleCallMatcher'], Tuple[str, ...]]:
+        return type(self), self.expected_signature
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{type(self).__name__} objects are immutable.')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{type(self).__name__} objects are immutable.')
+
+    @classmethod
+    def from_parts(cls, number_of_position_args: int = 0, names: Iterable[str] = (), is_args: bool = False, is_kwargs: bool = False) -> 'PossibleCallMatcher':
+        if number_of_position_args < 0:
+            raise ValueError(f'The number of positional arguments cannot be negative. You used {number_of_position_args}.')
+        if isinstance(names, str):
+            raise TypeError(f'The names of arguments must be passed as a collection of strings, not as a single string. You used "{names}".')
+
+        names = list(names)
+
+        for name in names:
+            if not isinstance(name, str):
+                raise TypeError(f'Only strings can be used as names of arguments. You used "{name}" ({type(name).__name__}).')
+
+        sorted_names = sorted(names)
 
-        self.expected_signature = symbols
-        self.is_args = '*' in symbols
-        self.is_kwargs = '**' in symbols
-        self.number_of_position_args = len([x for x in symbols if x == '.'])
-        self.number_of_named_args = len([x for x in symbols if x.isidentifier()])
-        self.names_of_named_args = list(set([x for x in symbols if x.isidentifier()]))
+        for index, name in enumerate(sorted_names):
+            if not name.isidentifier():
+                raise ValueError(f'Only strings of a certain format can be used as symbols for function arguments: arbitrary variable names, and ".", "*", "**" strings. You used "{name}".')
+            if index and sorted_names[index - 1] == name:
+                raise IncorrectArgumentsOrderError(f'The same argument name cannot occur twice. You have a repeat of "{name}".')
 
-        self.is_wrong = False
+        return cls._from_symbols(('.',) * number_of_position_args + tuple(sorted_names) + ('*',) * is_args + ('**',) * is_kwargs)
+
+    @classmethod
+    def from_call(cls, args: Sequence[Any], kwargs: Mapping[str, Any]) -> 'PossibleCallMatcher':
+        return cls.from_parts(len(args), kwargs)
+
+    @classmethod
+    @lru_cache(maxsize=MAX_INTERNED_MATCHERS)
+    def _parse_symbols(cls, args: Tuple[str, ...]) -> Tuple[str, ...]:
+        return tuple(cls._convert_symbols(args))
+
+    @classmethod
+    @lru_cache(maxsize=MAX_INTERNED_MATCHERS)
+    def _from_symbols(cls, symbols: Tuple[str, ...]) -> 'PossibleCallMatcher':
+        matcher = super().__new__(cls)
+        names = tuple(x for x in symbols if x.isidentifier())
+        number_of_position_args = len([x for x in symbols if x == '.'])
+        is_args = '*' in symbols
+        is_kwargs = '**' in symbols
+
+        for name, value in (
+            ('expected_signature', symbols),
+            ('is_args', is_args),
+            ('is_kwargs', is_kwargs),
+            ('number_of_position_args', number_of_position_args),
+            ('number_of_named_args', len(names)),
+            ('names_of_named_args', names),
+            ('names_of_named_args_set', frozenset(names)),
+            ('is_wrong', False),
+            ('_hash', hash(symbols)),
+            ('_signature_string', ', '.join([x for x in ('.' * number_of_position_args, ', '.join(names), '*' if is_args else '', '**' if is_kwargs else '') if x])),
+        ):
+            object.__setattr__(matcher, name, value)
+
+        return matcher
 
     def __repr__(self) -> str:
+        from printo import describe_data_object  # noqa: PLC0415
+
         return describe_data_object(type(self).__name__, (self._get_signature_string(),), {}, filters={0: lambda x: x != ''})
 
     def __eq__(self, other: Any) -> bool:
@@ -55,73 +242,193 @@ class PossibleCallMatcher(AbstractSignatureMatcher):
         if isinstance(other, SignatureSeriesMatcher):
             return other == self
 
+        if self is other:
+            return True
+
         if not isinstance(other, type(self)):
             return False
 
         return self.expected_signature == other.expected_signature
 
     def __hash__(self) -> int:
-        return hash(tuple(self.expected_signature))
-
-    def _match(self, function: Callable[..., Any], raise_exception: bool = False) -> bool:
-        result = True
-        baskets = self._get_baskets(function)
-
-        have_to_be_positional: List[str] = []
-
-        reverse_counter_or_number_of_position_args = self.number_of_position_args
-
-        for name in baskets.only_posititional:
-            if not reverse_counter_or_number_of_position_args:
-                break
-            have_to_be_positional.append(name)
-            reverse_counter_or_number_of_position_args -= 1
-
-        for name in baskets.named_or_positional:
-            if not reverse_counter_or_number_of_position_args:
-                break
-            have_to_be_positional.append(name)
-            reverse_counter_or_number_of_position_args -= 1
-
-        for name in self.names_of_named_args:
-            if name in have_to_be_positional:
-                result = False
-            if name in baskets.only_named:
-                baskets.only_named.remove(name)
-            elif name in baskets.named_or_positional:
-                baskets.named_or_positional.remove(name)
-            elif baskets.is_kwargs:
-                pass
-            else:
-                result = False
+        return self._hash
+
+    def fits_shape(self, shape: CallShape) -> bool:
+        return (
+            (shape.number_of_position_args == self.number_of_position_args or (self.is_args and shape.number_of_position_args > self.number_of_position_args))
+            and (shape.names == self.names_of_named_args_set or (self.is_kwargs and shape.names > self.names_of_named_args_set))
+        )
+
+    def _match(self, function: Union[Callable[..., Any], StaticSignature], raise_exception: bool = False) -> bool:
+        return self._match_baskets(self._get_baskets(function), raise_exception=raise_exception)
+
+    def _match_baskets(self, baskets: Baskets, raise_exception: bool = False) -> bool:
+        reason = self._get_mismatch_reason(baskets)
+
+        if reason is Reason.TOO_FEW_POSITIONAL_ARGUMENTS and raise_exception:
+            raise SignatureMismatchError('This is a difficult situation, there is no guarantee that a call with a variable number of positional arguments will fill all the slots of positional arguments.')
+
+        return reason is Reason.MATCHED
+
+    def _check_baskets(self, baskets: Baskets) -> CheckResult:
+        return CheckResult(self._get_mismatch_reason(baskets), self, baskets)
+
+    def _get_mismatch_reason(self, baskets: Baskets) -> Reason:  # noqa: PLR0911
+        names = self.names_of_named_args_set
+        number_of_position_args = self.number_of_position_args
+        positional_indexes = baskets.positional_indexes
+
+        if number_of_position_args < baskets.number_of_required_only_positional + len(baskets.required_named_or_positional - names):
+            return Reason.TOO_FEW_POSITIONAL_ARGUMENTS
+        if number_of_position_args > baskets.number_of_positional - len(names & baskets.named_or_positional_set) and not baskets.is_args:
+            return Reason.TOO_MANY_POSITIONAL_ARGUMENTS
+        if self.is_args and not baskets.is_args:
+            return Reason.UNEXPECTED_ARGS_UNPACKING
+        if self.is_kwargs and not baskets.is_kwargs:
+            return Reason.UNEXPECTED_KWARGS_UNPACKING
+        if not all(positional_indexes.get(name, number_of_position_args) >= number_of_position_args for name in names):
+            return Reason.ARGUMENT_PASSED_TWICE
+        if not (baskets.is_kwargs or names <= baskets.named):
+            return Reason.UNEXPECTED_NAMED_ARGUMENT
+        if not baskets.required_only_named <= names:
+            return Reason.MISSING_KEYWORD_ONLY_ARGUMENT
+
+        return Reason.MATCHED
+
+    def _explain(self, reason: Reason, baskets: Baskets) -> str:  # noqa: PLR0911
+        names = self.names_of_named_args
+        number_of_position_args = self.number_of_position_args
+        passed = f'The call passes {number_of_position_args} positional argument{"" if number_of_position_args == 1 else "s"}'
+
+        if reason is Reason.TOO_FEW_POSITIONAL_ARGUMENTS:
+            positional = (*baskets.only_posititional, *baskets.named_or_positional)
+            missing = [name for name in positional[number_of_position_args:] if name not in baskets.with_defaults and (name not in names or name in baskets.only_posititional)]
+            return f'{passed}, and the required parameter "{missing[0]}" is left without a value.'
+
+        if reason is Reason.TOO_MANY_POSITIONAL_ARGUMENTS:
+            maximum = baskets.number_of_positional - len(self.names_of_named_args_set & baskets.named_or_positional_set)
+            return f'{passed}, but the callable can take only {maximum} of them by position.'
+
+        if reason is Reason.UNEXPECTED_ARGS_UNPACKING:
+            return 'The call unpacks an iterable with "*", but the callable has no *args parameter.'
+
+        if reason is Reason.UNEXPECTED_KWARGS_UNPACKING:
+            return 'The call unpacks a mapping with "**", but the callable has no **kwargs parameter.'
+
+        if reason is Reason.ARGUMENT_PASSED_TWICE:
+            name = next(name for name in names if baskets.positional_indexes.get(name, number_of_position_args) < number_of_position_args)
+            return f'The parameter "{name}" gets a value by position, and the call passes it by name as well.'
 
-        for name in baskets.only_named:
-            if name not in baskets.with_defaults:
-                result = False
+        if reason is Reason.UNEXPECTED_NAMED_ARGUMENT:
+            name = next(name for name in names if name not in baskets.named)
+            if name in baskets.only_posititional:
+                return f'The parameter "{name}" is positional-only, so it cannot be passed by name.'
+            return f'The callable has no parameter "{name}".'
 
-        still_have_to_be_passed = [name for name in baskets.only_posititional + baskets.named_or_positional if name not in baskets.with_defaults]
+        if reason is Reason.MISSING_KEYWORD_ONLY_ARGUMENT:
+            name = sorted(baskets.required_only_named - self.names_of_named_args_set)[0]
+            return f'The keyword-only parameter "{name}" is required, but the call does not pass it.'
 
-        if self.number_of_position_args < len(still_have_to_be_passed):
-            if raise_exception:
-                raise SignatureMismatchError('This is a difficult situation, there is no guarantee that a call with a variable number of positional arguments will fill all the slots of positional arguments.')
-            result = False
+        return f'The callable accepts the call {self!r}.'
 
-        elif ((self.number_of_position_args > len(baskets.only_posititional) + len(baskets.named_or_positional)) and not baskets.is_args) or (self.is_args and not baskets.is_args) or (self.is_kwargs and not baskets.is_kwargs):
-            result = False
+    @classmethod
+    def _get_baskets(cls, function: Union[Callable[..., Any], StaticSignature]) -> Baskets:
+        if stats.enabled:
+            stats.record_lookup()
+        if isinstance(function, StaticSignature):
+            return function.baskets
+        return cast(Baskets, signature_cache.get(function, cls._extract_baskets))
+
+    @classmethod
+    def _extract_baskets(cls, function: Callable[..., Any]) -> Baskets:
+        if stats.enabled:
+            return cls._extract_baskets_with_stats(function)
+
+        baskets = cls._read_baskets_from_code(function)
+        if baskets is not None:
+            return baskets
 
-        return result
+        return known_signatures.get(function, cls._inspect_baskets)
 
     @classmethod
-    def _get_baskets(cls, function: Callable[..., Any]) -> Baskets:
+    def _inspect_baskets(cls, function: Callable[..., Any]) -> Baskets:
+        from inspect import signature  # noqa: PLC0415
+
         try:
-            function_signature: Optional[Signature] = signature(function)
-            parameters = list(cast(Signature, function_signature).parameters.values())
+            parameters = list(signature(function).parameters.values())
             return cls._convert_parameters_to_baskets(parameters)
         except ValueError as e:
             raise SignatureNotFoundError('For some functions, it is not possible to extract the signature, and this is one of them.') from e
 
+    @classmethod
+    def _extract_baskets_with_stats(cls, function: Callable[..., Any]) -> Baskets:
+        start = perf_counter()
+        baskets = cls._read_baskets_from_code(function)
+        if baskets is not None:
+            stats.record_extraction(0.0, perf_counter() - start)
+            return baskets
+
+        return known_signatures.get(function, cls._inspect_baskets_with_stats)
+
+    @classmethod
+    def _inspect_baskets_with_stats(cls, function: Callable[..., Any]) -> Baskets:
+        from inspect import signature  # noqa: PLC0415
+
+        start = perf_counter()
+
+        try:
+            function_signature = signature(function)
+        except ValueError as e:
+            stats.record_not_found(perf_counter() - start)
+            raise SignatureNotFoundError('For some functions, it is not possible to extract the signature, and this is one of them.') from e
+
+        middle = perf_counter()
+        baskets = cls._convert_parameters_to_baskets(list(function_signature.parameters.values()))
+        stats.record_extraction(middle - start, perf_counter() - middle)
+
+        return baskets
+
     @staticmethod
-    def _convert_parameters_to_baskets(parameters: List[Parameter]) -> Baskets:
+    def _read_baskets_from_code(function: Callable[..., Any]) -> Optional[Baskets]:
+        target, is_bound = get_function_target(function, only_plain=True)
+        if target is None:
+            return None
+
+        code = target.__code__
+        defaults = target.__defaults__ or ()
+        kwdefaults = target.__kwdefaults__ or {}
+        positional = code.co_varnames[:code.co_argcount]
+        only_named = code.co_varnames[code.co_argcount:code.co_argcount + code.co_kwonlyargcount]
+        number_of_only_positional = code.co_posonlyargcount
+
+        if len(defaults) > len(positional):
+            return None
+
+        with_defaults = (*positional[len(positional) - len(defaults):], *(name for name in only_named if name in kwdefaults))
+
+        if is_bound:
+            if not positional:
+                if not code.co_flags & CO_VARARGS:
+                    return None
+            else:
+                if positional[0] in with_defaults:
+                    with_defaults = with_defaults[1:]
+                positional = positional[1:]
+                number_of_only_positional = max(number_of_only_positional - 1, 0)
+
+        return Baskets(
+            only_named=only_named,
+            only_posititional=positional[:number_of_only_positional],
+            named_or_positional=positional[number_of_only_positional:],
+            with_defaults=with_defaults,
+            is_args=bool(code.co_flags & CO_VARARGS),
+            is_kwargs=bool(code.co_flags & CO_VARKEYWORDS),
+        )
+
+    @staticmethod
+    def _convert_parameters_to_baskets(parameters: List['Parameter']) -> Baskets:
+        from inspect import Parameter  # noqa: PLC0415
+
         only_named = []
         only_posititional = []
         named_or_positional = []
@@ -154,15 +461,30 @@ class PossibleCallMatcher(AbstractSignatureMatcher):
 
 
         return Baskets(
-            only_named=only_named,
-            only_posititional=only_posititional,
-            named_or_positional=named_or_positional,
-            with_defaults=with_defaults,
+            only_named=tuple(only_named),
+            only_posititional=tuple(only_posititional),
+            named_or_positional=tuple(named_or_positional),
+            with_defaults=tuple(with_defaults),
             is_args=is_args,
             is_kwargs=is_kwargs,
         )
 
-    def _convert_symbols(self, args: Tuple[str, ...]) -> List[str]:
+    @staticmethod
+    def _convert_arguments_to_baskets(arguments: 'ast.arguments') -> Baskets:
+        positional = [argument.arg for argument in (*arguments.posonlyargs, *arguments.args)]
+        only_named = [argument.arg for argument in arguments.kwonlyargs]
+
+        return Baskets(
+            only_named=tuple(only_named),
+            only_posititional=tuple(positional[:len(arguments.posonlyargs)]),
+            named_or_positional=tuple(positional[len(arguments.posonlyargs):]),
+            with_defaults=(*positional[len(positional) - len(arguments.defaults):], *(name for name, default in zip(only_named, arguments.kw_defaults) if default is not None)),
+            is_args=arguments.vararg is not None,
+            is_kwargs=arguments.kwarg is not None,
+        )
+
+    @classmethod
+    def _convert_symbols(cls, args: Tuple[str, ...]) -> List[str]:
         result = []
 
         for item in args:
@@ -176,17 +498,19 @@ class PossibleCallMatcher(AbstractSignatureMatcher):
                     else:
                         result.append(stripped_chunk)
 
-        self._check_expected_signature(result)
-        return self._order_signature(result)
+        cls._check_expected_signature(result)
+        return cls._order_signature(result)
 
-    def _order_signature(self, symbols: List[str]) -> List[str]:
+    @staticmethod
+    def _order_signature(symbols: List[str]) -> List[str]:
         named_symbols = sorted(x for x in symbols if x.isidentifier())
         dots = (x for x in symbols if x == '.')
         args_and_kwargs = (x for x in symbols if x in ('*', '**'))
 
         return [*dots, *named_symbols, *args_and_kwargs]
 
-    def _check_expected_signature(self, expected_signature: List[str]) -> None:
+    @staticmethod
+    def _check_expected_signature(expected_signature: List[str]) -> None:
         met_name = False
         met_star = False
         met_double_star = False
@@ -224,56 +548,27 @@ class PossibleCallMatcher(AbstractSignatureMatcher):
                 raise IncorrectArgumentsOrderError(f'What does it mean, this point in expected signature: "{item}"?')
 
     def _get_signature_string(self) -> str:
-        positional_args = ''.join(['.' for x in range(self.number_of_position_args)])
-        named_args = ', '.join(sorted([x for x in self.expected_signature if x.isidentifier()]))
-        star = '*' if self.is_args else ''
-        double_star = '**' if self.is_kwargs else ''
-
-        return ', '.join([x for x in (positional_args, named_args, star, double_star) if x])
+        return self._signature_string
 
     @classmethod
-    def from_callable(cls, function: Callable[..., Any], raise_exception: bool = False) -> 'SignatureSeriesMatcher':  # type: ignore[name-defined] # noqa: F821
+    def from_callable(cls, function: Union[Callable[..., Any], StaticSignature], raise_exception: bool = False) -> 'SignatureSeriesMatcher':  # type: ignore[name-defined] # noqa: F821
         from sigmatch.matchers.series import SignatureSeriesMatcher  # noqa: PLC0415
 
+        series = SignatureSeriesMatcher(*cls.iter_possible_calls(function, canonical=True, raise_exception=raise_exception))
+        if stats.enabled:
+            stats.record_from_callable(len(series))
+
+        return series
+
+    @classmethod
+    def iter_possible_calls(cls, function: Union[Callable[..., Any], StaticSignature], canonical: bool = False, raise_exception: bool = False) -> Iterator['PossibleCallMatcher']:
+        from sigmatch.call_set import CallSetLayout  # noqa: PLC0415
+
         try:
             baskets = cls._get_baskets(function)
         except SignatureNotFoundError:
             if not raise_exception:
-                return SignatureSeriesMatcher()
+                return
             raise
 
-        dots_variations = list(cls._produce_combinations_with_dots(baskets.named_or_positional, 0))
-        matchers = []
-
-        for variation in dots_variations:
-            for exclude_this_names in cls._make_powerset_of_excludes(baskets.with_defaults):
-                for add_args in [False] + [x for x in [baskets.is_args] if x]:
-                    for add_kwargs in [False] + [x for x in [baskets.is_kwargs] if x]:
-                        all_call_arguments = []
-                        all_call_arguments.append('.' * (len(baskets.only_posititional) + variation.count('.')))
-                        all_call_arguments.extend([x for x in variation if x != '.' and x not in exclude_this_names])
-                        all_call_arguments.extend([x for x in baskets.only_named if x not in exclude_this_names])
-
-                        if add_args:
-                            all_call_arguments.append('*')
-                        if add_kwargs:
-                            all_call_arguments.append('**')
-
-                        matchers.append(cls(*all_call_arguments))
-
-        return SignatureSeriesMatcher(*matchers)
-
-    @classmethod
-    def _produce_combinations_with_dots(cls, iterable: List[str], index: int) -> Generator[List[str], List[str], None]:
-        if index == len(iterable):
-            yield []
-
-        else:
-
-            for element in (iterable[index], '.'):
-                for tail in cls._produce_combinations_with_dots(iterable, index + 1):
-                    yield [element, *tail]
-
-    @staticmethod
-    def _make_powerset_of_excludes(some_names: List[str]) -> List[Tuple[str, ...]]:
-        return list(chain.from_iterable(combinations(some_names, batch_size) for batch_size in range(len(some_names) + 1)))
+        yield from CallSetLayout.from_baskets(baskets).iterate(canonical=canonical)
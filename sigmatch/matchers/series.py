@@ -1,37 +1,82 @@
-from typing import Any, Callable, Generator, List
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from printo import describe_data_object
-
-from sigmatch import PossibleCallMatcher
 from sigmatch.errors import SignatureMismatchError, SignatureNotFoundError
 from sigmatch.matchers.abstract import AbstractSignatureMatcher
+from sigmatch.matchers.index import SeriesIndex
+from sigmatch.matchers.possible_call import Baskets, PossibleCallMatcher
+from sigmatch.result import CheckResult, Reason
+from sigmatch.shape import CallShape
+from sigmatch.static import StaticSignature
+
+MAXIMUM_NUMBER_OF_REMEMBERED_SHAPES = 1024
 
 
 class SignatureSeriesMatcher(AbstractSignatureMatcher):
+    __slots__ = ('_hash', '_index', '_shapes', 'matchers')
+
+    matchers: Tuple[PossibleCallMatcher, ...]
+    _hash: int
+    _index: Optional[SeriesIndex]
+    _shapes: Optional[Tuple[Dict[CallShape, bool], List[PossibleCallMatcher]]]
+
     def __init__(self, *matchers: AbstractSignatureMatcher) -> None:
-        self.matchers: List[PossibleCallMatcher] = []
+        members: List[PossibleCallMatcher] = []
 
         for matcher in matchers:
             if isinstance(matcher, type(self)):
-                self.matchers.extend(matcher.matchers)
+                members.extend(matcher.matchers)
             else:
-                self.matchers.append(matcher)  # type: ignore[arg-type]
+                members.append(matcher)  # type: ignore[arg-type]
+
+        sorted_members = tuple(sorted(set(members), key=lambda x: x._get_signature_string()))
+
+        object.__setattr__(self, 'matchers', sorted_members)
+        object.__setattr__(self, '_hash', hash(sorted_members))
+        object.__setattr__(self, '_index', None)
+        object.__setattr__(self, '_shapes', None)
 
-        self.matchers = sorted(set(self.matchers), key=lambda x: x._get_signature_string())
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{type(self).__name__} objects are immutable.')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{type(self).__name__} objects are immutable.')
+
+    @classmethod
+    def union(cls, *series: AbstractSignatureMatcher) -> 'SignatureSeriesMatcher':
+        return cls(*series)
+
+    def __reduce__(self) -> Tuple[Callable[..., 'SignatureSeriesMatcher'], Tuple[PossibleCallMatcher, ...]]:
+        return type(self), self.matchers
 
     def __repr__(self) -> str:
+        from printo import describe_data_object  # noqa: PLC0415
+
         return describe_data_object(type(self).__name__, self.matchers, {})
 
     def __bool__(self) -> bool:
         return bool(self.matchers)
 
     def __hash__(self) -> int:
-        return hash(tuple(self.matchers))
+        return self._hash
 
     def __len__(self) -> int:
         return len(self.matchers)
 
     def __eq__(self, other: Any) -> bool:
+        from sigmatch.call_set import CallSet  # noqa: PLC0415
+
+        if isinstance(other, CallSet):
+            return other == self
+
         if not isinstance(other, AbstractSignatureMatcher):
             return False
 
@@ -40,7 +85,13 @@ class SignatureSeriesMatcher(AbstractSignatureMatcher):
 
         return set(self.matchers) == set(other.matchers)
 
-    def __contains__(self, item: AbstractSignatureMatcher) -> bool:
+    def __contains__(self, item: Any) -> bool:
+        from sigmatch.call_set import CallSet  # noqa: PLC0415
+
+        if isinstance(item, CallSet):
+            members = set(self.matchers)
+            return len(item) <= len(self) and all(member in members for member in item)
+
         if not isinstance(item, AbstractSignatureMatcher):
             return False
 
@@ -54,17 +105,105 @@ class SignatureSeriesMatcher(AbstractSignatureMatcher):
     def __iter__(self) -> Generator[PossibleCallMatcher, None, None]:
         yield from self.matchers
 
-    def _match(self, function: Callable[..., Any], raise_exception: bool = False) -> bool:
-        if not self.matchers:
-            return False
+    def fits_shape(self, shape: CallShape) -> bool:
+        shapes = self._shapes
+        if shapes is None:
+            known_shapes = {CallShape(matcher.number_of_position_args, matcher.names_of_named_args_set): True for matcher in self.matchers if not matcher.is_args and not matcher.is_kwargs}
+            shapes = known_shapes, [matcher for matcher in self.matchers if matcher.is_args or matcher.is_kwargs]
+            object.__setattr__(self, '_shapes', shapes)
+
+        known_shapes, matchers_with_unpacking = shapes
+        result = known_shapes.get(shape)
+
+        if result is None:
+            result = any(matcher.fits_shape(shape) for matcher in matchers_with_unpacking)
+            if len(known_shapes) < MAXIMUM_NUMBER_OF_REMEMBERED_SHAPES:
+                known_shapes[shape] = result
 
-        result = False
+        return result
+
+    def matching(self, function: Union[Callable[..., Any], StaticSignature], raise_exception: bool = False) -> 'SignatureSeriesMatcher':
+        if not callable(function) and not isinstance(function, StaticSignature):
+            if raise_exception:
+                raise ValueError('It is impossible to determine the signature of an object that is not being callable.')
+            return type(self)()
 
         try:
-            result = any(matcher.match(function, raise_exception=raise_exception) for matcher in self.matchers)
-        except (SignatureNotFoundError, SignatureMismatchError) as e:
-            if isinstance(e, SignatureNotFoundError) and raise_exception:
+            baskets = PossibleCallMatcher._get_baskets(function)
+        except SignatureNotFoundError:
+            if raise_exception:
                 raise
-            raise SignatureMismatchError('The signature failed one of the checks.') from e
+            return type(self)()
 
-        return result
+        index = self._index
+        if index is None:
+            index = SeriesIndex(self.matchers)
+            object.__setattr__(self, '_index', index)
+
+        return type(self)(*index.search(baskets))
+
+    def _match(self, function: Union[Callable[..., Any], StaticSignature], raise_exception: bool = False) -> bool:
+        if not self.matchers:
+            return False
+
+        return self._match_baskets(PossibleCallMatcher._get_baskets(function), raise_exception=raise_exception)
+
+    def _match_baskets(self, baskets: Baskets, raise_exception: bool = False) -> bool:
+        for matcher in self.matchers:
+            if matcher._match_baskets(baskets):
+                return True
+
+        if raise_exception:
+            raise SignatureMismatchError('The signature failed one of the checks.')
+
+        return False
+
+    def _check_baskets(self, baskets: Baskets) -> CheckResult:
+        if not self.matchers:
+            return CheckResult(Reason.EMPTY_SERIES, self, baskets)
+
+        for matcher in self.matchers:
+            if matcher._get_mismatch_reason(baskets) is Reason.MATCHED:
+                return CheckResult(Reason.MATCHED, matcher, baskets)
+
+        return CheckResult(Reason.NO_MATCHING_CALL, self, baskets)
+
+    def _explain(self, reason: Reason, baskets: Baskets) -> str:
+        if reason is Reason.EMPTY_SERIES:
+            return 'The series does not contain any expected calls.'
+
+        lines = [f'- {matcher!r}: {matcher._explain(matcher._get_mismatch_reason(baskets), baskets)}' for matcher in self.matchers]
+        return '\n'.join(['None of the expected calls is accepted by the callable:', *lines])
+
+
+class SeriesBuilder:
+    __slots__ = ('_matchers',)
+
+    def __init__(self, *matchers: AbstractSignatureMatcher) -> None:
+        self._matchers: Dict[PossibleCallMatcher, None] = {}
+        self.update(*matchers)
+
+    def __len__(self) -> int:
+        return len(self._matchers)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._matchers
+
+    def __iadd__(self, matcher: AbstractSignatureMatcher) -> 'SeriesBuilder':
+        self.add(matcher)
+        return self
+
+    def add(self, matcher: AbstractSignatureMatcher) -> None:
+        if isinstance(matcher, PossibleCallMatcher):
+            self._matchers[matcher] = None
+        elif isinstance(matcher, SignatureSeriesMatcher):
+            self._matchers.update(dict.fromkeys(matcher.matchers))
+        else:
+            raise TypeError(f'Only matchers can be added to a series. You used "{matcher}" ({type(matcher).__name__}).')
+
+    def update(self, *matchers: AbstractSignatureMatcher) -> None:
+        for matcher in matchers:
+            self.add(matcher)
+
+    def build(self) -> SignatureSeriesMatcher:
+        return SignatureSeriesMatcher(*self._matchers)
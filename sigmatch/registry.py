@@ -0,0 +1,68 @@
+from bisect import bisect_left, insort
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from sigmatch.matchers.possible_call import Baskets, PossibleCallMatcher
+
+GroupKey = Tuple[bool, bool, Optional[str]]
+
+
+class CallableRegistry:
+    def __init__(self, functions: Iterable[Callable[..., Any]] = ()) -> None:
+        self.functions: List[Callable[..., Any]] = []
+        self.baskets: List[Baskets] = []
+
+        self._groups: Dict[GroupKey, List[Tuple[int, int]]] = {}
+        self._postings: Dict[Tuple[bool, str], Set[int]] = {}
+
+        for function in functions:
+            self.register(function)
+
+    def __len__(self) -> int:
+        return len(self.functions)
+
+    def __iter__(self) -> Iterator[Callable[..., Any]]:
+        yield from self.functions
+
+    def register(self, function: Callable[..., Any]) -> Callable[..., Any]:
+        baskets = PossibleCallMatcher._get_baskets(function)
+        index = len(self.functions)
+        anchor = min(baskets.required_only_named) if baskets.required_only_named else None
+        capacity = -1 if baskets.is_args else baskets.number_of_positional
+
+        self.functions.append(function)
+        self.baskets.append(baskets)
+        insort(self._groups.setdefault((baskets.is_args, baskets.is_kwargs, anchor), []), (-capacity, index))
+
+        if anchor is None and not baskets.is_kwargs:
+            for name in baskets.named:
+                self._postings.setdefault((baskets.is_args, name), set()).add(index)
+
+        return function
+
+    def find(self, matcher: PossibleCallMatcher) -> List[Callable[..., Any]]:
+        names = matcher.names_of_named_args_set
+        candidates: List[int] = []
+
+        for (is_args, is_kwargs, anchor), group in self._groups.items():
+            if (matcher.is_args and not is_args) or (matcher.is_kwargs and not is_kwargs) or (anchor is not None and anchor not in names):
+                continue
+
+            if anchor is None and not is_kwargs and names:
+                postings = min((self._postings.get((is_args, name), set()) for name in names), key=len)
+                candidates.extend(index for index in postings if is_args or self.baskets[index].number_of_positional >= matcher.number_of_position_args)
+                continue
+
+            indexes = group if is_args else group[:bisect_left(group, (-matcher.number_of_position_args, len(self.functions)))]
+            candidates.extend(index for _, index in indexes)
+
+        return [self.functions[index] for index in sorted(candidates) if matcher._match_baskets(self.baskets[index])]
@@ -0,0 +1,52 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar, Union
+
+from sigmatch.call_set import CallSet, CallSetLayout
+from sigmatch.errors import SignatureNotFoundError
+from sigmatch.matchers.possible_call import Baskets, PossibleCallMatcher
+from sigmatch.static import StaticSignature
+
+FunctionType = TypeVar('FunctionType', bound=Union[Callable[..., Any], StaticSignature])
+
+
+def is_substitutable(function: Union[Callable[..., Any], StaticSignature], other: Union[Callable[..., Any], StaticSignature], raise_exception: bool = False) -> bool:
+    return CallSet.from_callable(function, raise_exception=raise_exception) in CallSet.from_callable(other, raise_exception=raise_exception)
+
+
+def is_equivalent(function: Union[Callable[..., Any], StaticSignature], other: Union[Callable[..., Any], StaticSignature], raise_exception: bool = False) -> bool:
+    return CallSet.from_callable(function, raise_exception=raise_exception) == CallSet.from_callable(other, raise_exception=raise_exception)
+
+
+def overlaps(function: Union[Callable[..., Any], StaticSignature], other: Union[Callable[..., Any], StaticSignature], raise_exception: bool = False) -> bool:
+    return bool(CallSet.from_callable(function, raise_exception=raise_exception) & CallSet.from_callable(other, raise_exception=raise_exception))
+
+
+def get_fingerprint(function: Union[Callable[..., Any], StaticSignature], raise_exception: bool = False) -> Optional[str]:
+    try:
+        baskets = PossibleCallMatcher._get_baskets(function)
+    except SignatureNotFoundError:
+        if raise_exception:
+            raise
+        return None
+
+    return CallSetLayout.from_baskets(baskets).get_fingerprint()
+
+
+def group_by_call_set(functions: Iterable[FunctionType], raise_exception: bool = False) -> List[List[FunctionType]]:
+    groups: Dict[Optional[str], List[FunctionType]] = {}
+    fingerprints: Dict[Baskets, str] = {}
+
+    for function in functions:
+        try:
+            baskets = PossibleCallMatcher._get_baskets(function)
+        except SignatureNotFoundError:
+            if raise_exception:
+                raise
+            fingerprint = None
+        else:
+            fingerprint = fingerprints.get(baskets)
+            if fingerprint is None:
+                fingerprint = fingerprints[baskets] = CallSetLayout.from_baskets(baskets).get_fingerprint()
+
+        groups.setdefault(fingerprint, []).append(function)
+
+    return list(groups.values())
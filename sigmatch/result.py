@@ -0,0 +1,53 @@
+from enum import Enum
+from typing import TYPE_CHECKING, Optional, cast
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sigmatch.matchers.abstract import AbstractSignatureMatcher
+    from sigmatch.matchers.possible_call import Baskets
+
+
+class Reason(Enum):
+    MATCHED = 'matched'
+    NOT_CALLABLE = 'not_callable'
+    SIGNATURE_NOT_FOUND = 'signature_not_found'
+    EMPTY_SERIES = 'empty_series'
+    NO_MATCHING_CALL = 'no_matching_call'
+    TOO_FEW_POSITIONAL_ARGUMENTS = 'too_few_positional_arguments'
+    TOO_MANY_POSITIONAL_ARGUMENTS = 'too_many_positional_arguments'
+    UNEXPECTED_ARGS_UNPACKING = 'unexpected_args_unpacking'
+    UNEXPECTED_KWARGS_UNPACKING = 'unexpected_kwargs_unpacking'
+    ARGUMENT_PASSED_TWICE = 'argument_passed_twice'
+    UNEXPECTED_NAMED_ARGUMENT = 'unexpected_named_argument'
+    MISSING_KEYWORD_ONLY_ARGUMENT = 'missing_keyword_only_argument'
+
+
+class CheckResult:
+    __slots__ = ('_baskets', '_explanation', 'matcher', 'reason')
+
+    def __init__(self, reason: Reason, matcher: 'AbstractSignatureMatcher', baskets: Optional['Baskets'] = None) -> None:
+        self.reason = reason
+        self.matcher = matcher
+        self._baskets = baskets
+        self._explanation: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(matched={self.matched}, reason={self.reason})'
+
+    def __bool__(self) -> bool:
+        return self.matched
+
+    @property
+    def matched(self) -> bool:
+        return self.reason is Reason.MATCHED
+
+    @property
+    def explanation(self) -> str:
+        if self._explanation is None:
+            if self.reason is Reason.NOT_CALLABLE:
+                self._explanation = 'It is impossible to determine the signature of an object that is not being callable.'
+            elif self.reason is Reason.SIGNATURE_NOT_FOUND:
+                self._explanation = 'For some functions, it is not possible to extract the signature, and this is one of them.'
+            else:
+                self._explanation = self.matcher._explain(self.reason, cast('Baskets', self._baskets))
+
+        return self._explanation
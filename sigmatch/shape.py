@@ -0,0 +1,10 @@
+from typing import Any, FrozenSet, Mapping, NamedTuple, Sequence
+
+
+class CallShape(NamedTuple):
+    number_of_position_args: int
+    names: FrozenSet[str]
+
+    @classmethod
+    def from_call(cls, args: Sequence[Any], kwargs: Mapping[str, Any]) -> 'CallShape':
+        return cls(len(args), frozenset(kwargs))
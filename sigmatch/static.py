@@ -0,0 +1,83 @@
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+    import ast
+    import os
+
+    from sigmatch.matchers.possible_call import Baskets
+
+
+class StaticSignature(NamedTuple):
+    qualified_name: str
+    baskets: 'Baskets'
+    line: int
+    is_method: bool = False
+    is_decorated: bool = False
+
+    def bind(self) -> 'StaticSignature':
+        from sigmatch.matchers.possible_call import Baskets  # noqa: PLC0415
+
+        baskets = self.baskets
+        positional = (*baskets.only_posititional, *baskets.named_or_positional)
+
+        if not positional:
+            if not baskets.is_args:
+                raise ValueError(f'The method {self.qualified_name} cannot be bound, because it does not accept any positional arguments.')
+            return self._replace(is_method=False)
+
+        return self._replace(
+            baskets=Baskets(
+                only_named=baskets.only_named,
+                only_posititional=baskets.only_posititional[1:],
+                named_or_positional=baskets.named_or_positional[1:] if not baskets.only_posititional else baskets.named_or_positional,
+                with_defaults=tuple(name for name in baskets.with_defaults if name != positional[0]),
+                is_args=baskets.is_args,
+                is_kwargs=baskets.is_kwargs,
+            ),
+            is_method=False,
+        )
+
+
+def extract_signatures(source: Union[str, bytes], module: str = '', filename: str = '<unknown>') -> Dict[str, StaticSignature]:
+    from ast import parse  # noqa: PLC0415
+
+    signatures: Dict[str, StaticSignature] = {}
+    prefix = f'{module}:' if module else ''
+
+    collect_signatures(parse(source, filename=filename).body, prefix, signatures, is_class_body=False)
+
+    return signatures
+
+
+def extract_signatures_from_file(path: Union[str, 'os.PathLike[str]'], module: Optional[str] = None) -> Dict[str, StaticSignature]:
+    from pathlib import Path  # noqa: PLC0415
+
+    path = Path(path)
+
+    return extract_signatures(path.read_bytes(), module=path.stem if module is None else module, filename=str(path))
+
+
+def collect_signatures(statements: List['ast.stmt'], prefix: str, signatures: Dict[str, StaticSignature], is_class_body: bool) -> None:
+    from ast import AsyncFunctionDef, ClassDef, FunctionDef, Name  # noqa: PLC0415
+
+    from sigmatch.matchers.possible_call import PossibleCallMatcher  # noqa: PLC0415
+
+    for statement in statements:
+        if isinstance(statement, (FunctionDef, AsyncFunctionDef)):
+            decorators = [decorator.id if isinstance(decorator, Name) else None for decorator in statement.decorator_list]
+            signature = StaticSignature(
+                qualified_name=f'{prefix}{statement.name}',
+                baskets=PossibleCallMatcher._convert_arguments_to_baskets(statement.args),
+                line=statement.lineno,
+                is_method=is_class_body and 'staticmethod' not in decorators,
+                is_decorated=any(decorator not in ('staticmethod', 'classmethod') for decorator in decorators),
+            )
+            if is_class_body and 'classmethod' in decorators:
+                try:
+                    signature = signature.bind()
+                except ValueError:
+                    continue
+            signatures[signature.qualified_name] = signature
+
+        elif isinstance(statement, ClassDef):
+            collect_signatures(statement.body, f'{prefix}{statement.name}.', signatures, is_class_body=True)
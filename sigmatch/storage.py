@@ -0,0 +1,129 @@
+import gzip
+import json
+import os
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Dict, Iterator, List, Mapping, Union
+
+from sigmatch.matchers.abstract import AbstractSignatureMatcher
+from sigmatch.matchers.possible_call import PossibleCallMatcher
+from sigmatch.matchers.series import SignatureSeriesMatcher
+
+FORMAT_NAME = 'sigmatch'
+FORMAT_VERSION = 1
+FILE_MODE = 0o666
+
+
+class LoadedSeries(Mapping[str, SignatureSeriesMatcher]):
+    def __init__(self, data: Dict[str, List[str]]) -> None:
+        self._data = data
+        self._loaded: Dict[str, SignatureSeriesMatcher] = {}
+
+    def __getitem__(self, name: str) -> SignatureSeriesMatcher:
+        series = self._loaded.get(name)
+        if series is None:
+            series = self._loaded[name] = load_matcher(self._data[name])
+        return series
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def dumps(series: Mapping[str, AbstractSignatureMatcher]) -> str:
+    data = {
+        'format': FORMAT_NAME,
+        'version': FORMAT_VERSION,
+        'series': {name: dump_matcher(matcher) for name, matcher in series.items()},
+    }
+    return json.dumps(data, separators=(',', ':'), sort_keys=True)
+
+
+def loads(text: Union[str, bytes]) -> LoadedSeries:
+    try:
+        data = json.loads(text)
+    except ValueError as e:
+        raise ValueError('The data is not a valid JSON document.') from e
+
+    if not isinstance(data, dict) or data.get('format') != FORMAT_NAME:
+        raise ValueError('The data does not contain serialized sigmatch matchers.')
+    if data.get('version') != FORMAT_VERSION:
+        raise ValueError(f'The data has version {data.get("version")}, but version {FORMAT_VERSION} is expected.')
+
+    series = data.get('series')
+    if not isinstance(series, dict):
+        raise ValueError(f'The serialized series must be stored in a dictionary. You used "{series}" ({type(series).__name__}).')
+
+    for signatures in series.values():
+        if not isinstance(signatures, list):
+            raise ValueError(f'A serialized series must be a list of signatures. You used "{signatures}" ({type(signatures).__name__}).')
+        for signature in signatures:
+            if not isinstance(signature, str):
+                raise ValueError(f'A serialized signature must be a string. You used "{signature}" ({type(signature).__name__}).')
+
+    return LoadedSeries(series)
+
+
+def save(series: Mapping[str, AbstractSignatureMatcher], path: Union[str, 'os.PathLike[str]']) -> None:
+    path = Path(path)
+    content = dumps(series).encode('utf-8')
+    if path.suffix == '.gz':
+        content = gzip.compress(content, mtime=0)
+
+    file = NamedTemporaryFile(dir=path.parent, prefix=f'.{path.name}.', delete=False)  # noqa: SIM115
+    temporary_path = Path(file.name)
+
+    try:
+        with file:
+            file.write(content)
+        temporary_path.chmod(FILE_MODE & ~get_umask())
+        temporary_path.replace(path)
+    except BaseException:
+        temporary_path.unlink()
+        raise
+
+
+def get_umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def load(path: Union[str, 'os.PathLike[str]']) -> LoadedSeries:
+    path = Path(path)
+    content = path.read_bytes()
+    if path.suffix == '.gz':
+        content = gzip.decompress(content)
+
+    return loads(content)
+
+
+def dump_matcher(matcher: AbstractSignatureMatcher) -> List[str]:
+    if not isinstance(matcher, AbstractSignatureMatcher):
+        raise TypeError(f'Only matchers can be serialized. You used "{matcher}" ({type(matcher).__name__}).')
+
+    return [item._get_signature_string() for item in SignatureSeriesMatcher(matcher)]
+
+
+def load_matcher(signatures: List[str]) -> SignatureSeriesMatcher:
+    return SignatureSeriesMatcher(*(load_call(signature) for signature in signatures))
+
+
+def load_call(signature: str) -> PossibleCallMatcher:
+    if isinstance(signature, str):
+        symbols: List[str] = []
+        for chunk in signature.split(', ') if signature else ():
+            if chunk[:1] == '.':
+                symbols.extend(chunk)
+            else:
+                symbols.append(chunk)
+
+        names = [symbol for symbol in symbols if symbol.isidentifier()]
+        if all(first < second for first, second in zip(names, names[1:])) and all(symbol in ('.', '*', '**') or symbol.isidentifier() for symbol in symbols):
+            matcher = PossibleCallMatcher._from_symbols(tuple(symbols))
+            if matcher._signature_string == signature:
+                return matcher
+
+    return PossibleCallMatcher(signature)
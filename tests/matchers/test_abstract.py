@@ -1,3 +1,8 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial, wraps
+from inspect import signature
+from types import FunctionType
+
 import pytest
 from full_match import match
 
@@ -30,3 +35,93 @@ def test_and():
     assert PossibleCallMatcher('.') & (PossibleCallMatcher('.') + PossibleCallMatcher('..')) == SignatureSeriesMatcher(PossibleCallMatcher('.'))
     assert (PossibleCallMatcher('.') + PossibleCallMatcher('..')) & (PossibleCallMatcher('.') + PossibleCallMatcher('..')) == (PossibleCallMatcher('.') + PossibleCallMatcher('..'))
     assert (PossibleCallMatcher('.') + PossibleCallMatcher('..') + PossibleCallMatcher('...')) & (PossibleCallMatcher('.') + PossibleCallMatcher('..')) == (PossibleCallMatcher('.') + PossibleCallMatcher('..'))
+
+
+def function_with_two_arguments(a, b): ...
+def function_with_one_argument(a): ...
+
+
+def make_callables():
+    class SomeClass:
+        def method(self, a): ...
+
+    callables = [(lambda a, b=None: None) for _ in range(5)]  # noqa: ARG005
+    callables.extend([
+        function_with_two_arguments,
+        function_with_one_argument,
+        SomeClass.method,
+        SomeClass().method,
+        SomeClass().method,
+        partial(function_with_two_arguments, 1),
+        partial(function_with_two_arguments, 1),
+        __build_class__,
+        123,
+        SomeClass,
+    ])
+    return callables
+
+
+@pytest.mark.parametrize(
+    'matcher',
+    [
+        PossibleCallMatcher('.'),
+        PossibleCallMatcher('..'),
+        PossibleCallMatcher('.') + PossibleCallMatcher('..'),
+        SignatureSeriesMatcher(),
+    ],
+)
+def test_match_many_is_the_same_as_match(matcher):
+    callables = make_callables()
+
+    assert matcher.match_many(callables) == [matcher.match(function) for function in callables]
+    assert matcher.match_many(iter(callables)) == [matcher.match(function) for function in callables]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert matcher.match_many(callables, executor=executor) == [matcher.match(function) for function in callables]
+
+
+def test_match_many_with_empty_input(matcher_class):
+    assert matcher_class().match_many([]) == []
+
+
+def test_match_many_with_process_pool():
+    callables = [function_with_two_arguments, function_with_one_argument] * 3
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert PossibleCallMatcher('.').match_many(callables, executor=executor) == [False, True] * 3
+
+
+def test_match_many_checks_each_kind_of_signature_once(monkeypatch):
+    checked = []
+    original_match = PossibleCallMatcher.match
+
+    def match_and_remember(self, function, raise_exception=False):
+        checked.append(function)
+        return original_match(self, function, raise_exception=raise_exception)
+
+    monkeypatch.setattr(PossibleCallMatcher, 'match', match_and_remember)
+
+    def make_function(default):
+        def function(a, b=default, *, c=default): ...
+        return function
+
+    functions = [make_function(index) for index in range(100)]
+    function_without_defaults = make_function(1)
+    function_without_defaults.__defaults__ = None
+    functions.append(function_without_defaults)
+
+    assert PossibleCallMatcher('.').match_many(functions) == [True] * 100 + [False]
+    assert checked == [functions[0], function_without_defaults]
+
+
+def test_match_many_does_not_merge_functions_with_custom_signatures():
+    def function(a): ...
+
+    @wraps(function_with_two_arguments)
+    def wrapper(a): ...
+
+    other_function = FunctionType(function.__code__, function.__globals__)
+    function_with_signature = FunctionType(function.__code__, function.__globals__)
+    function_with_signature.__signature__ = signature(function_with_two_arguments)
+
+    assert PossibleCallMatcher('.').match_many([function, wrapper, other_function, function_with_signature]) == [True, False, True, False]
@@ -1,3 +1,10 @@
+import copy
+import pickle
+from functools import wraps
+from inspect import signature
+from itertools import islice
+from types import MethodType
+
 import pytest
 from full_match import match
 
@@ -8,6 +15,14 @@ from sigmatch import (
     SignatureNotFoundError,
     SignatureSeriesMatcher,
 )
+from tests.small_signatures import (
+    make_all_calls_by_brute_force,
+    make_all_small_functions,
+    make_all_small_matchers,
+    make_all_small_parameter_lists,
+    make_function,
+    make_real_function,
+)
 
 
 def test_there_should_be_star_in_signature_if_call_contains_it(transformed):
@@ -392,7 +407,7 @@ def test_eq_different_classes():
     ],
 )
 def test_strings_with_multiple_items(to_split, output):
-    assert PossibleCallMatcher(*to_split).expected_signature == output
+    assert PossibleCallMatcher(*to_split).expected_signature == tuple(output)
 
 
 @pytest.mark.parametrize(
@@ -474,7 +489,7 @@ def test_class_with_call_dunder_object_is_callable(transformed):
 @pytest.mark.parametrize(
     'function',
     [
-        next,
+        __build_class__,
     ],
 )
 def test_special_functions(function):
@@ -582,10 +597,10 @@ def test_from_callable_with_stars(transformed):
 
 
 def test_from_callable_when_callable_is_wrong():
-    assert PossibleCallMatcher.from_callable(next) == SignatureSeriesMatcher()
+    assert PossibleCallMatcher.from_callable(__build_class__) == SignatureSeriesMatcher()
 
     with pytest.raises(SignatureNotFoundError, match=match('For some functions, it is not possible to extract the signature, and this is one of them.')):
-        PossibleCallMatcher.from_callable(next, raise_exception=True)
+        PossibleCallMatcher.from_callable(__build_class__, raise_exception=True)
 
 
 def test_empty_class_as_callable():
@@ -631,3 +646,324 @@ def test_function_in_function_when_second_one_contains_stars(transformed):
     assert PossibleCallMatcher.from_callable(function_3) not in PossibleCallMatcher.from_callable(function_1)
     assert PossibleCallMatcher.from_callable(function_2) not in PossibleCallMatcher.from_callable(function_3)
     assert PossibleCallMatcher.from_callable(function_3) not in PossibleCallMatcher.from_callable(function_2)
+
+
+def match_baskets_by_scanning_lists(matcher, baskets):
+    only_named = list(baskets.only_named)
+    named_or_positional = list(baskets.named_or_positional)
+    have_to_be_positional = [*baskets.only_posititional, *baskets.named_or_positional][:matcher.number_of_position_args]
+    result = True
+
+    for name in matcher.names_of_named_args:
+        if name in have_to_be_positional:
+            result = False
+        if name in only_named:
+            only_named.remove(name)
+        elif name in named_or_positional:
+            named_or_positional.remove(name)
+        elif not baskets.is_kwargs:
+            result = False
+
+    if any(name not in baskets.with_defaults for name in only_named):
+        result = False
+
+    if matcher.number_of_position_args < len([name for name in [*baskets.only_posititional, *named_or_positional] if name not in baskets.with_defaults]):
+        return False
+    if ((matcher.number_of_position_args > len(baskets.only_posititional) + len(named_or_positional)) and not baskets.is_args) or (matcher.is_args and not baskets.is_args) or (matcher.is_kwargs and not baskets.is_kwargs):
+        return False
+    return result
+
+
+def test_match_is_the_same_as_scanning_lists():
+    matchers = list(make_all_small_matchers())
+    all_baskets = {PossibleCallMatcher._convert_parameters_to_baskets(parameters) for parameters in make_all_small_parameter_lists()}
+
+    for baskets in all_baskets:
+        for matcher in matchers:
+            assert matcher._match_baskets(baskets) == match_baskets_by_scanning_lists(matcher, baskets), (baskets, matcher)
+
+
+def test_match_with_many_keyword_only_parameters():
+    names = [f'option_{index}' for index in range(40)]
+    function = eval(f'lambda a, *, {", ".join(name + "=None" for name in names)}, required: None')
+
+    assert PossibleCallMatcher('., required').match(function)
+    assert PossibleCallMatcher('.', 'required', *names).match(function)
+    assert PossibleCallMatcher('.', 'required', *names[::2]).match(function)
+
+    assert not PossibleCallMatcher('.').match(function)
+    assert not PossibleCallMatcher('.', 'required', 'option_40').match(function)
+
+
+def test_iter_possible_calls_is_the_same_as_brute_force():
+    for parameters in make_all_small_parameter_lists():
+        try:
+            function = make_function(parameters)
+            expected = list(make_all_calls_by_brute_force(parameters))
+            calls = list(PossibleCallMatcher.iter_possible_calls(function))
+        except ValueError:
+            continue
+
+        assert len(calls) == len(set(calls)) == len(set(expected)), parameters
+        assert {(x.number_of_position_args, x.names_of_named_args_set, x.is_args, x.is_kwargs) for x in calls} == set(expected), parameters
+
+
+def test_iter_possible_calls_in_canonical_order():
+    for function in list(make_all_small_functions('abcd'))[::7]:
+        calls = list(PossibleCallMatcher.iter_possible_calls(function, canonical=True))
+
+        assert calls == sorted(calls, key=lambda x: x._get_signature_string())
+        assert calls == list(PossibleCallMatcher.from_callable(function))
+
+
+def test_iter_possible_calls_is_lazy():
+    names = [f'option_{index}' for index in range(40)]
+    function = eval(f'lambda a, b, {", ".join(name + "=None" for name in names)}, *args, **kwargs: None')
+
+    assert list(islice(PossibleCallMatcher.iter_possible_calls(function), 5)) == [
+        PossibleCallMatcher('a, b'),
+        PossibleCallMatcher('a, b, *'),
+        PossibleCallMatcher('a, b, **'),
+        PossibleCallMatcher('a, b, *, **'),
+        PossibleCallMatcher('a, b, option_0'),
+    ]
+    assert list(islice(PossibleCallMatcher.iter_possible_calls(function, canonical=True), 5)) == [
+        PossibleCallMatcher('., a'),
+        PossibleCallMatcher('., a, *'),
+        PossibleCallMatcher('., a, **'),
+        PossibleCallMatcher('., a, *, **'),
+        PossibleCallMatcher('., a, b'),
+    ]
+
+def test_iter_possible_calls_when_callable_is_wrong():
+    assert list(PossibleCallMatcher.iter_possible_calls(__build_class__)) == []
+
+    with pytest.raises(SignatureNotFoundError, match=match('For some functions, it is not possible to extract the signature, and this is one of them.')):
+        next(PossibleCallMatcher.iter_possible_calls(__build_class__, raise_exception=True))
+
+
+def test_matchers_are_interned():
+    assert PossibleCallMatcher('.., a, **') is PossibleCallMatcher('.., a, **')
+    assert PossibleCallMatcher('.., a, **') is PossibleCallMatcher('.', '.', 'a', '**')
+    assert PossibleCallMatcher('a, b') is PossibleCallMatcher('b, a')
+    assert PossibleCallMatcher() is PossibleCallMatcher('')
+    assert PossibleCallMatcher('., a') is not PossibleCallMatcher('., b')
+
+
+def test_errors_are_raised_every_time_for_interned_strings():
+    for _ in range(3):
+        with pytest.raises(IncorrectArgumentsOrderError, match=match('Positional arguments must be specified first.')):
+            PossibleCallMatcher('a, .')
+
+
+def test_from_callable_returns_interned_matchers():
+    def function(a, b=None, *args): ...
+
+    for matcher in PossibleCallMatcher.from_callable(function):
+        assert matcher is PossibleCallMatcher(*matcher.expected_signature)
+
+
+def test_subclasses_are_interned_separately():
+    class OtherMatcher(PossibleCallMatcher):
+        pass
+
+    assert type(OtherMatcher('., a')) is OtherMatcher
+    assert OtherMatcher('., a') is OtherMatcher('., a')
+    assert OtherMatcher('., a') is not PossibleCallMatcher('., a')
+    assert type(PossibleCallMatcher('., a')) is PossibleCallMatcher
+
+
+def test_intern_cache_is_bounded():
+    assert PossibleCallMatcher._from_symbols.cache_info().maxsize == 4096
+    assert PossibleCallMatcher._parse_symbols.cache_info().maxsize == 4096
+
+
+@pytest.mark.parametrize(
+    'make_copy',
+    [
+        copy.copy,
+        copy.deepcopy,
+        lambda x: pickle.loads(pickle.dumps(x)),
+    ],
+)
+def test_copies_are_interned_too(make_copy):
+    matcher = PossibleCallMatcher('.., a, *')
+
+    assert make_copy(matcher) is matcher
+    assert make_copy(PossibleCallMatcher()) is PossibleCallMatcher()
+    assert PossibleCallMatcher().expected_signature == ()
+
+
+def test_matchers_are_immutable():
+    matcher = PossibleCallMatcher('., a')
+
+    with pytest.raises(AttributeError, match=match('PossibleCallMatcher objects are immutable.')):
+        matcher.is_args = True
+
+    with pytest.raises(AttributeError, match=match('PossibleCallMatcher objects are immutable.')):
+        del matcher.number_of_position_args
+
+    assert not hasattr(matcher, '__dict__')
+    assert matcher.expected_signature == ('.', 'a')
+    assert matcher.names_of_named_args == ('a',)
+    assert matcher.number_of_position_args == 1
+
+
+@pytest.mark.parametrize(
+    ('arguments', 'expected'),
+    [
+        ({}, PossibleCallMatcher()),
+        ({'number_of_position_args': 2}, PossibleCallMatcher('..')),
+        ({'names': ['b', 'a']}, PossibleCallMatcher('a, b')),
+        ({'names': iter(['a'])}, PossibleCallMatcher('a')),
+        ({'number_of_position_args': 1, 'names': {'kek'}, 'is_args': True}, PossibleCallMatcher('., kek, *')),
+        ({'number_of_position_args': 3, 'is_args': True, 'is_kwargs': True}, PossibleCallMatcher('..., *, **')),
+        ({'is_kwargs': True}, PossibleCallMatcher('**')),
+    ],
+)
+def test_from_parts(arguments, expected):
+    assert PossibleCallMatcher.from_parts(**arguments) is expected
+
+
+@pytest.mark.parametrize(
+    ('arguments', 'exception_type', 'message'),
+    [
+        ({'number_of_position_args': -1}, ValueError, 'The number of positional arguments cannot be negative. You used -1.'),
+        ({'names': ['a', 1]}, TypeError, 'Only strings can be used as names of arguments. You used "1" (int).'),
+        ({'names': 'ab'}, TypeError, 'The names of arguments must be passed as a collection of strings, not as a single string. You used "ab".'),
+        ({'names': ''}, TypeError, 'The names of arguments must be passed as a collection of strings, not as a single string. You used "".'),
+        ({'names': ['a', '.']}, ValueError, 'Only strings of a certain format can be used as symbols for function arguments: arbitrary variable names, and ".", "*", "**" strings. You used ".".'),
+        ({'names': ['*']}, ValueError, 'Only strings of a certain format can be used as symbols for function arguments: arbitrary variable names, and ".", "*", "**" strings. You used "*".'),
+        ({'names': ['b', 'a', 'b']}, IncorrectArgumentsOrderError, 'The same argument name cannot occur twice. You have a repeat of "b".'),
+    ],
+)
+def test_wrong_parts(arguments, exception_type, message):
+    with pytest.raises(exception_type, match=match(message)):
+        PossibleCallMatcher.from_parts(**arguments)
+
+
+def test_from_call():
+    assert PossibleCallMatcher.from_call((), {}) is PossibleCallMatcher()
+    assert PossibleCallMatcher.from_call((1, 2), {'b': 3, 'a': 4}) is PossibleCallMatcher('.., a, b')
+    assert PossibleCallMatcher.from_call([None], {}) is PossibleCallMatcher('.')
+
+
+def test_from_call_matches_function_that_accepts_the_call():
+    def function(a, b=None, *, c): ...
+
+    assert PossibleCallMatcher.from_call((1,), {'c': 2}).match(function)
+    assert PossibleCallMatcher.from_call((1, 2), {'c': 3}).match(function)
+    assert not PossibleCallMatcher.from_call((1, 2), {}).match(function)
+
+
+def test_baskets_are_compared_by_parameters():
+    def function(a, b=None, *, c): ...
+
+    baskets = PossibleCallMatcher._get_baskets(function)
+    same_baskets = PossibleCallMatcher._get_baskets(lambda a, b=None, *, c: None)  # noqa: ARG005
+
+    assert baskets == same_baskets
+    assert hash(baskets) == hash(same_baskets)
+    assert baskets != PossibleCallMatcher._get_baskets(lambda a, b, *, c: None)  # noqa: ARG005
+    assert baskets != 'kek'
+    assert repr(baskets) == "Baskets(only_named=('c',), only_posititional=(), named_or_positional=('a', 'b'), with_defaults=('b',), is_args=False, is_kwargs=False)"
+
+
+def test_baskets_are_immutable():
+    baskets = PossibleCallMatcher._get_baskets(lambda a: None)  # noqa: ARG005
+
+    with pytest.raises(AttributeError, match=match('Baskets objects are immutable.')):
+        baskets.is_args = True
+
+    with pytest.raises(AttributeError, match=match('Baskets objects are immutable.')):
+        del baskets.named
+
+    assert not hasattr(baskets, '__dict__')
+
+
+def test_baskets_pickling():
+    def function(a, /, b=None, *args, c, d=None, **kwargs): ...
+
+    baskets = PossibleCallMatcher._get_baskets(function)
+    restored = pickle.loads(pickle.dumps(baskets))
+
+    assert restored == baskets
+    assert restored.required_only_named == frozenset({'c'})
+    assert restored.positional_indexes == {'a': 0, 'b': 1}
+
+
+def get_baskets_by_inspect(function):
+    return PossibleCallMatcher._convert_parameters_to_baskets(list(signature(function).parameters.values()))
+
+
+def test_code_reader_is_the_same_as_inspect():
+    for function in make_all_small_functions():
+        real_function = make_real_function(list(function.__signature__.parameters.values()))
+        bound_method = MethodType(real_function, object())
+
+        assert PossibleCallMatcher._read_baskets_from_code(real_function) == get_baskets_by_inspect(real_function)
+
+        try:
+            expected = get_baskets_by_inspect(bound_method)
+        except ValueError:
+            assert PossibleCallMatcher._read_baskets_from_code(bound_method) is None
+        else:
+            assert PossibleCallMatcher._read_baskets_from_code(bound_method) == expected
+
+
+def test_code_reader_with_unusual_functions():
+    def function_with_locals(a, b=1, *args, c, d=2, **kwargs):  # noqa: ARG001
+        e = a + b
+        return lambda: e + c
+
+    def function_with_changed_defaults(a, b, c): ...
+
+    function_with_changed_defaults.__defaults__ = (1, 2)
+
+    def function_with_extra_kwdefaults(a, *, b): ...
+
+    function_with_extra_kwdefaults.__kwdefaults__ = {'b': 1, 'c': 2}
+
+    class SomeClass:
+        def method(self, a, b=None): ...
+
+        @classmethod
+        def class_method(cls, a, /, b): ...
+
+        @staticmethod
+        def static_method(a): ...
+
+    for function in (
+        function_with_locals,
+        function_with_changed_defaults,
+        function_with_extra_kwdefaults,
+        SomeClass.method,
+        SomeClass().method,
+        SomeClass.class_method,
+        SomeClass().static_method,
+    ):
+        assert PossibleCallMatcher._read_baskets_from_code(function) == get_baskets_by_inspect(function)
+
+
+def test_code_reader_skips_what_it_cannot_read():
+    def function(a, b): ...
+
+    @wraps(function)
+    def wrapper(*args, **kwargs): ...
+
+    def function_with_signature(*args, **kwargs): ...
+
+    function_with_signature.__signature__ = signature(function)
+
+    def function_with_too_many_defaults(a): ...
+
+    function_with_too_many_defaults.__defaults__ = (1, 2)
+
+    class SomeClass:
+        def __init__(self, a): ...
+
+    for some_callable in (wrapper, function_with_signature, function_with_too_many_defaults, SomeClass, next, SomeClass.__init__.__get__, MethodType(lambda: None, object())):
+        assert PossibleCallMatcher._read_baskets_from_code(some_callable) is None
+
+    assert PossibleCallMatcher._get_baskets(wrapper) == get_baskets_by_inspect(function)
+    assert PossibleCallMatcher._get_baskets(function_with_signature) == get_baskets_by_inspect(function)
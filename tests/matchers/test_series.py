@@ -1,8 +1,18 @@
+import pickle
+from functools import partial
+
 import pytest
 from full_match import match
 
-from sigmatch import PossibleCallMatcher, SignatureMismatchError, SignatureNotFoundError
-from sigmatch.matchers.series import SignatureSeriesMatcher
+from sigmatch import (
+    CallShape,
+    PossibleCallMatcher,
+    SignatureMismatchError,
+    SignatureNotFoundError,
+)
+from sigmatch.matchers import series as series_module
+from sigmatch.matchers.series import SeriesBuilder, SignatureSeriesMatcher
+from tests.small_signatures import make_all_small_functions, make_all_small_matchers
 
 
 def test_sum_is_flat():
@@ -15,16 +25,16 @@ def test_sum_is_flat():
 
 def test_deduplication():
     assert PossibleCallMatcher('.') + PossibleCallMatcher('.') == SignatureSeriesMatcher(PossibleCallMatcher('.'))
-    assert (PossibleCallMatcher('.') + PossibleCallMatcher('.')).matchers == [PossibleCallMatcher('.')]
+    assert (PossibleCallMatcher('.') + PossibleCallMatcher('.')).matchers == (PossibleCallMatcher('.'),)
 
 
 def test_order():
-    assert (PossibleCallMatcher('.') + PossibleCallMatcher('..')).matchers == [PossibleCallMatcher('.'), PossibleCallMatcher('..')]
-    assert (PossibleCallMatcher('..') + PossibleCallMatcher('.')).matchers == [PossibleCallMatcher('.'), PossibleCallMatcher('..')]
+    assert (PossibleCallMatcher('.') + PossibleCallMatcher('..')).matchers == (PossibleCallMatcher('.'), PossibleCallMatcher('..'))
+    assert (PossibleCallMatcher('..') + PossibleCallMatcher('.')).matchers == (PossibleCallMatcher('.'), PossibleCallMatcher('..'))
 
 
 def test_include_another_series():
-    assert SignatureSeriesMatcher(PossibleCallMatcher('.') + PossibleCallMatcher('..')).matchers == [PossibleCallMatcher('.'), PossibleCallMatcher('..')]
+    assert SignatureSeriesMatcher(PossibleCallMatcher('.') + PossibleCallMatcher('..')).matchers == (PossibleCallMatcher('.'), PossibleCallMatcher('..'))
 
 
 @pytest.mark.parametrize(
@@ -76,7 +86,7 @@ def test_throughput_check():
     assert (PossibleCallMatcher() + PossibleCallMatcher('..')).match(lambda x, y: None)  # noqa: ARG005
 
     assert not (PossibleCallMatcher() + PossibleCallMatcher('...')).match(lambda x, y: None)  # noqa: ARG005
-    assert not (PossibleCallMatcher() + PossibleCallMatcher('...')).match(next)
+    assert not (PossibleCallMatcher() + PossibleCallMatcher('...')).match(__build_class__)
 
 
     with pytest.raises(SignatureMismatchError, match=match('The signature failed one of the checks.')):
@@ -86,7 +96,7 @@ def test_throughput_check():
 @pytest.mark.parametrize(
     'function',
     [
-        next,
+        __build_class__,
     ],
 )
 def test_special_functions(function):
@@ -253,3 +263,222 @@ def test_match(transformed):  # noqa: PLR0915
     assert not SignatureSeriesMatcher(PossibleCallMatcher('.')).match(function_5)
     with pytest.raises(SignatureMismatchError, match=match('The signature failed one of the checks.')):
         SignatureSeriesMatcher(PossibleCallMatcher('.')).match(function_5, raise_exception=True)
+
+
+def test_signature_is_extracted_once_for_whole_series(monkeypatch):
+    calls = []
+    original_extract_baskets = PossibleCallMatcher._extract_baskets
+
+    def extract_baskets(function):
+        calls.append(function)
+        return original_extract_baskets(function)
+
+    monkeypatch.setattr(PossibleCallMatcher, '_extract_baskets', staticmethod(extract_baskets))
+
+    function = partial(lambda a, b, c=None, d=None: None)  # noqa: ARG005
+    series = PossibleCallMatcher.from_callable(function)
+
+    calls.clear()
+
+    assert len(series) == 32
+    assert series.match(function)
+    assert not (PossibleCallMatcher('.') + PossibleCallMatcher('.....') + PossibleCallMatcher('a, b, c, d, e')).match(function)
+    assert len(calls) == 2
+
+
+def test_match_is_short_circuited(monkeypatch):
+    checked = []
+    original_match_baskets = PossibleCallMatcher._match_baskets
+
+    def match_baskets(self, baskets, raise_exception=False):
+        checked.append(self)
+        return original_match_baskets(self, baskets, raise_exception=raise_exception)
+
+    monkeypatch.setattr(PossibleCallMatcher, '_match_baskets', match_baskets)
+
+    assert (PossibleCallMatcher('.') + PossibleCallMatcher('..') + PossibleCallMatcher('...')).match(lambda a, b: None)  # noqa: ARG005
+    assert checked == [PossibleCallMatcher('.'), PossibleCallMatcher('..')]
+
+
+def test_series_has_no_dict():
+    assert not hasattr(PossibleCallMatcher('.') + PossibleCallMatcher('..'), '__dict__')
+
+
+def test_matching_is_the_same_as_scanning_members():
+    series = SignatureSeriesMatcher(*make_all_small_matchers())
+
+    for function in list(make_all_small_functions())[::5]:
+        assert list(series.matching(function)) == [matcher for matcher in series if matcher.match(function)]
+
+
+def test_matching_in_simple_cases():
+    series = PossibleCallMatcher('.') + PossibleCallMatcher('..') + PossibleCallMatcher('., b') + PossibleCallMatcher('a, b') + PossibleCallMatcher('.., *')
+
+    assert series.matching(lambda a, b: None) == PossibleCallMatcher('..') + PossibleCallMatcher('., b') + PossibleCallMatcher('a, b')  # noqa: ARG005
+    assert series.matching(lambda a, b=None: None) == PossibleCallMatcher('.') + PossibleCallMatcher('..') + PossibleCallMatcher('., b') + PossibleCallMatcher('a, b')  # noqa: ARG005
+    assert series.matching(lambda *args: None) == PossibleCallMatcher('.') + PossibleCallMatcher('..') + PossibleCallMatcher('.., *')  # noqa: ARG005
+    assert series.matching(lambda *, a, b: None) == PossibleCallMatcher('a, b')  # noqa: ARG005
+    assert series.matching(lambda *, c: None) == SignatureSeriesMatcher()  # noqa: ARG005
+    assert series.matching(lambda: None) == SignatureSeriesMatcher()
+    assert SignatureSeriesMatcher().matching(lambda: None) == SignatureSeriesMatcher()
+
+
+def test_matching_with_required_keyword_only_parameters():
+    series = SignatureSeriesMatcher(*(PossibleCallMatcher('.' * number, *names) for number in range(3) for names in (['a'], ['b'], ['a', 'b'], ['a', 'c'])))
+
+    assert list(series.matching(lambda x=None, *, a, c=None: None)) == [PossibleCallMatcher('., a'), PossibleCallMatcher('., a, c'), PossibleCallMatcher('a'), PossibleCallMatcher('a, c')]  # noqa: ARG005
+    assert list(series.matching(lambda *, a, d: None)) == []  # noqa: ARG005
+
+
+def test_matching_when_signature_is_not_found():
+    series = PossibleCallMatcher('.') + PossibleCallMatcher('..')
+
+    assert series.matching(__build_class__) == SignatureSeriesMatcher()
+    assert series.matching(1) == SignatureSeriesMatcher()
+
+    with pytest.raises(SignatureNotFoundError, match=match('For some functions, it is not possible to extract the signature, and this is one of them.')):
+        series.matching(__build_class__, raise_exception=True)
+
+    with pytest.raises(ValueError, match=match('It is impossible to determine the signature of an object that is not being callable.')):
+        series.matching(1, raise_exception=True)
+
+
+def test_raise_exception_checks_all_members():
+    series = PossibleCallMatcher('...') + PossibleCallMatcher('..') + PossibleCallMatcher('.')
+
+    assert series.match(lambda a, b: None, raise_exception=True)  # noqa: ARG005
+    assert series.match(lambda a: None, raise_exception=True)  # noqa: ARG005
+
+    with pytest.raises(SignatureMismatchError, match=match('The signature failed one of the checks.')):
+        series.match(lambda a, b, c, d: None, raise_exception=True)  # noqa: ARG005
+
+
+def test_pickling():
+    def function(a, b=None, *args, c, **kwargs): ...
+
+    series = PossibleCallMatcher.from_callable(function)
+    series.match(function)
+    series.fits((1,), {'c': 2})
+
+    copy = pickle.loads(pickle.dumps(series))
+
+    assert copy == series
+    assert all(first is second for first, second in zip(copy, series))
+    assert copy._index is None
+    assert copy._shapes is None
+    assert pickle.loads(pickle.dumps(SignatureSeriesMatcher())) == SignatureSeriesMatcher()
+
+
+def test_union():
+    first = PossibleCallMatcher('.')
+    second = PossibleCallMatcher('..')
+    third = PossibleCallMatcher('...')
+
+    assert SignatureSeriesMatcher.union() == SignatureSeriesMatcher()
+    assert SignatureSeriesMatcher.union(third, first + second, second, SignatureSeriesMatcher(third)).matchers == (first, second, third)
+
+
+def test_union_is_the_same_as_sum():
+    matchers = list(make_all_small_matchers())
+    series = SignatureSeriesMatcher()
+    for matcher in matchers:
+        series += matcher
+
+    assert SignatureSeriesMatcher.union(*matchers).matchers == series.matchers
+    assert SignatureSeriesMatcher.union(*reversed(matchers)).matchers == series.matchers
+
+
+def test_series_builder():
+    first = PossibleCallMatcher('.')
+    second = PossibleCallMatcher('..')
+    third = PossibleCallMatcher('...')
+
+    builder = SeriesBuilder(third)
+    builder += second
+    builder += first + third
+    builder.add(SignatureSeriesMatcher(second))
+    builder.update(first, second)
+
+    assert len(builder) == 3
+    assert first in builder
+    assert PossibleCallMatcher('a') not in builder
+    assert builder.build().matchers == (first, second, third)
+
+    built = builder.build()
+    builder += PossibleCallMatcher('a')
+
+    assert built.matchers == (first, second, third)
+    assert builder.build() == built + PossibleCallMatcher('a')
+    assert SeriesBuilder().build() == SignatureSeriesMatcher()
+
+
+def test_series_builder_accepts_only_matchers():
+    builder = SeriesBuilder()
+
+    with pytest.raises(TypeError, match=match('Only matchers can be added to a series. You used "kek" (str).')):
+        builder.add('kek')
+
+    with pytest.raises(TypeError, match=match('Only matchers can be added to a series. You used "1" (int).')):
+        SeriesBuilder(PossibleCallMatcher('.'), 1)
+
+    assert len(builder) == 0
+
+
+def test_series_is_immutable():
+    series = SignatureSeriesMatcher(PossibleCallMatcher('.'))
+    series.fits((1,), {})
+    series.matching(lambda a: None)  # noqa: ARG005
+
+    assert isinstance(series.matchers, tuple)
+
+    with pytest.raises(AttributeError):
+        series.matchers.append(PossibleCallMatcher('..'))
+
+    with pytest.raises(AttributeError, match=match('SignatureSeriesMatcher objects are immutable.')):
+        series.matchers = (PossibleCallMatcher('..'),)
+
+    with pytest.raises(AttributeError, match=match('SignatureSeriesMatcher objects are immutable.')):
+        del series.matchers
+
+    with pytest.raises(AttributeError, match=match('SignatureSeriesMatcher objects are immutable.')):
+        series._index = None
+
+    assert not series.match(lambda a, b: None)  # noqa: ARG005
+    assert not series.fits((1, 2), {})
+    assert not series.matching(lambda a, b: None)  # noqa: ARG005
+    assert not hasattr(series, '__dict__')
+
+
+def test_fits_shape_remembers_answers():
+    series = PossibleCallMatcher('., a') + PossibleCallMatcher('.., *') + PossibleCallMatcher('b, **')
+
+    assert series.fits_shape(CallShape(1, frozenset({'a'})))
+    assert series.fits_shape(CallShape(5, frozenset()))
+    assert series.fits_shape(CallShape(0, frozenset({'b', 'c'})))
+    assert not series.fits_shape(CallShape(1, frozenset()))
+    assert not series.fits_shape(CallShape(1, frozenset()))
+
+    assert series._shapes[0] == {
+        CallShape(1, frozenset({'a'})): True,
+        CallShape(5, frozenset()): True,
+        CallShape(0, frozenset({'b', 'c'})): True,
+        CallShape(1, frozenset()): False,
+    }
+
+
+def test_remembered_shapes_are_limited(monkeypatch):
+    monkeypatch.setattr(series_module, 'MAXIMUM_NUMBER_OF_REMEMBERED_SHAPES', 2)
+    series = PossibleCallMatcher('.') + PossibleCallMatcher('.., *')
+
+    for number_of_position_args in range(10):
+        assert series.fits_shape(CallShape(number_of_position_args, frozenset())) == (number_of_position_args != 0)
+
+    assert len(series._shapes[0]) == 2
+
+
+def test_hash_is_computed_once():
+    series = SignatureSeriesMatcher(PossibleCallMatcher('..'), PossibleCallMatcher('.'))
+
+    assert series._hash == hash((PossibleCallMatcher('.'), PossibleCallMatcher('..')))
+    assert hash(series) == series._hash
+    assert hash(series) == hash(PossibleCallMatcher('.') + PossibleCallMatcher('..'))
@@ -0,0 +1,73 @@
+from inspect import Parameter, Signature
+from itertools import chain, combinations, product
+
+from sigmatch import PossibleCallMatcher
+
+
+def make_all_small_parameter_lists(names='abc'):
+    kinds = [None, Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY]
+
+    for chosen_kinds in product(kinds, repeat=len(names)):
+        for defaults in product([False, True], repeat=len(names)):
+            for is_args, is_kwargs in product([False, True], repeat=2):
+                parameters = []
+                for name, kind, default in zip(names, chosen_kinds, defaults):
+                    if kind is not None:
+                        parameters.append(Parameter(name, kind, default=None if default else Parameter.empty))
+                if is_args:
+                    parameters.append(Parameter('args', Parameter.VAR_POSITIONAL))
+                if is_kwargs:
+                    parameters.append(Parameter('kwargs', Parameter.VAR_KEYWORD))
+                parameters.sort(key=lambda x: (x.kind, x.default is not Parameter.empty and x.kind != Parameter.KEYWORD_ONLY))
+                yield parameters
+
+
+def make_function(parameters):
+    def function(*args, **kwargs): ...
+
+    function.__signature__ = Signature(parameters)
+    return function
+
+
+def make_real_function(parameters):
+    return eval(f'lambda {str(Signature(parameters))[1:-1]}: None')
+
+
+def make_all_small_functions(names='abc'):
+    seen = set()
+
+    for parameters in make_all_small_parameter_lists(names):
+        try:
+            signature = Signature(parameters)
+        except ValueError:
+            continue
+        if str(signature) not in seen:
+            seen.add(str(signature))
+            yield make_function(parameters)
+
+
+def make_all_calls_by_brute_force(parameters):
+    only_positional = [x.name for x in parameters if x.kind == Parameter.POSITIONAL_ONLY]
+    named_or_positional = [x.name for x in parameters if x.kind == Parameter.POSITIONAL_OR_KEYWORD]
+    only_named = [x.name for x in parameters if x.kind == Parameter.KEYWORD_ONLY]
+    with_defaults = [x.name for x in parameters if x.default is not Parameter.empty]
+    is_args = any(x.kind == Parameter.VAR_POSITIONAL for x in parameters)
+    is_kwargs = any(x.kind == Parameter.VAR_KEYWORD for x in parameters)
+
+    for variation in product(*((name, '.') for name in named_or_positional)):
+        for excludes in chain.from_iterable(combinations(with_defaults, size) for size in range(len(with_defaults) + 1)):
+            for add_args in [False, True][:1 + is_args]:
+                for add_kwargs in [False, True][:1 + is_kwargs]:
+                    yield (
+                        len(only_positional) + variation.count('.'),
+                        frozenset(x for x in (*variation, *only_named) if x != '.' and x not in excludes),
+                        add_args,
+                        add_kwargs,
+                    )
+
+
+def make_all_small_matchers():
+    for number_of_dots in range(4):
+        for names in chain.from_iterable(combinations('abcd', size) for size in range(3)):
+            for flags in ([], ['*'], ['**'], ['*', '**']):
+                yield PossibleCallMatcher('.' * number_of_dots, *names, *flags)
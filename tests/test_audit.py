@@ -0,0 +1,136 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from full_match import match
+
+from sigmatch import PossibleCallMatcher, Reason, SignatureSeriesMatcher
+from sigmatch.audit import AuditEntry, AuditReport, audit, find_modules, make_matcher
+
+
+@pytest.fixture
+def package(tmp_path):
+    root = tmp_path / 'package'
+    (root / 'handlers').mkdir(parents=True)
+    (root / '__init__.py').write_text('def setup(app, *, debug=False): ...\n')
+    (root / 'handlers' / '__init__.py').write_text('')
+    (root / 'handlers' / 'http.py').write_text('''
+def handle(request, response=None): ...
+
+def handle_error(error, /): ...
+
+class Handler:
+    def __call__(self, request): ...
+
+    def broken(): ...
+
+    @cached
+    def cached(self, *args, **kwargs): ...
+''')
+    (root / 'broken.py').write_text('def function(: ...\n')
+    return root
+
+
+def test_find_modules(package, tmp_path):
+    assert find_modules(package) == {
+        'package': package / '__init__.py',
+        'package.broken': package / 'broken.py',
+        'package.handlers': package / 'handlers' / '__init__.py',
+        'package.handlers.http': package / 'handlers' / 'http.py',
+    }
+    assert find_modules(package / 'broken.py') == {'broken': package / 'broken.py'}
+    assert find_modules(str(tmp_path / 'module.py')) == {'module': tmp_path / 'module.py'}
+
+
+def test_make_matcher():
+    matcher = PossibleCallMatcher('.')
+
+    assert make_matcher(matcher) is matcher
+    assert make_matcher('., a') == PossibleCallMatcher('., a')
+    assert make_matcher(['.', 'a']) == SignatureSeriesMatcher(PossibleCallMatcher('.'), PossibleCallMatcher('a'))
+
+
+def test_audit(package):
+    report = audit(
+        {
+            'package:setup': '., debug',
+            'package.handlers.http:handle': ['.', 'request, response'],
+            'package.handlers.http:handle_error': 'error',
+            'package.handlers.http:Handler.__call__': '.',
+            'package.handlers.http:Handler.broken': '',
+            'package.handlers.http:Handler.cached': '., a',
+            'package.handlers.http:unknown': '',
+            'package.unknown:function': '',
+            'package.broken:function': '.',
+        },
+        [package],
+    )
+
+    assert not report
+    assert repr(report) == 'AuditReport(checked=6, failed=2, missing=2, errors=1)'
+    assert report.missing == ['package.handlers.http:unknown', 'package.unknown:function']
+    assert [path for path, _ in report.errors] == [str(package / 'broken.py')]
+    assert report.errors[0][1].startswith('SyntaxError: ')
+
+    path = str(package / 'handlers' / 'http.py')
+    assert report.entries == [
+        AuditEntry('package.handlers.http:Handler.__call__', PossibleCallMatcher('.'), Reason.MATCHED, None, path, 7),
+        AuditEntry('package.handlers.http:Handler.broken', PossibleCallMatcher(''), Reason.SIGNATURE_NOT_FOUND, 'The method package.handlers.http:Handler.broken cannot be bound, because it does not accept any positional arguments.', path, 9),
+        AuditEntry('package.handlers.http:Handler.cached', PossibleCallMatcher('., a'), Reason.MATCHED, None, path, 12, is_decorated=True),
+        AuditEntry('package.handlers.http:handle', SignatureSeriesMatcher(PossibleCallMatcher('.'), PossibleCallMatcher('request, response')), Reason.MATCHED, None, path, 2),
+        AuditEntry('package.handlers.http:handle_error', PossibleCallMatcher('error'), Reason.TOO_FEW_POSITIONAL_ARGUMENTS, 'The call passes 0 positional arguments, and the required parameter "error" is left without a value.', path, 4),
+        AuditEntry('package:setup', PossibleCallMatcher('., debug'), Reason.MATCHED, None, str(package / '__init__.py'), 1),
+    ]
+    assert report.failed == report.entries[1:2] + report.entries[4:5]
+
+
+def test_empty_audit(package):
+    report = audit({}, [package])
+
+    assert report
+    assert report.entries == []
+    assert repr(report) == 'AuditReport(checked=0, failed=0, missing=0, errors=0)'
+    assert repr(AuditReport()) == 'AuditReport(checked=0, failed=0, missing=0, errors=0)'
+
+
+def test_audit_of_missing_file(tmp_path):
+    report = audit({'module:function': '.'}, [tmp_path / 'module.py'])
+
+    assert report.errors[0][0] == str(tmp_path / 'module.py')
+    assert report.errors[0][1].startswith('FileNotFoundError: ')
+
+
+def test_audit_of_several_packages(package, tmp_path):
+    (tmp_path / 'module.py').write_text('def function(a): ...\n')
+
+    report = audit({'package:setup': '.', 'module:function': 'a'}, [package, tmp_path / 'module.py'])
+
+    assert [entry.qualified_name for entry in report.entries] == ['module:function', 'package:setup']
+    assert all(entry.matched for entry in report.entries)
+
+
+@pytest.mark.parametrize('executor_class', [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_audit_with_executor(package, executor_class):
+    spec = {
+        'package:setup': '., debug',
+        'package.handlers.http:handle': '.',
+        'package.handlers.http:handle_error': 'error',
+        'package.handlers.http:missing': '.',
+        'package.broken:function': '.',
+    }
+
+    with executor_class(max_workers=2) as executor:
+        report = audit(spec, [package], executor=executor, chunksize=1)
+
+    expected = audit(spec, [package])
+
+    assert report.entries == expected.entries
+    assert report.missing == expected.missing
+    assert report.errors == expected.errors
+
+
+def test_audit_with_wrong_arguments(package):
+    with pytest.raises(ValueError, match=match('The qualified name must look like "module:Class.function". You used "package.setup".')):
+        audit({'package.setup': '.'}, [package])
+
+    with pytest.raises(ValueError, match=match('The chunk size must be a positive number.')):
+        audit({}, [package], chunksize=0)
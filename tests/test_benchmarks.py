@@ -0,0 +1,79 @@
+import json
+from io import StringIO
+
+import pytest
+from full_match import match
+
+from benchmarks.cases import Benchmark, make_benchmarks
+from benchmarks.runner import (
+    Result,
+    format_time,
+    load_baselines,
+    measure,
+    save_baselines,
+    write_report,
+)
+
+
+def test_all_benchmarks_can_run():
+    for benchmark in make_benchmarks():
+        benchmark.function()
+
+
+def test_benchmark_keys_are_unique():
+    keys = [Result(benchmark, 0.0).key for benchmark in make_benchmarks()]
+
+    assert len(keys) == len(set(keys))
+
+
+def test_measure():
+    result = measure(Benchmark('group', 'name', 1, lambda: None), repeat=1)
+
+    assert result.seconds > 0
+    assert result.key == 'group: name [1]'
+
+
+def test_save_and_load_baselines(tmp_path):
+    path = tmp_path / 'baselines.json'
+
+    assert load_baselines(path) == {}
+
+    save_baselines([Result(Benchmark('group', 'name', 1, lambda: None), 0.5)], path)
+    save_baselines([Result(Benchmark('group', 'name', 2, lambda: None), 1.5)], path)
+
+    assert load_baselines(path) == {'group: name [1]': 0.5, 'group: name [2]': 1.5}
+
+
+def test_load_baselines_of_other_version(tmp_path):
+    path = tmp_path / 'baselines.json'
+    path.write_text(json.dumps({'version': 100, 'results': {}}))
+
+    with pytest.raises(ValueError, match=match('The baselines file has version 100, but version 1 is expected.')):
+        load_baselines(path)
+
+
+def test_report_with_scaling_and_regressions():
+    results = [
+        Result(Benchmark('group', 'name', 1, lambda: None), 1e-6),
+        Result(Benchmark('group', 'name', 2, lambda: None), 4e-6),
+        Result(Benchmark('group', 'other', 1, lambda: None), 2e-3),
+    ]
+    output = StringIO()
+
+    regressions = write_report(results, {'group: name [2]': 2e-6, 'group: other [1]': 2e-3}, output, threshold=1.5)
+
+    assert regressions == [results[1]]
+    assert output.getvalue() == (
+        '\ngroup: name\n'
+        '  [    1]      1.00 µs\n'
+        '  [    2]      4.00 µs  x4.00 from the previous size  2.00 of the baseline  <- REGRESSION\n'
+        '\ngroup: other\n'
+        '  [    1]      2.00 ms  1.00 of the baseline\n'
+    )
+
+
+def test_format_time():
+    assert format_time(2.5) == '2.50 s'
+    assert format_time(0.0025) == '2.50 ms'
+    assert format_time(0.0000025) == '2.50 µs'
+    assert format_time(0.0000000025) == '2 ns'
@@ -0,0 +1,251 @@
+import gc
+from functools import partial, wraps
+from inspect import Parameter, Signature
+from threading import Thread
+
+import pytest
+from full_match import match
+
+from sigmatch import PossibleCallMatcher
+from sigmatch.cache import (
+    CacheInfo,
+    SignatureCache,
+    get_function_target,
+    signature_cache,
+)
+
+
+def test_wrong_maxsize():
+    with pytest.raises(ValueError, match=match('The maximum size of the cache must be a positive number.')):
+        SignatureCache(maxsize=0)
+
+    with pytest.raises(ValueError, match=match('The maximum size of the cache must be a positive number.')):
+        SignatureCache().resize(0)
+
+
+def test_hits_and_misses():
+    cache = SignatureCache()
+    calls = []
+
+    def function(a, b): ...
+
+    def factory(function):
+        calls.append(function)
+        return len(calls)
+
+    assert cache.get(function, factory) == 1
+    assert cache.get(function, factory) == 1
+    assert cache.get(function, factory) == 1
+
+    assert calls == [function]
+    assert cache.info() == CacheInfo(hits=2, misses=1, maxsize=1024, currsize=1)
+    assert len(cache) == 1
+
+
+def test_clear():
+    cache = SignatureCache()
+
+    def function(a, b): ...
+
+    cache.get(function, lambda x: 1)  # noqa: ARG005
+    cache.get(function, lambda x: 1)  # noqa: ARG005
+    cache.clear()
+
+    assert cache.info() == CacheInfo(hits=0, misses=0, maxsize=1024, currsize=0)
+
+
+def test_eviction_of_least_recently_used():
+    cache = SignatureCache(maxsize=2)
+
+    def function_1(): ...
+    def function_2(): ...
+    def function_3(): ...
+
+    cache.get(function_1, lambda x: 1)  # noqa: ARG005
+    cache.get(function_2, lambda x: 2)  # noqa: ARG005
+    cache.get(function_1, lambda x: 1)  # noqa: ARG005
+    cache.get(function_3, lambda x: 3)  # noqa: ARG005
+
+    assert len(cache) == 2
+    assert cache.get(function_1, lambda x: 100) == 1  # noqa: ARG005
+    assert cache.get(function_2, lambda x: 100) == 100  # noqa: ARG005
+
+
+def test_resize():
+    cache = SignatureCache(maxsize=3)
+
+    def function_1(): ...
+    def function_2(): ...
+    def function_3(): ...
+
+    for function in (function_1, function_2, function_3):
+        cache.get(function, lambda x: 1)  # noqa: ARG005
+
+    cache.resize(1)
+
+    assert cache.info() == CacheInfo(hits=0, misses=3, maxsize=1, currsize=1)
+    assert cache.get(function_3, lambda x: 100) == 1  # noqa: ARG005
+
+
+def test_functions_are_referenced_weakly():
+    cache = SignatureCache()
+
+    def function(): ...
+
+    cache.get(function, lambda x: 1)  # noqa: ARG005
+    assert len(cache) == 1
+
+    del function
+    gc.collect()
+
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize(
+    'mutate',
+    [
+        lambda function: setattr(function, '__defaults__', (1,)),
+        lambda function: setattr(function, '__kwdefaults__', {'c': 1}),
+        lambda function: setattr(function, '__code__', (lambda a, *, c: None).__code__),  # noqa: ARG005
+        lambda function: setattr(function, '__signature__', Signature([Parameter('a', Parameter.POSITIONAL_ONLY)])),
+    ],
+)
+def test_mutations_invalidate_entries(mutate):
+    cache = SignatureCache()
+
+    def function(a, *, c): ...
+
+    assert cache.get(function, lambda x: 1) == 1  # noqa: ARG005
+    mutate(function)
+    assert cache.get(function, lambda x: 2) == 2  # noqa: ARG005
+    assert cache.get(function, lambda x: 3) == 2  # noqa: ARG005
+
+
+def test_mutation_of_wrapped_function_invalidates_entry():
+    cache = SignatureCache()
+
+    def function(a): ...
+
+    @wraps(function)
+    def wrapper(*args, **kwargs): ...
+
+    assert cache.get(wrapper, lambda x: 1) == 1  # noqa: ARG005
+    function.__defaults__ = (1,)
+    assert cache.get(wrapper, lambda x: 2) == 2  # noqa: ARG005
+
+
+def test_bound_and_unbound_methods_are_different_entries():
+    cache = SignatureCache()
+
+    class SomeClass:
+        def method(self, a): ...
+
+    assert cache.get(SomeClass.method, lambda x: 'unbound') == 'unbound'  # noqa: ARG005
+    assert cache.get(SomeClass().method, lambda x: 'bound') == 'bound'  # noqa: ARG005
+    assert cache.get(SomeClass().method, lambda x: 'other') == 'bound'  # noqa: ARG005
+    assert cache.get(SomeClass.method, lambda x: 'other') == 'unbound'  # noqa: ARG005
+
+
+@pytest.mark.parametrize(
+    'get_callable',
+    [
+        lambda: partial(lambda a, b: None, 1),  # noqa: ARG005
+        lambda: type('SomeClass', (), {}),
+        lambda: next,
+        lambda: partial(lambda a, b: None, 1).__call__,  # noqa: ARG005
+    ],
+)
+def test_not_cacheable_callables_are_passed_to_factory(get_callable):
+    cache = SignatureCache()
+    some_callable = get_callable()
+
+    assert cache.get(some_callable, lambda x: 1) == 1  # noqa: ARG005
+    assert cache.get(some_callable, lambda x: 2) == 2  # noqa: ARG005
+    assert cache.info() == CacheInfo(hits=0, misses=0, maxsize=1024, currsize=0)
+
+
+def test_wrapped_non_functions_are_not_cached():
+    cache = SignatureCache()
+
+    @wraps(partial(lambda a, b: None, 1))  # noqa: ARG005
+    def wrapper(*args, **kwargs): ...
+
+    assert cache.get(wrapper, lambda x: 1) == 1  # noqa: ARG005
+    assert cache.get(wrapper, lambda x: 2) == 2  # noqa: ARG005
+
+
+def test_cyclic_wrapping_is_not_cached():
+    cache = SignatureCache()
+
+    def function(): ...
+
+    function.__wrapped__ = function
+
+    assert cache.get(function, lambda x: 1) == 1  # noqa: ARG005
+    assert cache.get(function, lambda x: 2) == 2  # noqa: ARG005
+
+
+def test_matcher_uses_global_cache():
+    def function(a, b): ...
+
+    signature_cache.clear()
+
+    assert PossibleCallMatcher('..').match(function)
+    assert PossibleCallMatcher('., b').match(function)
+    assert not PossibleCallMatcher('...').match(function)
+
+    assert signature_cache.info().hits == 2
+    assert signature_cache.info().misses == 1
+
+
+def test_matcher_notices_changed_defaults():
+    def function(a, b): ...
+
+    assert not PossibleCallMatcher('.').match(function)
+    function.__defaults__ = (1,)
+    assert PossibleCallMatcher('.').match(function)
+
+
+def test_concurrent_access():
+    cache = SignatureCache(maxsize=8)
+    functions = [(lambda: None) for _ in range(32)]
+    errors = []
+
+    def worker():
+        try:
+            for _ in range(50):
+                for index, function in enumerate(functions):
+                    assert cache.get(function, lambda x, index=index: index) == index  # noqa: ARG005
+        except AssertionError as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len(cache) == 8
+
+
+def test_get_function_target():
+    def function(a): ...
+
+    @wraps(function)
+    def wrapper(*args, **kwargs): ...
+
+    class SomeClass:
+        def method(self): ...
+
+    some_object = SomeClass()
+
+    assert get_function_target(function) == (function, False)
+    assert get_function_target(function, only_plain=True) == (function, False)
+    assert get_function_target(some_object.method) == (SomeClass.method, True)
+    assert get_function_target(some_object.method, only_plain=True) == (SomeClass.method, True)
+    assert get_function_target(wrapper) == (wrapper, False)
+    assert get_function_target(wrapper, only_plain=True) == (None, False)
+    assert get_function_target(partial(function, 1)) == (None, False)
+    assert get_function_target(len) == (None, False)
+    assert get_function_target([].append) == (None, False)
@@ -0,0 +1,199 @@
+from itertools import islice
+
+import pytest
+from full_match import match
+
+from sigmatch import (
+    CallSet,
+    PossibleCallMatcher,
+    SignatureNotFoundError,
+    SignatureSeriesMatcher,
+)
+from sigmatch.call_set import CallSetLayout
+from tests.small_signatures import make_all_small_functions
+
+SMALL_FUNCTIONS = list(make_all_small_functions())[::4]
+TINY_FUNCTIONS = list(make_all_small_functions('ab'))
+
+
+def test_call_set_is_the_same_as_series():
+    for function in SMALL_FUNCTIONS:
+        series = PossibleCallMatcher.from_callable(function)
+        call_set = CallSet.from_callable(function)
+        matchers = list(call_set)
+
+        assert len(call_set) == len(series)
+        assert len(matchers) == len(set(matchers))
+        assert set(matchers) == set(series)
+        assert call_set == series
+        assert series == call_set
+        assert series in call_set
+        assert all(matcher in call_set for matcher in series)
+        assert call_set.to_series() == series
+
+
+def test_relations_are_the_same_as_for_series():
+    series = [PossibleCallMatcher.from_callable(function) for function in TINY_FUNCTIONS[::3]]
+    call_sets = [CallSet.from_callable(function) for function in TINY_FUNCTIONS[::3]]
+
+    for first_series, first_call_set in zip(series, call_sets):
+        for second_series, second_call_set in zip(series, call_sets):
+            intersection = first_series & second_series
+            call_set_intersection = first_call_set & second_call_set
+
+            assert (first_call_set in second_call_set) == (first_series in second_series)
+            assert (first_call_set == second_call_set) == (first_series == second_series)
+            assert bool(call_set_intersection) == bool(intersection)
+            assert len(call_set_intersection) == len(intersection)
+            assert call_set_intersection == intersection
+            assert call_set_intersection in first_call_set
+            assert (first_call_set in call_set_intersection) == (first_series in intersection)
+
+
+def test_relations_of_intersections_are_the_same_as_for_series():
+    series = [PossibleCallMatcher.from_callable(function) for function in TINY_FUNCTIONS[::9]]
+    call_sets = [CallSet.from_callable(function) for function in TINY_FUNCTIONS[::9]]
+
+    for first_index in range(len(series)):
+        for second_index in range(len(series)):
+            for third_index in range(0, len(series), 3):
+                intersection = series[first_index] & series[second_index]
+                call_set_intersection = call_sets[first_index] & call_sets[second_index]
+
+                assert (call_set_intersection in call_sets[third_index]) == (intersection in series[third_index])
+                assert (call_set_intersection in (call_sets[third_index] & call_sets[first_index])) == (intersection in (series[third_index] & series[first_index]))
+                assert (call_set_intersection == (call_sets[third_index] & call_sets[second_index])) == (intersection == (series[third_index] & series[second_index]))
+                assert set(call_set_intersection & call_sets[third_index]) == set(intersection & series[third_index])
+                assert bool(call_set_intersection & call_sets[third_index]) == bool(intersection & series[third_index])
+
+
+def test_empty_call_set():
+    assert CallSet.from_callable(__build_class__) == CallSet()
+    assert CallSet.from_callable(__build_class__) == SignatureSeriesMatcher()
+    assert not CallSet()
+    assert len(CallSet()) == 0
+    assert list(CallSet()) == []
+    assert PossibleCallMatcher() not in CallSet()
+    assert CallSet() in CallSet()
+    assert CallSet() in CallSet.from_callable(lambda: None)
+    assert CallSet.from_callable(lambda: None) not in CallSet()
+    assert (CallSet.from_callable(lambda a: None) & CallSet.from_callable(lambda a, b=None: None)) not in CallSet()  # noqa: ARG005
+    assert (CallSet.from_callable(lambda a: None) & CallSet.from_callable(lambda a, b: None)) in CallSet()  # noqa: ARG005
+    assert not (CallSet() & CallSet.from_callable(lambda: None))
+    assert not (CallSet.from_callable(lambda: None) & CallSet())
+
+
+def test_from_callable_when_callable_is_wrong():
+    with pytest.raises(SignatureNotFoundError, match=match('For some functions, it is not possible to extract the signature, and this is one of them.')):
+        CallSet.from_callable(__build_class__, raise_exception=True)
+
+
+def test_contains_other_objects():
+    call_set = CallSet.from_callable(lambda a: None)  # noqa: ARG005
+
+    assert 1 not in call_set
+    assert '.' not in call_set
+    assert PossibleCallMatcher('.') in call_set
+    assert PossibleCallMatcher('a') in call_set
+    assert PossibleCallMatcher('..') not in call_set
+    assert PossibleCallMatcher('.') + PossibleCallMatcher('a') in call_set
+    assert PossibleCallMatcher('.') + PossibleCallMatcher('b') not in call_set
+
+
+def test_eq_other_objects():
+    call_set = CallSet.from_callable(lambda a: None)  # noqa: ARG005
+
+    assert call_set != 1
+    assert call_set != 'kek'
+    assert call_set != PossibleCallMatcher('.')
+    assert CallSet.from_callable(lambda: None) == PossibleCallMatcher()
+    assert call_set == PossibleCallMatcher('.') + PossibleCallMatcher('a')
+
+
+def test_and_with_matchers():
+    call_set = CallSet.from_callable(lambda a, b=None: None)  # noqa: ARG005
+
+    assert call_set & PossibleCallMatcher('.') == SignatureSeriesMatcher(PossibleCallMatcher('.'))
+    assert call_set & (PossibleCallMatcher('.') + PossibleCallMatcher('...') + PossibleCallMatcher('a, b')) == PossibleCallMatcher('.') + PossibleCallMatcher('a, b')
+
+    with pytest.raises(TypeError):
+        call_set & 1
+
+
+def test_and_with_matchers_on_the_left():
+    call_set = CallSet.from_callable(lambda a, b=None: None)  # noqa: ARG005
+    series = PossibleCallMatcher('.') + PossibleCallMatcher('...') + PossibleCallMatcher('a, b')
+
+    assert PossibleCallMatcher('.') & call_set == SignatureSeriesMatcher(PossibleCallMatcher('.'))
+    assert PossibleCallMatcher('...') & call_set == SignatureSeriesMatcher()
+    assert series & call_set == call_set & series == PossibleCallMatcher('.') + PossibleCallMatcher('a, b')
+
+    with pytest.raises(TypeError):
+        PossibleCallMatcher('.') & 1
+    with pytest.raises(TypeError):
+        1 & series
+
+
+def test_call_set_in_series():
+    call_set = CallSet.from_callable(lambda a: None)  # noqa: ARG005
+    series = call_set.to_series()
+
+    assert call_set in series
+    assert series in call_set
+    assert call_set in series + PossibleCallMatcher('..')
+    assert call_set not in PossibleCallMatcher('.') + PossibleCallMatcher('b')
+    assert call_set not in SignatureSeriesMatcher(PossibleCallMatcher('.'))
+    assert CallSet() in SignatureSeriesMatcher()
+    assert CallSet.from_callable(lambda: None) not in SignatureSeriesMatcher()
+
+    for function in SMALL_FUNCTIONS:
+        call_set = CallSet.from_callable(function)
+        series = PossibleCallMatcher.from_callable(function)
+
+        assert call_set in series
+        assert (call_set in series) == (call_set == series) == (series in call_set)
+
+
+def test_hash():
+    first = CallSet.from_callable(lambda a, b: None)  # noqa: ARG005
+    second = CallSet.from_callable(lambda a, b: None)  # noqa: ARG005
+
+    assert hash(first) == hash(second)
+    assert {first: 'kek'}[second] == 'kek'
+
+
+def test_repr():
+    assert repr(CallSet()) == 'CallSet()'
+    assert repr(CallSet.from_callable(lambda b, a, /, c=None, *args, d, **kwargs: None)) == "CallSet(CallSetLayout(number_of_position_args=2, required_named_or_positional=[], optional_named_or_positional=['c'], required_only_named=['d'], optional_only_named=[], is_args=True, is_kwargs=True))"  # noqa: ARG005
+
+
+def test_layout_from_baskets():
+    def function(a, b, /, c, d=None, *args, e, f=None, **kwargs): ...  # noqa: PLR0913
+
+    assert CallSetLayout.from_baskets(PossibleCallMatcher._get_baskets(function)) == CallSetLayout(
+        number_of_position_args=2,
+        required_named_or_positional=frozenset({'c'}),
+        optional_named_or_positional=frozenset({'d'}),
+        required_only_named=frozenset({'e'}),
+        optional_only_named=frozenset({'f'}),
+        is_args=True,
+        is_kwargs=True,
+    )
+
+
+def test_big_call_sets_are_not_enumerated():
+    names = [f'option_{index}' for index in range(40)]
+    function = eval(f'lambda a, b, {", ".join(name + "=None" for name in names)}, *args, **kwargs: None')
+    other_function = eval(f'lambda a, b, {", ".join(name + "=None" for name in names[:-1])}, *args, **kwargs: None')
+
+    call_set = CallSet.from_callable(function)
+    other_call_set = CallSet.from_callable(other_function)
+
+    assert len(call_set) == 2 ** 2 * 2 ** 39 * 42 * 4
+    assert other_call_set in call_set
+    assert call_set not in other_call_set
+    assert call_set != other_call_set
+    assert call_set & other_call_set
+    assert PossibleCallMatcher('..', *names, '*', '**') in call_set
+    assert PossibleCallMatcher('..', *names, '*', '**') not in other_call_set
+    assert len(list(islice(call_set, 100))) == 100
@@ -0,0 +1,98 @@
+import subprocess
+import sys
+
+import pytest
+from full_match import match
+
+import sigmatch
+
+
+def get_loaded_modules(code):
+    result = subprocess.run(
+        [sys.executable, '-c', f'import sys\n{code}\nprint(" ".join(sys.modules))'],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize(
+    'code',
+    [
+        'import sigmatch',
+        'from sigmatch import SignatureError',
+        'from sigmatch import PossibleCallMatcher; PossibleCallMatcher("., a") + PossibleCallMatcher("..")',
+        'from sigmatch import CallSet, CallableRegistry, CallShape, is_equivalent, stats',
+    ],
+)
+def test_heavy_modules_are_not_imported(code):
+    modules = get_loaded_modules(code)
+
+    assert 'printo' not in modules
+    assert 'inspect' not in modules
+    assert 'dataclasses' not in modules
+    assert 'concurrent.futures' not in modules
+
+
+def test_import_of_package_does_not_import_matchers():
+    modules = get_loaded_modules('import sigmatch')
+
+    assert 'sigmatch.matchers.possible_call' not in modules
+    assert 'sigmatch.call_set' not in modules
+
+
+def test_heavy_modules_are_imported_when_they_are_needed():
+    assert 'printo' in get_loaded_modules('from sigmatch import PossibleCallMatcher; repr(PossibleCallMatcher())')
+    assert 'inspect' in get_loaded_modules('from sigmatch import PossibleCallMatcher; PossibleCallMatcher().match(__build_class__)')
+
+
+def test_plain_functions_are_read_without_inspect():
+    assert 'inspect' not in get_loaded_modules('from sigmatch import PossibleCallMatcher; PossibleCallMatcher(".").match(lambda a: None)')
+
+
+def test_lazy_names_are_the_same_as_in_modules():
+    from sigmatch.call_set import CallSet  # noqa: PLC0415
+    from sigmatch.instrumentation import stats  # noqa: PLC0415
+    from sigmatch.matchers.possible_call import PossibleCallMatcher  # noqa: PLC0415
+
+    assert sigmatch.CallSet is CallSet
+    assert sigmatch.stats is stats
+    assert sigmatch.PossibleCallMatcher is PossibleCallMatcher
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match=match("module 'sigmatch' has no attribute 'kek'")):
+        sigmatch.kek  # noqa: B018
+
+
+def test_dir_contains_lazy_names():
+    names = dir(sigmatch)
+
+    assert 'PossibleCallMatcher' in names
+    assert 'CallSet' in names
+    assert 'SignatureError' in names
+
+
+def test_star_import():
+    namespace = {}
+    exec('from sigmatch import *', namespace)
+
+    assert set(namespace) - {'__builtins__'} == set(sigmatch.__all__)
+    assert namespace['PossibleCallMatcher'] is sigmatch.PossibleCallMatcher
+    assert namespace['SignatureSeriesMatcher'] is sigmatch.SignatureSeriesMatcher
+    assert namespace['SignatureNotFoundError'] is sigmatch.SignatureNotFoundError
+    assert 'import_module' not in namespace
+    assert 'TYPE_CHECKING' not in namespace
+
+
+def test_all_contains_errors_and_lazy_names():
+    assert set(sigmatch.__all__) == {
+        'IncorrectArgumentsOrderError',
+        'SignatureError',
+        'SignatureMismatchError',
+        'SignatureNotFoundError',
+        'UnsupportedSignatureError',
+        *sigmatch._LAZY_NAMES,
+    }
+    assert all(hasattr(sigmatch, name) for name in sigmatch.__all__)
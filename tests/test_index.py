@@ -0,0 +1,174 @@
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from full_match import match
+
+from sigmatch import PossibleCallMatcher, Reason
+from sigmatch.audit import audit
+from sigmatch.index import IndexUpdate, ParsingTask, SignatureIndex, parse_module
+from sigmatch.known_signatures import parse_signature
+from sigmatch.static import StaticSignature
+
+
+@pytest.fixture
+def package(tmp_path):
+    root = tmp_path / 'package'
+    root.mkdir()
+    (root / '__init__.py').write_text('def setup(app, *, debug=False): ...\n')
+    (root / 'handlers.py').write_text('''
+def handle(request, response=None): ...
+
+def handle_all(*requests, **options): ...
+
+class Handler:
+    def __call__(self, request): ...
+
+    def broken(): ...
+''')
+    (root / 'broken.py').write_text('def function(: ...\n')
+    return root
+
+
+def touch(path, content):
+    stat = path.stat()
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_update_and_lookup(package):
+    with SignatureIndex() as index:
+        assert index.update([package]) == IndexUpdate(parsed=3, skipped=0, removed=0)
+
+        assert len(index) == 5
+        assert 'package.handlers:handle' in index
+        assert 'package.handlers:unknown' not in index
+        assert index['package.handlers:Handler.__call__'] == StaticSignature('package.handlers:Handler.__call__', parse_signature('(self, request)'), 7, is_method=True)
+        assert index['package:setup'] == StaticSignature('package:setup', parse_signature('(app, *, debug=False)'), 1)
+        assert index['package:setup'].baskets is index['package:setup'].baskets
+
+        assert [path for path, _ in index.errors] == [str(package / 'broken.py')]
+        assert index.errors[0][1].startswith('SyntaxError: ')
+
+        with pytest.raises(KeyError):
+            index['package.handlers:unknown']
+
+
+def test_unchanged_files_are_skipped(package, tmp_path):
+    path = tmp_path / 'index.sqlite'
+
+    with SignatureIndex(path) as index:
+        assert index.update([package]) == IndexUpdate(parsed=3, skipped=0, removed=0)
+
+    with SignatureIndex(path) as index:
+        assert index.update([package]) == IndexUpdate(parsed=0, skipped=3, removed=0)
+        assert len(index) == 5
+
+        touch(package / '__init__.py', 'def setup(app, *, debug=False): ...\n')
+        assert index.update([package]) == IndexUpdate(parsed=0, skipped=3, removed=0)
+
+        touch(package / '__init__.py', 'def setup(app, debug=False): ...\n')
+        assert index.update([package]) == IndexUpdate(parsed=1, skipped=2, removed=0)
+        assert index['package:setup'].baskets == parse_signature('(app, debug=False)')
+
+        (package / 'handlers.py').unlink()
+        assert index.update([package]) == IndexUpdate(parsed=0, skipped=2, removed=1)
+        assert len(index) == 1
+        assert 'package.handlers:handle' not in index
+
+
+def test_index_with_another_schema_is_rebuilt(package, tmp_path):
+    path = tmp_path / 'index.sqlite'
+
+    with SignatureIndex(path) as index:
+        index.update([package])
+
+    connection = sqlite3.connect(str(path))
+    connection.execute('PRAGMA user_version = 100')
+    connection.close()
+
+    with SignatureIndex(path) as index:
+        assert len(index) == 0
+        assert index.update([package]) == IndexUpdate(parsed=3, skipped=0, removed=0)
+
+
+def test_find(package):
+    with SignatureIndex() as index:
+        index.update([package])
+
+        assert [signature.qualified_name for signature in index.find(PossibleCallMatcher('.'))] == ['package.handlers:Handler.__call__', 'package.handlers:handle', 'package.handlers:handle_all', 'package:setup']
+        assert [signature.qualified_name for signature in index.find(PossibleCallMatcher('.., request'))] == ['package.handlers:handle_all']
+        assert [signature.qualified_name for signature in index.find(PossibleCallMatcher('., response'))] == ['package.handlers:handle', 'package.handlers:handle_all']
+        assert [signature.qualified_name for signature in index.find(PossibleCallMatcher('...'))] == ['package.handlers:handle_all']
+        assert [signature.qualified_name for signature in index.find(PossibleCallMatcher('*, **'))] == ['package.handlers:handle_all']
+        assert [signature.qualified_name for signature in index.find(PossibleCallMatcher(''))] == ['package.handlers:handle_all']
+
+
+def test_find_is_the_same_as_matching_each_signature(package):
+    with SignatureIndex() as index:
+        index.update([package])
+        signatures = [index[name] for name in ('package:setup', 'package.handlers:handle', 'package.handlers:handle_all', 'package.handlers:Handler.__call__')]
+
+        for matcher in (PossibleCallMatcher(signature) for signature in ('', '.', '..', '., debug', 'request', '*', '**', '., *, **')):
+            assert index.find(matcher) == [signature for signature in sorted(signatures) if matcher.match(signature.bind() if signature.is_method else signature)]
+
+
+def test_audit(package):
+    spec = {
+        'package:setup': '., debug',
+        'package.handlers:handle': 'request, response',
+        'package.handlers:Handler.__call__': '..',
+        'package.handlers:Handler.broken': '',
+        'package.handlers:unknown': '',
+        'package.broken:function': '.',
+    }
+
+    with SignatureIndex() as index:
+        index.update([package])
+        report = index.audit(spec)
+
+    expected = audit(spec, [package])
+
+    assert report.entries == expected.entries
+    assert report.missing == expected.missing == ['package.handlers:unknown']
+    assert report.errors == expected.errors
+    assert [entry.reason for entry in report.failed] == [Reason.TOO_MANY_POSITIONAL_ARGUMENTS, Reason.SIGNATURE_NOT_FOUND]
+
+
+def test_audit_with_many_names(package):
+    spec = {f'package.handlers:function_{index}': '.' for index in range(1000)}
+    spec['package:setup'] = '.'
+
+    with SignatureIndex() as index:
+        index.update([package])
+
+        assert index.audit({})
+        report = index.audit(spec)
+
+    assert [entry.qualified_name for entry in report.entries] == ['package:setup']
+    assert len(report.missing) == 1000
+
+
+def test_update_with_executor(package):
+    with SignatureIndex() as index, ProcessPoolExecutor(max_workers=2) as executor:
+        assert index.update([package], executor=executor, chunksize=1) == IndexUpdate(parsed=3, skipped=0, removed=0)
+        assert len(index) == 5
+
+
+def test_update_with_missing_paths(tmp_path):
+    with SignatureIndex() as index:
+        assert index.update([tmp_path / 'module.py']) == IndexUpdate(parsed=0, skipped=0, removed=0)
+
+
+def test_parse_missing_module(tmp_path):
+    result = parse_module(ParsingTask('module', str(tmp_path / 'module.py')))
+
+    assert result.digest == ''
+    assert result.rows == []
+    assert result.error.startswith('FileNotFoundError: ')
+
+
+def test_update_with_wrong_chunksize(package):
+    with SignatureIndex() as index, pytest.raises(ValueError, match=match('The chunk size must be a positive number.')):
+        index.update([package], chunksize=0)
@@ -0,0 +1,197 @@
+from functools import partial
+from threading import Event, Thread
+
+import pytest
+from full_match import match
+
+from sigmatch import PossibleCallMatcher, SignatureSeriesMatcher, stats
+from sigmatch.cache import signature_cache
+from sigmatch.instrumentation import Stats
+from sigmatch.known_signatures import known_signatures, parse_signature
+from sigmatch.static import StaticSignature
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    signature_cache.clear()
+    known_signatures.clear()
+    stats.disable()
+    stats.reset()
+    yield
+    stats.disable()
+    stats.reset()
+
+
+def test_disabled_stats_are_not_collected():
+    PossibleCallMatcher('.').match(lambda a: None)  # noqa: ARG005
+    PossibleCallMatcher.from_callable(lambda a: None)  # noqa: ARG005
+
+    assert stats.to_dict() == Stats().to_dict()
+    assert stats.to_dict() == {
+        'signature_lookups': 0,
+        'cache_hits': 0,
+        'signature_extractions': 0,
+        'signature_not_found': 0,
+        'inspect_seconds': 0.0,
+        'baskets_seconds': 0.0,
+        'matches': {},
+        'from_callable': {'count': 0, 'total_size': 0, 'max_size': 0},
+        'cache_hit_rate': None,
+    }
+
+
+def test_collect_stats():
+    def function(a, b=None): ...
+
+    with stats.collect() as collected:
+        assert PossibleCallMatcher('.').match(function)
+        assert PossibleCallMatcher('..').match(function)
+        assert not (PossibleCallMatcher('...') + PossibleCallMatcher('....')).match(function)
+        assert not PossibleCallMatcher('.').match(__build_class__)
+        assert not PossibleCallMatcher('.').match(1)
+        assert len(PossibleCallMatcher.from_callable(function)) == 6
+        assert len(PossibleCallMatcher.from_callable(lambda: None)) == 1
+
+    assert not stats.enabled
+    assert stats.to_dict() == Stats().to_dict()
+
+    result = collected.to_dict()
+
+    assert result['signature_lookups'] == 6
+    assert result['cache_hits'] == 3
+    assert result['signature_extractions'] == 3
+    assert result['signature_not_found'] == 1
+    assert result['cache_hit_rate'] == 0.5
+    assert result['inspect_seconds'] > 0
+    assert result['baskets_seconds'] > 0
+    assert result['matches']['PossibleCallMatcher']['count'] == 4
+    assert result['matches']['PossibleCallMatcher']['seconds'] > 0
+    assert result['matches']['SignatureSeriesMatcher']['count'] == 1
+    assert result['from_callable'] == {'count': 2, 'total_size': 7, 'max_size': 6}
+
+
+def test_match_is_recorded_when_it_raises():
+    with stats.collect() as collected, pytest.raises(ValueError, match=match('It is impossible to determine the signature of an object that is not being callable.')):
+        PossibleCallMatcher('.').match(1, raise_exception=True)
+
+    assert collected.to_dict()['matches']['PossibleCallMatcher']['count'] == 1
+
+
+def test_not_cached_callables_are_extracted_every_time():
+    function = partial(lambda a, b: None, 1)  # noqa: ARG005
+
+    with stats.collect() as collected:
+        for _ in range(3):
+            PossibleCallMatcher('.').match(function)
+
+    assert collected.to_dict()['signature_extractions'] == 3
+    assert collected.to_dict()['cache_hit_rate'] == 0.0
+
+
+def test_collect_restores_previous_state():
+    stats.enable()
+
+    with stats.collect() as collected:
+        assert collected is not stats
+
+    assert stats.enabled
+
+    stats.disable()
+
+    with stats.collect():
+        assert stats.enabled
+
+    assert not stats.enabled
+
+
+def test_nested_collect_does_not_reset_outer_counters():
+    def function(a): ...
+
+    stats.enable()
+
+    with stats.collect() as outer:
+        PossibleCallMatcher('.').match(function)
+
+        with stats.collect() as inner:
+            PossibleCallMatcher('..').match(function)
+
+        PossibleCallMatcher('a').match(function)
+
+    assert inner.to_dict()['matches']['PossibleCallMatcher']['count'] == 1
+    assert outer.to_dict()['matches']['PossibleCallMatcher']['count'] == 3
+    assert stats.to_dict()['matches']['PossibleCallMatcher']['count'] == 3
+
+
+def test_collect_in_another_thread_does_not_reset_counters():
+    def function(a): ...
+
+    started = Event()
+    finished = Event()
+
+    def collect_in_thread():
+        with stats.collect():
+            started.set()
+            finished.wait()
+
+    thread = Thread(target=collect_in_thread)
+
+    with stats.collect() as collected:
+        PossibleCallMatcher('.').match(function)
+        thread.start()
+        started.wait()
+        PossibleCallMatcher('.').match(function)
+        finished.set()
+        thread.join()
+        PossibleCallMatcher('.').match(function)
+
+    assert collected.to_dict()['matches']['PossibleCallMatcher']['count'] == 3
+    assert not stats.enabled
+
+
+def test_cache_hits_are_counted_where_they_happen():
+    def function(a): ...
+
+    signature = StaticSignature('module:function', parse_signature('(a)'), 1)
+
+    with stats.collect() as collected:
+        for _ in range(3):
+            PossibleCallMatcher('.').match(signature)
+            PossibleCallMatcher('.').match(next)
+
+    assert collected.to_dict()['signature_lookups'] == 6
+    assert collected.to_dict()['cache_hits'] == 0
+    assert collected.to_dict()['cache_hit_rate'] is None
+
+    with stats.collect() as collected:
+        for _ in range(3):
+            PossibleCallMatcher('.').match(function)
+            PossibleCallMatcher('.').match([].append)
+
+    assert collected.to_dict()['signature_extractions'] == 2
+    assert collected.to_dict()['cache_hits'] == 4
+    assert collected.to_dict()['cache_hit_rate'] == 4 / 6
+
+
+def test_enable_disable_and_reset():
+    stats.enable()
+    PossibleCallMatcher('.').match(lambda a: None)  # noqa: ARG005
+    stats.disable()
+    PossibleCallMatcher('.').match(lambda a: None)  # noqa: ARG005
+
+    assert stats.to_dict()['matches'] == {'PossibleCallMatcher': {'count': 1, 'seconds': stats.to_dict()['matches']['PossibleCallMatcher']['seconds']}}
+
+    stats.reset()
+
+    assert stats.to_dict()['matches'] == {}
+
+
+def test_to_dict_returns_a_copy():
+    with stats.collect() as collected:
+        SignatureSeriesMatcher().match(lambda: None)
+
+    result = collected.to_dict()
+    result['matches']['SignatureSeriesMatcher']['count'] = 100
+    result['from_callable']['count'] = 100
+
+    assert collected.to_dict()['matches']['SignatureSeriesMatcher']['count'] == 1
+    assert collected.to_dict()['from_callable']['count'] == 0
@@ -0,0 +1,252 @@
+import builtins
+import sys
+
+import pytest
+from full_match import match
+
+from sigmatch import PossibleCallMatcher, SignatureNotFoundError
+from sigmatch.known_signatures import (
+    BUILTIN_SIGNATURES,
+    KnownSignatures,
+    known_signatures,
+    parse_signature,
+)
+
+
+def make_counting_factory(calls):
+    def factory(function):
+        calls.append(function)
+        return PossibleCallMatcher._inspect_baskets(function)
+
+    return factory
+
+
+def test_wrong_maxsize():
+    with pytest.raises(ValueError, match=match('The maximum size of the cache must be a positive number.')):
+        KnownSignatures(maxsize=0)
+
+
+def test_builtins_from_the_table():
+    assert PossibleCallMatcher('.').match(next)
+    assert PossibleCallMatcher('..').match(next)
+    assert not PossibleCallMatcher('...').match(next)
+    assert not PossibleCallMatcher().match(next)
+    assert not PossibleCallMatcher('., default').match(next)
+
+    assert PossibleCallMatcher('.').match(int)
+    assert PossibleCallMatcher('., base').match(int)
+    assert not PossibleCallMatcher('x').match(int)
+
+    assert PossibleCallMatcher('., key, *').match(max)
+    assert PossibleCallMatcher('object').match(str)
+
+
+def test_all_signatures_from_the_table_are_used():
+    for name, signature in BUILTIN_SIGNATURES.items():
+        if hasattr(builtins, name):
+            assert PossibleCallMatcher._get_baskets(getattr(builtins, name)) == parse_signature(signature)
+
+
+class AsyncIterator:
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        raise StopAsyncIteration
+
+
+class WithOptions:
+    def __init_subclass__(cls, **kwargs): ...
+
+
+REAL_CALLS = {
+    'anext': [((AsyncIterator(),), {}), ((AsyncIterator(), None), {}), ((), {}), ((AsyncIterator(), None, None), {}), ((), {'aiterator': AsyncIterator()})],
+    'bool': [((), {}), ((1,), {}), ((1, 2), {}), ((), {'x': 1})],
+    'breakpoint': [((), {}), ((1, 2), {'a': 3})],
+    'bytearray': [((), {}), ((b'x',), {}), (('x', 'utf-8'), {}), (('x', 'utf-8', 'strict'), {}), ((), {'source': 'x', 'encoding': 'utf-8'}), (('x',), {'encoding': 'utf-8', 'errors': 'strict'}), (('x', 'utf-8', 'strict', 1), {}), ((), {'other': 1})],
+    'bytes': [((), {}), ((b'x',), {}), (('x', 'utf-8'), {}), (('x', 'utf-8', 'strict'), {}), ((), {'source': 'x', 'encoding': 'utf-8'}), (('x',), {'encoding': 'utf-8', 'errors': 'strict'}), (('x', 'utf-8', 'strict', 1), {}), ((), {'other': 1})],
+    'classmethod': [((len,), {}), ((), {}), ((len, len), {}), ((), {'function': len})],
+    'dict': [((), {}), (({},), {}), (({},), {'a': 1}), ((), {'a': 1}), (({}, {}), {}), ((), {'mapping': {}})],
+    'dir': [((), {}), ((1,), {}), ((1, 2), {}), ((), {'object': 1})],
+    'filter': [((None, [1]), {}), ((None,), {}), ((None, [1], [1]), {}), ((), {'function': None, 'iterable': [1]})],
+    'frozenset': [((), {}), (([1],), {}), (([1], [1]), {}), ((), {'iterable': [1]})],
+    'getattr': [((1, 'real'), {}), ((1, 'real', None), {}), ((1,), {}), ((1, 'real', None, None), {}), ((1,), {'name': 'real'})],
+    'int': [((), {}), (('10',), {}), (('10', 10), {}), (('10',), {'base': 10}), (('10', 10, 10), {}), ((), {'x': '10'})],
+    'iter': [(([1],), {}), ((len, None), {}), ((), {}), ((len, None, None), {}), ((), {'object': [1]})],
+    'map': [((len, ['a']), {}), ((len, ['a'], ['b']), {}), ((len,), {}), ((), {'function': len, 'iterable': ['a']})],
+    'max': [(([1],), {}), ((1, 2), {}), ((1, 2), {'key': None}), (([1],), {'key': None, 'default': None}), (([1],), {'default': None}), ((), {}), ((), {'iterable': [1]}), (([1],), {'other': 1})],
+    'min': [(([1],), {}), ((1, 2), {}), ((1, 2), {'key': None}), (([1],), {'key': None, 'default': None}), (([1],), {'default': None}), ((), {}), ((), {'iterable': [1]}), (([1],), {'other': 1})],
+    'next': [((iter([1]),), {}), ((iter([1]), None), {}), ((), {}), ((iter([1]), None, None), {}), ((), {'iterator': iter([1])})],
+    'range': [((1,), {}), ((1, 2), {}), ((1, 2, 1), {}), ((), {}), ((1, 2, 1, 1), {}), ((), {'stop': 1})],
+    'set': [((), {}), (([1],), {}), (([1], [1]), {}), ((), {'iterable': [1]})],
+    'slice': [((1,), {}), ((1, 2), {}), ((1, 2, 1), {}), ((), {}), ((1, 2, 1, 1), {}), ((), {'stop': 1})],
+    'staticmethod': [((len,), {}), ((), {}), ((len, len), {}), ((), {'function': len})],
+    'str': [((), {}), ((1,), {}), ((b'x', 'utf-8'), {}), ((b'x', 'utf-8', 'strict'), {}), ((), {'object': b'x', 'encoding': 'utf-8', 'errors': 'strict'}), ((), {'encoding': 'utf-8'}), ((b'x', 'utf-8', 'strict', 1), {}), ((), {'other': 1})],
+    'super': [((), {}), ((int,), {}), ((int, 1), {}), ((int, 1, 1), {}), ((), {'type': int})],
+    'type': [((1,), {}), (('Name', (), {}), {}), (('Name', (WithOptions,), {}), {'other': 1}), ((), {}), (('Name', (), {}, 1), {}), ((), {'object_or_name': 1})],
+    'vars': [((), {}), ((int,), {}), ((int, int), {}), ((), {'object': int})],
+    'zip': [((), {}), (([1], [2]), {}), ((), {'other': 1}), (([1], [2]), {'strict': True})],
+}
+
+WIDER_THAN_REAL_CALLS = {
+    'bytearray': [((), {'encoding': 'utf-8'}), ((), {'errors': 'strict'}), ((), {'encoding': 'utf-8', 'errors': 'strict'})],
+    'bytes': [((), {'encoding': 'utf-8'}), ((), {'errors': 'strict'}), ((), {'encoding': 'utf-8', 'errors': 'strict'})],
+    'int': [((), {'base': 10})],
+    'max': [((1, 2), {'default': None})],
+    'min': [((1, 2), {'default': None})],
+    'type': [(('Name', ()), {}), ((1,), {'other': 1})],
+}
+
+
+def is_possible_call(function, args, kwargs):
+    try:
+        result = function(*args, **kwargs)
+    except TypeError:
+        return False
+    except RuntimeError:
+        return True
+    if hasattr(result, 'close'):
+        result.close()
+    return True
+
+
+@pytest.mark.parametrize('name', list(BUILTIN_SIGNATURES))
+def test_signatures_from_the_table_match_real_calls(name, monkeypatch):
+    if not hasattr(builtins, name):
+        pytest.skip(f'There is no built-in "{name}" in this version of Python.')
+
+    monkeypatch.setattr(sys, 'breakpointhook', lambda *args, **kwargs: None)  # noqa: ARG005
+    function = getattr(builtins, name)
+
+    for args, kwargs in REAL_CALLS[name]:
+        assert PossibleCallMatcher.from_call(args, kwargs).match(function) == is_possible_call(function, args, kwargs), (args, kwargs)
+
+    for args, kwargs in WIDER_THAN_REAL_CALLS.get(name, []):
+        assert PossibleCallMatcher.from_call(args, kwargs).match(function), (args, kwargs)
+        assert not is_possible_call(function, args, kwargs), (args, kwargs)
+
+
+def test_text_signatures_are_read_once():
+    signatures = KnownSignatures()
+    calls = []
+    factory = make_counting_factory(calls)
+
+    assert signatures.get([].append, factory) == parse_signature('(object, /)')
+    assert signatures.get([1, 2, 3].append, factory) == parse_signature('(object, /)')
+    assert signatures.get(list.append, factory) == parse_signature('(self, object, /)')
+    assert signatures.get(list.append, factory) == parse_signature('(self, object, /)')
+
+    assert len(calls) == 2
+    assert len(signatures) == 2
+
+
+def test_missing_signatures_are_remembered():
+    signatures = KnownSignatures()
+    calls = []
+    factory = make_counting_factory(calls)
+
+    for _ in range(3):
+        with pytest.raises(SignatureNotFoundError, match=match('For some functions, it is not possible to extract the signature, and this is one of them.')):
+            signatures.get(__build_class__, factory)
+
+    assert calls == [__build_class__]
+
+
+def test_python_callables_are_passed_to_factory():
+    signatures = KnownSignatures()
+    calls = []
+    factory = make_counting_factory(calls)
+
+    class SomeClass:
+        def __init__(self, a): ...
+
+    for some_callable in (SomeClass, SomeClass, lambda a: None):  # noqa: ARG005
+        assert signatures.get(some_callable, factory) == parse_signature('(a)')
+
+    assert len(calls) == 3
+    assert len(signatures) == 0
+
+
+def test_register_and_unregister():
+    signatures = KnownSignatures()
+    calls = []
+    factory = make_counting_factory(calls)
+
+    signatures.register(__build_class__, '(function, name, /, *bases, **kwargs)')
+    assert signatures.get(__build_class__, factory) == parse_signature('(function, name, /, *bases, **kwargs)')
+
+    signatures.register(len, '(object)')
+    assert signatures.get(len, factory) == parse_signature('(object)')
+
+    signatures.unregister(len)
+    assert signatures.get(len, factory) == parse_signature('(obj, /)')
+
+    signatures.unregister(next)
+    with pytest.raises(SignatureNotFoundError):
+        signatures.get(next, factory)
+
+    assert calls == [len, next]
+
+
+def test_register_in_global_table():
+    try:
+        known_signatures.register(__build_class__, '(function, name, /, *bases, **kwargs)')
+        assert PossibleCallMatcher('.., metaclass').match(__build_class__)
+    finally:
+        known_signatures.unregister(__build_class__)
+
+    assert not PossibleCallMatcher('.., metaclass').match(__build_class__)
+
+
+def test_register_python_function():
+    def function(a): ...
+
+    with pytest.raises(TypeError, match=match(f'Only built-in and C-extension callables can be registered, and {function!r} is not one of them.')):
+        KnownSignatures().register(function, '(a)')
+
+
+@pytest.mark.parametrize(
+    'signature',
+    [
+        'a, b',
+        '',
+        '(a): ...\ndef other_function(b)',
+        '(a, b=)',
+    ],
+)
+def test_register_wrong_signature(signature):
+    with pytest.raises(ValueError, match=match(f'The signature must be written as the parameters of a function definition, for example "(a, /, b=None, *args, c, **kwargs)". You used "{signature}".')):
+        KnownSignatures().register(len, signature)
+
+
+def test_parse_signature():
+    baskets = parse_signature('(a, b=1, /, c=2, *args, d, e=3, **kwargs)')
+
+    assert baskets.only_posititional == ('a', 'b')
+    assert baskets.named_or_positional == ('c',)
+    assert baskets.only_named == ('d', 'e')
+    assert baskets.with_defaults == ('b', 'c', 'e')
+    assert baskets.is_args
+    assert baskets.is_kwargs
+
+
+def test_eviction_and_clear():
+    signatures = KnownSignatures(maxsize=2)
+    calls = []
+    factory = make_counting_factory(calls)
+
+    signatures.get(len, factory)
+    signatures.get(abs, factory)
+    signatures.get(len, factory)
+    signatures.get(hash, factory)
+
+    assert len(signatures) == 2
+
+    signatures.get(len, factory)
+    signatures.get(abs, factory)
+
+    assert calls == [len, abs, hash, abs]
+
+    signatures.clear()
+
+    assert len(signatures) == 0
@@ -0,0 +1,49 @@
+import pytest
+from full_match import match
+
+from sigmatch import CallableRegistry, PossibleCallMatcher, SignatureNotFoundError
+from tests.small_signatures import make_all_small_functions, make_all_small_matchers
+
+
+def test_find_is_the_same_as_matching_each_function():
+    functions = list(make_all_small_functions())[::3]
+    registry = CallableRegistry(functions)
+
+    for matcher in make_all_small_matchers():
+        assert registry.find(matcher) == [function for function in functions if matcher.match(function)], matcher
+
+
+def test_register_as_decorator():
+    registry = CallableRegistry()
+
+    @registry.register
+    def first(a, b=None): ...
+
+    @registry.register
+    def second(*, a, b): ...
+
+    @registry.register
+    def third(a, *args, c=None, **kwargs): ...
+
+    assert len(registry) == 3
+    assert list(registry) == [first, second, third]
+
+    assert registry.find(PossibleCallMatcher('.')) == [first, third]
+    assert registry.find(PossibleCallMatcher('..')) == [first, third]
+    assert registry.find(PossibleCallMatcher('...')) == [third]
+    assert registry.find(PossibleCallMatcher('a, b')) == [first, second, third]
+    assert registry.find(PossibleCallMatcher('., b')) == [first, third]
+    assert registry.find(PossibleCallMatcher('., c')) == [third]
+    assert registry.find(PossibleCallMatcher('., d')) == [third]
+    assert registry.find(PossibleCallMatcher('., *, **')) == [third]
+    assert registry.find(PossibleCallMatcher()) == []
+
+
+def test_empty_registry():
+    assert CallableRegistry().find(PossibleCallMatcher('.')) == []
+    assert len(CallableRegistry()) == 0
+
+
+def test_register_callable_without_signature():
+    with pytest.raises(SignatureNotFoundError, match=match('For some functions, it is not possible to extract the signature, and this is one of them.')):
+        CallableRegistry().register(__build_class__)
@@ -0,0 +1,134 @@
+import pytest
+from full_match import match
+
+from sigmatch import (
+    PossibleCallMatcher,
+    SignatureNotFoundError,
+    get_fingerprint,
+    group_by_call_set,
+    is_equivalent,
+    is_substitutable,
+    overlaps,
+)
+from sigmatch.call_set import CallSetLayout
+from sigmatch.static import extract_signatures
+from tests.small_signatures import make_all_small_functions
+
+TINY_FUNCTIONS = list(make_all_small_functions('ab'))
+SMALL_FUNCTIONS = list(make_all_small_functions())[::11]
+
+
+def test_relations_are_the_same_as_for_series():
+    all_series = [PossibleCallMatcher.from_callable(function) for function in TINY_FUNCTIONS]
+    all_sets = [set(series) for series in all_series]
+
+    for function, calls in zip(TINY_FUNCTIONS[::2], all_sets[::2]):
+        for other_function, other_calls in zip(TINY_FUNCTIONS, all_sets):
+            assert is_substitutable(function, other_function) == (calls <= other_calls)
+            assert is_equivalent(function, other_function) == (calls == other_calls)
+            assert overlaps(function, other_function) == bool(calls & other_calls)
+
+    for function, series in zip(TINY_FUNCTIONS[::5], all_series[::5]):
+        for other_function, other_series in zip(TINY_FUNCTIONS[::7], all_series[::7]):
+            assert is_substitutable(function, other_function) == (series in other_series)
+            assert is_equivalent(function, other_function) == (series == other_series)
+            assert overlaps(function, other_function) == bool(series & other_series)
+
+
+def test_overlaps_of_layouts_is_the_same_as_intersection_of_calls():
+    calls = {function: set(PossibleCallMatcher.iter_possible_calls(function)) for function in SMALL_FUNCTIONS}
+
+    for function in SMALL_FUNCTIONS:
+        for other_function in SMALL_FUNCTIONS:
+            layout = CallSetLayout.from_baskets(PossibleCallMatcher._get_baskets(function))
+            other_layout = CallSetLayout.from_baskets(PossibleCallMatcher._get_baskets(other_function))
+
+            assert layout.overlaps(other_layout) == bool(calls[function] & calls[other_function])
+
+
+def test_simple_relations():
+    def function(a, b): ...
+    def function_with_default(a, b, c=None): ...
+    def same_function(b, a): ...
+    def keyword_only_function(*, a, b): ...
+    def other_function(a, b, d=None): ...
+
+    assert is_substitutable(function, function_with_default)
+    assert not is_substitutable(function_with_default, function)
+    assert is_substitutable(function, same_function)
+    assert not is_substitutable(function, keyword_only_function)
+
+    assert is_equivalent(function, same_function)
+    assert not is_equivalent(function, function_with_default)
+
+    assert overlaps(function_with_default, other_function)
+    assert overlaps(function, keyword_only_function)
+    assert not overlaps(keyword_only_function, lambda a, b, /: None)  # noqa: ARG005
+
+
+def test_relations_when_signature_is_not_found():
+    def function(a, b): ...
+
+    assert is_substitutable(__build_class__, function)
+    assert not is_substitutable(function, __build_class__)
+    assert is_equivalent(__build_class__, __build_class__)
+    assert not is_equivalent(__build_class__, function)
+    assert not overlaps(__build_class__, function)
+    assert not overlaps(__build_class__, __build_class__)
+
+    for relation in (is_substitutable, is_equivalent, overlaps):
+        with pytest.raises(SignatureNotFoundError, match=match('For some functions, it is not possible to extract the signature, and this is one of them.')):
+            relation(function, __build_class__, raise_exception=True)
+
+
+def test_fingerprints_are_equal_exactly_for_equal_series():
+    functions = list(make_all_small_functions())
+    groups = {}
+    for function in functions:
+        groups.setdefault(PossibleCallMatcher.from_callable(function), set()).add(get_fingerprint(function))
+
+    assert all(len(fingerprints) == 1 for fingerprints in groups.values())
+    assert len(set.union(*groups.values())) == len(groups)
+
+
+def test_fingerprint_format():
+    assert get_fingerprint(lambda: None) == '0;;;;;'
+    assert get_fingerprint(lambda x, /, b, a, c=None, *args, e, d=None, **kwargs: None) == '1;a,b;c;e;d;***'  # noqa: ARG005
+    assert get_fingerprint(lambda *args: None) == '0;;;;;*'  # noqa: ARG005
+    assert get_fingerprint(lambda **kwargs: None) == '0;;;;;**'  # noqa: ARG005
+    assert get_fingerprint(extract_signatures('def function(b, a): ...')['function']) == '0;a,b;;;;'
+
+
+def test_fingerprint_when_signature_is_not_found():
+    assert get_fingerprint(__build_class__) is None
+
+    with pytest.raises(SignatureNotFoundError, match=match('For some functions, it is not possible to extract the signature, and this is one of them.')):
+        get_fingerprint(__build_class__, raise_exception=True)
+
+
+def test_group_by_call_set():
+    def function(a, b): ...
+    def same_function(b, a): ...
+    def function_with_default(a, b, c=None): ...
+    def keyword_only_function(*, a, b): ...
+    def other_keyword_only_function(*, b, a): ...
+
+    assert group_by_call_set([]) == []
+    assert group_by_call_set([function, function_with_default, keyword_only_function, same_function, __build_class__, other_keyword_only_function, next, function]) == [
+        [function, same_function, function],
+        [function_with_default],
+        [keyword_only_function, other_keyword_only_function],
+        [__build_class__],
+        [next],
+    ]
+
+    with pytest.raises(SignatureNotFoundError, match=match('For some functions, it is not possible to extract the signature, and this is one of them.')):
+        group_by_call_set([function, __build_class__], raise_exception=True)
+
+
+def test_groups_are_the_same_as_for_series():
+    groups = {}
+    for function in TINY_FUNCTIONS:
+        groups.setdefault(PossibleCallMatcher.from_callable(function), []).append(function)
+
+    assert group_by_call_set(TINY_FUNCTIONS) == list(groups.values())
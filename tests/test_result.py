@@ -0,0 +1,80 @@
+import pytest
+
+from sigmatch import CheckResult, PossibleCallMatcher, Reason, SignatureSeriesMatcher
+from tests.small_signatures import make_all_small_functions, make_all_small_matchers
+
+
+def test_check_is_the_same_as_match():
+    matchers = list(make_all_small_matchers())[::3]
+    series = SignatureSeriesMatcher(*matchers[::7])
+
+    for function in list(make_all_small_functions())[::5]:
+        for matcher in (*matchers, series):
+            result = matcher.check(function)
+
+            assert result.matched == matcher.match(function)
+            assert bool(result) == result.matched
+            assert (result.reason is Reason.MATCHED) == result.matched
+            assert result.explanation
+
+
+@pytest.mark.parametrize(
+    ('matcher', 'function', 'reason', 'explanation'),
+    [
+        (PossibleCallMatcher('.'), lambda a, b: None, Reason.TOO_FEW_POSITIONAL_ARGUMENTS, 'The call passes 1 positional argument, and the required parameter "b" is left without a value.'),  # noqa: ARG005
+        (PossibleCallMatcher('., c'), lambda a, b, c=None: None, Reason.TOO_FEW_POSITIONAL_ARGUMENTS, 'The call passes 1 positional argument, and the required parameter "b" is left without a value.'),  # noqa: ARG005
+        (PossibleCallMatcher('...'), lambda a, b: None, Reason.TOO_MANY_POSITIONAL_ARGUMENTS, 'The call passes 3 positional arguments, but the callable can take only 2 of them by position.'),  # noqa: ARG005
+        (PossibleCallMatcher('.., b'), lambda a, b, c=None: None, Reason.ARGUMENT_PASSED_TWICE, 'The parameter "b" gets a value by position, and the call passes it by name as well.'),  # noqa: ARG005
+        (PossibleCallMatcher('..., c'), lambda a, b, c=None: None, Reason.TOO_MANY_POSITIONAL_ARGUMENTS, 'The call passes 3 positional arguments, but the callable can take only 2 of them by position.'),  # noqa: ARG005
+        (PossibleCallMatcher('c'), lambda c, /: None, Reason.TOO_FEW_POSITIONAL_ARGUMENTS, 'The call passes 0 positional arguments, and the required parameter "c" is left without a value.'),  # noqa: ARG005
+        (PossibleCallMatcher('., *'), lambda a: None, Reason.UNEXPECTED_ARGS_UNPACKING, 'The call unpacks an iterable with "*", but the callable has no *args parameter.'),  # noqa: ARG005
+        (PossibleCallMatcher('., **'), lambda a: None, Reason.UNEXPECTED_KWARGS_UNPACKING, 'The call unpacks a mapping with "**", but the callable has no **kwargs parameter.'),  # noqa: ARG005
+        (PossibleCallMatcher('.., a'), lambda a, b, c=None, d=None: None, Reason.ARGUMENT_PASSED_TWICE, 'The parameter "a" gets a value by position, and the call passes it by name as well.'),  # noqa: ARG005
+        (PossibleCallMatcher('., x'), lambda a: None, Reason.UNEXPECTED_NAMED_ARGUMENT, 'The callable has no parameter "x".'),  # noqa: ARG005
+        (PossibleCallMatcher('b'), lambda a=None, /, b=None: None, Reason.MATCHED, "The callable accepts the call PossibleCallMatcher('b')."),  # noqa: ARG005
+        (PossibleCallMatcher('a'), lambda a=None, /: None, Reason.UNEXPECTED_NAMED_ARGUMENT, 'The parameter "a" is positional-only, so it cannot be passed by name.'),  # noqa: ARG005
+        (PossibleCallMatcher('.'), lambda a, *, c, b: None, Reason.MISSING_KEYWORD_ONLY_ARGUMENT, 'The keyword-only parameter "b" is required, but the call does not pass it.'),  # noqa: ARG005
+        (PossibleCallMatcher('.'), lambda a: None, Reason.MATCHED, "The callable accepts the call PossibleCallMatcher('.')."),  # noqa: ARG005
+        (PossibleCallMatcher('.'), 1, Reason.NOT_CALLABLE, 'It is impossible to determine the signature of an object that is not being callable.'),
+        (PossibleCallMatcher('.'), __build_class__, Reason.SIGNATURE_NOT_FOUND, 'For some functions, it is not possible to extract the signature, and this is one of them.'),
+        (SignatureSeriesMatcher(), lambda: None, Reason.EMPTY_SERIES, 'The series does not contain any expected calls.'),
+        (PossibleCallMatcher('.') + PossibleCallMatcher('..'), lambda a, b: None, Reason.MATCHED, "The callable accepts the call PossibleCallMatcher('..')."),  # noqa: ARG005
+        (
+            PossibleCallMatcher('.') + PossibleCallMatcher('x') + PossibleCallMatcher('...'),
+            lambda a, b: None,  # noqa: ARG005
+            Reason.NO_MATCHING_CALL,
+            (
+                'None of the expected calls is accepted by the callable:\n'
+                "- PossibleCallMatcher('.'): The call passes 1 positional argument, and the required parameter \"b\" is left without a value.\n"
+                "- PossibleCallMatcher('...'): The call passes 3 positional arguments, but the callable can take only 2 of them by position.\n"
+                "- PossibleCallMatcher('x'): The call passes 0 positional arguments, and the required parameter \"a\" is left without a value."
+            ),
+        ),
+    ],
+)
+def test_reasons_and_explanations(matcher, function, reason, explanation):
+    result = matcher.check(function)
+
+    assert result.reason is reason
+    assert result.matched == (reason is Reason.MATCHED)
+    assert result.explanation == explanation
+
+
+def test_matched_result_knows_the_matcher():
+    first = PossibleCallMatcher('.')
+    second = PossibleCallMatcher('..')
+
+    assert (first + second).check(lambda a, b=None: None).matcher is first  # noqa: ARG005
+    assert (first + second).check(lambda a, b: None).matcher is second  # noqa: ARG005
+    assert first.check(lambda a, b: None).matcher is first  # noqa: ARG005
+
+
+def test_explanation_is_built_once():
+    result = PossibleCallMatcher('...').check(lambda a, b: None)  # noqa: ARG005
+
+    assert result.explanation is result.explanation
+
+
+def test_repr():
+    assert repr(PossibleCallMatcher('.').check(lambda a: None)) == 'CheckResult(matched=True, reason=Reason.MATCHED)'  # noqa: ARG005
+    assert repr(CheckResult(Reason.NOT_CALLABLE, PossibleCallMatcher())) == 'CheckResult(matched=False, reason=Reason.NOT_CALLABLE)'
@@ -0,0 +1,58 @@
+from itertools import chain, combinations
+
+from sigmatch import CallShape, PossibleCallMatcher, SignatureSeriesMatcher
+from tests.small_signatures import make_all_small_matchers
+
+
+def test_from_call():
+    assert CallShape.from_call((), {}) == CallShape(0, frozenset())
+    assert CallShape.from_call((1, 2), {'a': 3, 'b': 4}) == CallShape(2, frozenset({'a', 'b'}))
+    assert CallShape.from_call([1], {}) == CallShape(1, frozenset())
+    assert {CallShape.from_call((1,), {'a': 1}): 'kek'}[CallShape(1, frozenset({'a'}))] == 'kek'
+
+
+def test_series_fits_shape_is_the_same_as_checking_each_member():
+    shapes = [CallShape(number, frozenset(names)) for number in range(6) for names in chain.from_iterable(combinations('abcde', size) for size in range(4))]
+    all_matchers = list(make_all_small_matchers())
+
+    for series in (SignatureSeriesMatcher(*all_matchers), SignatureSeriesMatcher(*all_matchers[::7]), SignatureSeriesMatcher(*(matcher for matcher in all_matchers if not matcher.is_args))):
+        for shape in shapes:
+            assert series.fits_shape(shape) == any(matcher.fits_shape(shape) for matcher in series), (series, shape)
+
+
+def test_exact_expectation_fits_only_its_own_shape():
+    for matcher in make_all_small_matchers():
+        if not matcher.is_args and not matcher.is_kwargs:
+            assert matcher.fits_shape(CallShape(matcher.number_of_position_args, matcher.names_of_named_args_set))
+            assert not matcher.fits_shape(CallShape(matcher.number_of_position_args + 1, matcher.names_of_named_args_set))
+            assert not matcher.fits_shape(CallShape(matcher.number_of_position_args, matcher.names_of_named_args_set | {'x'}))
+
+
+def test_unpacking_in_expectation_means_any_number_of_additional_arguments():
+    assert PossibleCallMatcher('., a, *').fits_shape(CallShape(1, frozenset({'a'})))
+    assert PossibleCallMatcher('., a, *').fits_shape(CallShape(5, frozenset({'a'})))
+    assert not PossibleCallMatcher('., a, *').fits_shape(CallShape(0, frozenset({'a'})))
+    assert not PossibleCallMatcher('., a, *').fits_shape(CallShape(1, frozenset({'a', 'b'})))
+
+    assert PossibleCallMatcher('., a, **').fits_shape(CallShape(1, frozenset({'a'})))
+    assert PossibleCallMatcher('., a, **').fits_shape(CallShape(1, frozenset({'a', 'b', 'c'})))
+    assert not PossibleCallMatcher('., a, **').fits_shape(CallShape(1, frozenset({'b'})))
+    assert not PossibleCallMatcher('., a, **').fits_shape(CallShape(2, frozenset({'a'})))
+
+    assert PossibleCallMatcher('*, **').fits_shape(CallShape(3, frozenset({'x'})))
+
+
+def test_fits():
+    assert PossibleCallMatcher('., a').fits((1,), {'a': 2})
+    assert not PossibleCallMatcher('., a').fits((1, 2), {})
+    assert not PossibleCallMatcher('., a').fits((1,), {'a': 2, 'b': 3})
+    assert PossibleCallMatcher().fits((), {})
+
+    series = PossibleCallMatcher('..') + PossibleCallMatcher('., a') + PossibleCallMatcher('b, **')
+
+    assert series.fits((1, 2), {})
+    assert series.fits((1,), {'a': 2})
+    assert series.fits((), {'b': 1, 'c': 2})
+    assert not series.fits((1, 2, 3), {})
+    assert not series.fits((), {'c': 2})
+    assert not SignatureSeriesMatcher().fits((), {})
@@ -0,0 +1,183 @@
+from inspect import Signature, signature
+from types import MethodType
+
+import pytest
+from full_match import match
+
+from sigmatch import (
+    CallSet,
+    PossibleCallMatcher,
+    Reason,
+    SignatureSeriesMatcher,
+    is_equivalent,
+)
+from sigmatch.errors import SignatureMismatchError
+from sigmatch.known_signatures import parse_signature
+from sigmatch.static import (
+    StaticSignature,
+    extract_signatures,
+    extract_signatures_from_file,
+)
+from tests.small_signatures import make_all_small_functions
+
+
+def get_baskets_by_inspect(function):
+    return PossibleCallMatcher._convert_parameters_to_baskets(list(signature(function).parameters.values()))
+
+
+def test_extracted_baskets_are_the_same_as_inspect():
+    for function in make_all_small_functions():
+        parameters = str(Signature(list(function.__signature__.parameters.values())))
+        namespace = {}
+        source = f'def function{parameters}: ...\nclass Class:\n    def method{parameters}: ...\n'
+        exec(source, namespace)
+        signatures = extract_signatures(source)
+
+        assert signatures['function'].baskets == get_baskets_by_inspect(namespace['function'])
+        assert signatures['Class.method'].baskets == get_baskets_by_inspect(namespace['Class'].method)
+
+        try:
+            expected = get_baskets_by_inspect(MethodType(namespace['function'], object()))
+        except ValueError:
+            with pytest.raises(ValueError, match=match('The method Class.method cannot be bound, because it does not accept any positional arguments.')):
+                signatures['Class.method'].bind()
+        else:
+            assert signatures['Class.method'].bind().baskets == expected
+
+
+def test_extract_module_level_functions():
+    signatures = extract_signatures('def a(x, y=1): ...\nasync def b(*args, z, **kwargs): ...\nx = 1\nif x:\n    def c(): ...\n', module='package.module')
+
+    assert list(signatures) == ['package.module:a', 'package.module:b']
+    assert signatures['package.module:a'] == StaticSignature(
+        qualified_name='package.module:a',
+        baskets=parse_signature('(x, y=1)'),
+        line=1,
+    )
+    assert signatures['package.module:b'] == StaticSignature(
+        qualified_name='package.module:b',
+        baskets=parse_signature('(*args, z, **kwargs)'),
+        line=2,
+    )
+
+
+def test_extract_methods():
+    source = '''
+class Class:
+    def method(self, a, b=None): ...
+
+    @staticmethod
+    def static_method(a): ...
+
+    @classmethod
+    def class_method(cls, a, *, b): ...
+
+    @classmethod
+    def broken_class_method(): ...
+
+    @property
+    def property(self): ...
+
+    class Nested:
+        @some.decorator(1)
+        def method(self): ...
+'''
+    signatures = extract_signatures(source)
+
+    assert list(signatures) == ['Class.method', 'Class.static_method', 'Class.class_method', 'Class.property', 'Class.Nested.method']
+
+    assert signatures['Class.method'].is_method
+    assert not signatures['Class.method'].is_decorated
+    assert signatures['Class.method'].baskets == parse_signature('(self, a, b=None)')
+    assert signatures['Class.method'].bind().baskets == parse_signature('(a, b=None)')
+    assert signatures['Class.method'].line == 3
+
+    assert not signatures['Class.static_method'].is_method
+    assert not signatures['Class.static_method'].is_decorated
+    assert signatures['Class.static_method'].baskets == parse_signature('(a)')
+
+    assert not signatures['Class.class_method'].is_method
+    assert not signatures['Class.class_method'].is_decorated
+    assert signatures['Class.class_method'].baskets == parse_signature('(a, *, b)')
+
+    assert signatures['Class.property'].is_method
+    assert signatures['Class.property'].is_decorated
+
+    assert signatures['Class.Nested.method'].is_method
+    assert signatures['Class.Nested.method'].is_decorated
+
+
+def test_bind_method_with_only_args():
+    method = extract_signatures('class Class:\n    def method(*args, a): ...\n')['Class.method']
+    bound = method.bind()
+
+    assert bound.baskets == method.baskets
+    assert not bound.is_method
+
+
+def test_bind_method_with_positional_only_parameters():
+    method = extract_signatures('class Class:\n    def method(self, a=1, /, b=2): ...\n')['Class.method']
+
+    assert method.bind().baskets == parse_signature('(a=1, /, b=2)')
+
+
+def test_extract_signatures_with_syntax_error():
+    with pytest.raises(SyntaxError):
+        extract_signatures('def function(: ...', filename='broken.py')
+
+
+def test_extract_signatures_from_file(tmp_path):
+    path = tmp_path / 'module.py'
+    path.write_text('def function(a, b): ...\n')
+
+    assert list(extract_signatures_from_file(path)) == ['module:function']
+    assert list(extract_signatures_from_file(str(path), module='package.module')) == ['package.module:function']
+    assert list(extract_signatures_from_file(path, module='')) == ['function']
+
+
+def test_match_static_signatures():
+    signatures = extract_signatures('def function(a, b=None, *, c): ...\nclass Class:\n    def method(self, a): ...\n')
+    function = signatures['function']
+
+    assert PossibleCallMatcher('.', 'c').match(function)
+    assert PossibleCallMatcher('.', '.', 'c').match(function)
+    assert not PossibleCallMatcher('.').match(function)
+    assert PossibleCallMatcher('.', '.').match(signatures['Class.method'])
+    assert PossibleCallMatcher('.').match(signatures['Class.method'].bind())
+
+    with pytest.raises(SignatureMismatchError, match=match('The signature of the callable object does not match the expected one.')):
+        PossibleCallMatcher('.').match(function, raise_exception=True)
+
+
+def test_check_static_signatures():
+    function = extract_signatures('def function(a, *, c): ...\n')['function']
+
+    assert PossibleCallMatcher('.', 'c').check(function)
+    assert PossibleCallMatcher('.', '.', 'c').check(function).reason is Reason.TOO_MANY_POSITIONAL_ARGUMENTS
+    assert SignatureSeriesMatcher(PossibleCallMatcher('a', 'c')).check(function)
+
+
+def test_from_callable_with_static_signatures():
+    def function(a, b=None, *, c): ...
+
+    descriptor = extract_signatures('def function(a, b=None, *, c): ...\n')['function']
+
+    assert PossibleCallMatcher.from_callable(descriptor) == PossibleCallMatcher.from_callable(function)
+    assert list(PossibleCallMatcher.iter_possible_calls(descriptor)) == list(PossibleCallMatcher.iter_possible_calls(function))
+    assert CallSet.from_callable(descriptor) == CallSet.from_callable(function)
+    assert is_equivalent(descriptor, function)
+
+
+def test_series_matching_with_static_signatures():
+    function = extract_signatures('def function(a, b=None): ...\n')['function']
+    series = SignatureSeriesMatcher(PossibleCallMatcher('.'), PossibleCallMatcher('a', 'b'), PossibleCallMatcher('.', '.', '.'))
+
+    assert series.matching(function) == SignatureSeriesMatcher(PossibleCallMatcher('.'), PossibleCallMatcher('a', 'b'))
+    assert series.match(function)
+    assert not SignatureSeriesMatcher(PossibleCallMatcher('.', '.', '.')).match(function)
+
+
+def test_static_signatures_are_not_cached():
+    function = extract_signatures('def function(a): ...\n')['function']
+
+    assert PossibleCallMatcher._get_baskets(function) is function.baskets
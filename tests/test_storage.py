@@ -0,0 +1,161 @@
+import gzip
+import json
+import os
+import stat
+
+import pytest
+from full_match import match
+
+from sigmatch import (
+    IncorrectArgumentsOrderError,
+    PossibleCallMatcher,
+    SignatureSeriesMatcher,
+)
+from sigmatch.storage import dump_matcher, dumps, load, load_matcher, loads, save
+from tests.small_signatures import make_all_small_functions
+
+
+def make_series_by_names():
+    return {f'tests.small_signatures:function_{index}': PossibleCallMatcher.from_callable(function) for index, function in enumerate(make_all_small_functions('ab'))}
+
+
+def test_dumps_and_loads():
+    series = make_series_by_names()
+
+    assert loads(dumps(series)) == series
+    assert loads(dumps(series).encode('utf-8')) == series
+    assert loads(dumps({})) == {}
+
+
+def test_single_matchers_are_loaded_as_series():
+    loaded = loads(dumps({'first': PossibleCallMatcher('.., c'), 'second': PossibleCallMatcher()}))
+
+    assert loaded == {'first': SignatureSeriesMatcher(PossibleCallMatcher('.., c')), 'second': SignatureSeriesMatcher(PossibleCallMatcher())}
+    assert all(isinstance(series, SignatureSeriesMatcher) for series in loaded.values())
+
+
+def test_loaded_matchers_are_interned():
+    loaded = loads(dumps({'name': PossibleCallMatcher('.., c') + PossibleCallMatcher('*')}))
+
+    assert loaded['name'].matchers[0] is PossibleCallMatcher('*')
+    assert loaded['name'].matchers[1] is PossibleCallMatcher('.., c')
+
+
+def test_format():
+    assert json.loads(dumps({'name': PossibleCallMatcher('.., c') + PossibleCallMatcher('a, *, **')})) == {
+        'format': 'sigmatch',
+        'version': 1,
+        'series': {'name': ['.., c', 'a, *, **']},
+    }
+    assert dump_matcher(PossibleCallMatcher()) == ['']
+    assert load_matcher(['']) == SignatureSeriesMatcher(PossibleCallMatcher())
+
+    with pytest.raises(TypeError, match=match('Only strings can be used as symbolic representation of function parameters. You used "1" (int).')):
+        load_matcher([1])
+
+
+@pytest.mark.parametrize(
+    'file_name',
+    [
+        'series.json',
+        'series.json.gz',
+    ],
+)
+def test_save_and_load(tmp_path, file_name):
+    path = tmp_path / file_name
+    series = make_series_by_names()
+
+    save(series, path)
+    save(series, str(path))
+
+    assert load(path) == series
+    assert load(str(path)) == series
+    assert [item.name for item in tmp_path.iterdir()] == [file_name]
+
+
+def test_saved_file_has_default_permissions(tmp_path):
+    path = tmp_path / 'series.json'
+    umask = os.umask(0o027)
+
+    try:
+        save(make_series_by_names(), path)
+    finally:
+        os.umask(umask)
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+
+def test_temporary_file_is_removed_when_saving_fails(tmp_path):
+    path = tmp_path / 'series.json'
+    path.mkdir()
+    (path / 'file').write_text('')
+
+    with pytest.raises(IsADirectoryError):
+        save(make_series_by_names(), path)
+
+    assert [item.name for item in tmp_path.iterdir()] == ['series.json']
+
+
+def test_compressed_file_is_compressed(tmp_path):
+    series = make_series_by_names()
+
+    save(series, tmp_path / 'series.json')
+    save(series, tmp_path / 'series.json.gz')
+
+    assert gzip.decompress((tmp_path / 'series.json.gz').read_bytes()) == (tmp_path / 'series.json').read_bytes()
+    assert (tmp_path / 'series.json.gz').stat().st_size < (tmp_path / 'series.json').stat().st_size
+
+
+def test_dump_not_matcher():
+    with pytest.raises(TypeError, match=match('Only matchers can be serialized. You used "kek" (str).')):
+        dumps({'name': 'kek'})
+
+
+@pytest.mark.parametrize(
+    ('text', 'message'),
+    [
+        ('{', 'The data is not a valid JSON document.'),
+        ('[]', 'The data does not contain serialized sigmatch matchers.'),
+        ('{"format": "other"}', 'The data does not contain serialized sigmatch matchers.'),
+        ('{"format": "sigmatch", "version": 100, "series": {}}', 'The data has version 100, but version 1 is expected.'),
+        ('{"format": "sigmatch", "version": 1, "series": {"name": ".."}}', 'A serialized series must be a list of signatures. You used ".." (str).'),
+        ('{"format": "sigmatch", "version": 1}', 'The serialized series must be stored in a dictionary. You used "None" (NoneType).'),
+        ('{"format": "sigmatch", "version": 1, "series": []}', 'The serialized series must be stored in a dictionary. You used "[]" (list).'),
+        ('{"format": "sigmatch", "version": 1, "series": {"name": [".", 1]}}', 'A serialized signature must be a string. You used "1" (int).'),
+        ('{"format": "sigmatch", "version": 1, "series": {"name": [null]}}', 'A serialized signature must be a string. You used "None" (NoneType).'),
+    ],
+)
+def test_loads_wrong_data(text, message):
+    with pytest.raises(ValueError, match=match(message)):
+        loads(text)
+
+
+@pytest.mark.parametrize(
+    ('signature', 'exception_type', 'message'),
+    [
+        ('a, .', IncorrectArgumentsOrderError, 'Positional arguments must be specified first.'),
+        ('b, a', None, None),
+        ('a, a', IncorrectArgumentsOrderError, 'The same argument name cannot occur twice. You have a repeat of "a".'),
+        ('., 1', ValueError, 'Only strings of a certain format can be used as symbols for function arguments: arbitrary variable names, and ".", "*", "**" strings. You used "1".'),
+        ('.,.,a', None, None),
+        ('**, *', IncorrectArgumentsOrderError, 'Unpacking positional arguments should go before unpacking keyword arguments.'),
+    ],
+)
+def test_wrong_signatures_are_checked_when_series_is_loaded(signature, exception_type, message):
+    loaded = loads(json.dumps({'format': 'sigmatch', 'version': 1, 'series': {'name': [signature]}}))
+
+    if exception_type is None:
+        assert loaded['name'] == SignatureSeriesMatcher(PossibleCallMatcher(signature))
+    else:
+        with pytest.raises(exception_type, match=match(message)):
+            loaded['name']
+
+
+def test_series_are_loaded_lazily():
+    loaded = loads(dumps(make_series_by_names()))
+
+    assert loaded._loaded == {}
+    assert loaded['tests.small_signatures:function_0'] is loaded['tests.small_signatures:function_0']
+    assert list(loaded._loaded) == ['tests.small_signatures:function_0']
+    assert len(loaded) == len(make_series_by_names())
+    assert dict(loaded) == make_series_by_names()